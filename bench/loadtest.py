@@ -0,0 +1,224 @@
+"""Offline load test against the local mock platforms.
+
+Starts bench/mock_server.py, points every platform at it and runs a
+generated username list through the chosen engine, then prints one JSON
+line with throughput, per-request latency percentiles, CPU time and peak
+memory. Nothing leaves the machine, so runs are repeatable.
+
+    python bench/loadtest.py --engine threads --concurrency 16 --usernames 500
+    python bench/loadtest.py --engine async --concurrency 100 --mix found=60,missing=30,slow=10
+"""
+import argparse, json, logging, os, random, resource, socket, subprocess, sys, threading, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from modules.logging import setup_logging
+from modules.metrics import PHASES
+from modules.platforms import select_platforms, use_base_url
+from modules.render import Renderer
+from modules.ratelimit import RateLimiter
+from modules.socmed import SOCMED
+from modules.transport import open_session
+
+KINDS = ('found', 'missing', 'throttle', 'slow')
+
+def parse_mix(value):
+    """Parse 'found=70,missing=20,...' into a {kind: weight} dict"""
+    mix = {}
+    for part in value.split(','):
+        kind, _, weight = part.partition('=')
+        kind = kind.strip()
+        if kind not in KINDS:
+            raise argparse.ArgumentTypeError(f"Unknown kind '{kind}', choose from {', '.join(KINDS)}")
+        try:
+            mix[kind] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight for '{kind}': {weight}")
+    if not sum(mix.values()) > 0:
+        raise argparse.ArgumentTypeError("Mix weights must add up to more than zero")
+    return mix
+
+def make_usernames(count, mix, seed=0):
+    rng = random.Random(seed)
+    kinds, weights = zip(*mix.items())
+    return [f"{rng.choices(kinds, weights)[0]}_user{i}" for i in range(count)]
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(port, page_kb, slow_ms, tail_pct):
+    command = [sys.executable, os.path.join(ROOT, 'bench', 'mock_server.py'),
+               '--port', str(port), '--page-kb', str(page_kb), '--slow-ms', str(slow_ms), '--retry-after', '0',
+               '--tail-pct', str(tail_pct)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    server.stdout.readline()  # Wait for the "listening" line
+    return server
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+class Recorder:
+    """Collects per-request latencies and result arrival times from either engine"""
+
+    def __init__(self):
+        self.latencies = []
+        self.answers = []
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def latency(self, seconds):
+        with self.lock:
+            self.latencies.append(seconds * 1000)
+
+    def answer(self):
+        with self.lock:
+            self.answers.append(time.perf_counter() - self.started)
+
+def instrument(engine, recorder):
+    """Wrap the engine's fetch, retries included, so every lookup is timed"""
+    fetch = engine._fetch
+    if isinstance(engine, SOCMED):
+        def timed_fetch(*args):
+            started = time.perf_counter()
+            try:
+                return fetch(*args)
+            finally:
+                recorder.latency(time.perf_counter() - started)
+    else:
+        async def timed_fetch(*args):
+            started = time.perf_counter()
+            try:
+                return await fetch(*args)
+            finally:
+                recorder.latency(time.perf_counter() - started)
+    engine._fetch = timed_fetch
+
+    socmed = engine if isinstance(engine, SOCMED) else engine.socmed
+    emit = socmed._emit
+    def recorded_emit(*args):
+        recorder.answer()
+        return emit(*args)
+    socmed._emit = recorded_emit
+
+def run(args):
+    port = args.port or free_port()
+    server = start_server(port, args.page_kb, args.slow_ms, args.tail_pct)
+    try:
+        use_base_url(f"http://127.0.0.1:{port}")
+        logger = setup_logging("LOADTEST", plain=True)
+        logger.setLevel(logging.CRITICAL)
+
+        socmed = SOCMED(logger)
+        socmed.platforms = select_platforms(args.platforms)
+        socmed.renderer = Renderer('silent')
+        socmed.threads = args.concurrency
+        socmed.limiter = RateLimiter(default_rps=1e6, retries=args.retries, backoff_base=0.01)
+        socmed.session = open_session(pool_size=args.concurrency, keep_alive=not args.no_keep_alive, logger=logger)
+        if args.read_timeout:
+            socmed.timeouts = {name: (connect, args.read_timeout) for name, (connect, _) in socmed.timeouts.items()}
+        socmed.deadline = args.deadline
+        socmed.hedge = args.hedge
+        socmed.batch_size = args.batch_size
+        socmed.existence_only = args.existence_only
+        if args.schedule or args.priority or args.stop_after:
+            from modules.scheduler import Scheduler
+            priorities = [[name.strip() for name in names.split(',')] for names in args.priority or ()]
+            socmed.scheduler = Scheduler(socmed.metrics, priorities=priorities, stop_after=args.stop_after)
+
+        if args.engine == 'async':
+            from modules.async_engine import AsyncSOCMED
+            engine = AsyncSOCMED(socmed, concurrency=args.concurrency, per_host=args.concurrency,
+                                 keep_alive=not args.no_keep_alive)
+        else:
+            engine = socmed
+
+        recorder = Recorder()
+        instrument(engine, recorder)
+        usernames = make_usernames(args.usernames, args.mix, args.seed)
+
+        before = resource.getrusage(resource.RUSAGE_SELF)
+        recorder.started = time.perf_counter()
+        elapsed = engine.run_bulk(usernames, summary=False)
+        after = resource.getrusage(resource.RUSAGE_SELF)
+        socmed.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    requests = len(recorder.latencies)
+    metrics = socmed.metrics
+    statuses = {status: metrics.total(status) for status in ('found', 'not_found', 'error', 'blocked', 'timeout', 'skipped')}
+    return {
+        "benchmark": "loadtest",
+        "engine": args.engine,
+        "concurrency": args.concurrency,
+        "usernames": args.usernames,
+        "platforms": len(socmed.platforms),
+        "requests": requests,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(requests / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(recorder.latencies, 0.50), 2),
+            "p95": round(percentile(recorder.latencies, 0.95), 2),
+            "p99": round(percentile(recorder.latencies, 0.99), 2),
+            "max": round(max(recorder.latencies, default=0.0), 2),
+        },
+        "statuses": {status: count for status, count in statuses.items() if count},
+        "batch_size": args.batch_size,
+        # Seconds until the first 10% and half of the results were in
+        "answers_s": {
+            "p10": round(percentile(recorder.answers, 0.10), 3),
+            "p50": round(percentile(recorder.answers, 0.50), 3),
+        },
+        "hedged": metrics.total('hedged'),
+        "hedge_wins": metrics.total('hedge_wins'),
+        "probes": metrics.total('probes'),
+        "probe_hits": metrics.total('probe_hits'),
+        "phase_p50_ms": {
+            phase: round(metrics.merged(phase).quantile(0.5) * 1000, 2)
+            for phase in PHASES if metrics.merged(phase).count
+        },
+        "downloaded_mb": round(socmed.bytes_read / 1024 / 1024, 2),
+        "cpu_s": round((after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime), 3),
+        # ru_maxrss is kilobytes on Linux and bytes on macOS
+        "peak_rss_mb": round(after.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the checkers against local mock platforms")
+    parser.add_argument('-e', '--engine', choices=['threads', 'async'], default='threads', help="Engine to drive")
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help="Threads or concurrent requests")
+    parser.add_argument('-n', '--usernames', type=int, default=200, help="Number of generated usernames")
+    parser.add_argument('-p', '--platforms', default=None, help="Comma-separated platforms (default: all)")
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix("found=70,missing=20,throttle=5,slow=5"),
+                        help="Weights of found/missing/throttle/slow usernames")
+    parser.add_argument('--page-kb', type=int, default=256, help="Filler added to every mock HTML page")
+    parser.add_argument('--slow-ms', type=int, default=200, help="Delay for slow_* usernames")
+    parser.add_argument('--tail-pct', type=float, default=0.0, help="Percent of other requests the server delays")
+    parser.add_argument('--retries', type=int, default=1, help="Retries for throttled requests")
+    parser.add_argument('--read-timeout', type=float, default=None, help="Read timeout for every platform")
+    parser.add_argument('--deadline', type=float, default=None, help="Per-username deadline in seconds")
+    parser.add_argument('--hedge', action='store_true', help="Duplicate requests slower than the platform's p95")
+    parser.add_argument('--batch-size', type=int, default=1, help="Usernames per X users/lookup request (1 disables batching)")
+    parser.add_argument('--schedule', action='store_true', help="Reorder checks cheapest platform first")
+    parser.add_argument('--priority', action='append', default=None,
+                        help="Comma-separated platforms checked first; repeat for further classes")
+    parser.add_argument('--stop-after', type=int, default=None, help="Skip a username's other platforms once found on N")
+    parser.add_argument('--existence-only', action='store_true', help="Probe platforms that support it instead of fetching pages")
+    parser.add_argument('--no-keep-alive', action='store_true', help="Open a new connection for every request")
+    parser.add_argument('--port', type=int, default=None, help="Mock server port (default: any free port)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the username mix")
+    args = parser.parse_args()
+    if args.platforms:
+        args.platforms = [name.strip().lower() for name in args.platforms.split(',')]
+
+    print(json.dumps(run(args)))
+
+if __name__ == '__main__':
+    main()
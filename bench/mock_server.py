@@ -0,0 +1,162 @@
+"""Local stand-in for the eight platforms, serving recorded responses.
+
+Requests arrive as /<platform>/<original path> (see --base-url). The
+username's prefix picks the outcome, anything else is treated as found:
+
+    found_*     recorded profile page
+    missing_*   recorded not-found response for that platform
+    throttle_*  429 with Retry-After
+    slow_*      the found page after --slow-ms of delay
+
+X batch lookups (/x/1.1/users/lookup.json?screen_name=a,b) follow the
+same prefixes: any throttle_ name gets a 429 for the whole batch, any
+slow_ name delays it, and missing_ names are left out of the user list.
+
+--tail-pct also delays that share of all other requests by --slow-ms, to
+give hedged requests a latency tail to cut.
+
+    python bench/mock_server.py --port 8900 --page-kb 256
+"""
+import argparse, json, os, random, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Not-found responses that are a bare status rather than a page
+MISSING_STATUS = {
+    "lemon8": (302, {"Location": "https://www.lemon8-app.com/"}),
+    "threads": (404, {}),
+    "snapchat": (404, {}),
+}
+
+def load_fixtures():
+    fixtures = {}
+    for filename in os.listdir(FIXTURES):
+        name, ext = os.path.splitext(filename)
+        with open(os.path.join(FIXTURES, filename), encoding='utf-8') as handle:
+            fixtures[name] = (handle.read(), 'application/json' if ext == '.json' else 'text/html; charset=utf-8')
+    return fixtures
+
+def request_username(platform, url):
+    """Recover the username a checker asked for from its request URL"""
+    if platform == "x":
+        variables = parse_qs(url.query).get('variables', ['{}'])[0]
+        return json.loads(variables).get('screen_name', '')
+    return url.path.rstrip('/').rsplit('/', 1)[-1].lstrip('@')
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fixtures = {}
+    padding = ''
+    slow_seconds = 0.5
+    tail = 0.0
+    retry_after = 1
+    requests = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with MockHandler.lock:
+            MockHandler.requests += 1
+
+        url = urlsplit(self.path)
+        platform = url.path.strip('/').split('/', 1)[0]
+        if url.path.endswith('/users/lookup.json'):
+            return self._lookup(url)
+        username = request_username(platform, url)
+        kind = username.split('_', 1)[0] if '_' in username else 'found'
+
+        if kind == 'throttle':
+            return self._send(429, b'', 'text/plain', {"Retry-After": str(self.retry_after)})
+        if kind == 'slow' or random.random() < self.tail:
+            time.sleep(self.slow_seconds)
+        if kind == 'missing' and platform in MISSING_STATUS:
+            status, headers = MISSING_STATUS[platform]
+            return self._send(status, b'', 'text/html', headers)
+
+        key = f"{platform}_{'missing' if kind == 'missing' else 'found'}"
+        if key not in self.fixtures:
+            return self._send(404, b'unknown platform', 'text/plain')
+
+        template, content_type = self.fixtures[key]
+        body = template.replace('{{username}}', username).replace('{{padding}}', self.padding)
+        self._send(200, body.encode('utf-8'), content_type)
+
+    def do_HEAD(self):
+        # Same status and headers as GET; _send leaves the body out
+        self.do_GET()
+
+    def _lookup(self, url):
+        """Answer an X users/lookup batch the way the real endpoint does"""
+        names = [name for name in parse_qs(url.query).get('screen_name', [''])[0].split(',') if name]
+        kinds = {name.split('_', 1)[0] if '_' in name else 'found' for name in names}
+        if 'throttle' in kinds:
+            return self._send(429, b'', 'text/plain', {"Retry-After": str(self.retry_after)})
+        if 'slow' in kinds or random.random() < self.tail:
+            time.sleep(self.slow_seconds)
+
+        users = [
+            {"screen_name": name, "name": name, "followers_count": 1234, "friends_count": 56}
+            for name in names if not name.startswith('missing_')
+        ]
+        if not users:
+            body = {"errors": [{"code": 17, "message": "No user matches for specified terms."}]}
+            return self._send(404, json.dumps(body).encode(), 'application/json')
+        self._send(200, json.dumps(users).encode(), 'application/json')
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command == 'HEAD':
+            return
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Checkers hang up once they have their verdict
+            self.close_connection = True
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            pass
+
+def make_padding(kilobytes):
+    block = '<div class="pad"><span>lorem ipsum dolor sit amet</span></div>\n'
+    return block * max(0, kilobytes * 1024 // len(block))
+
+def serve(port=8900, page_kb=256, slow_ms=500, retry_after=1, tail_pct=0.0):
+    MockHandler.fixtures = load_fixtures()
+    MockHandler.padding = make_padding(page_kb)
+    MockHandler.slow_seconds = slow_ms / 1000
+    MockHandler.tail = tail_pct / 100
+    MockHandler.retry_after = retry_after
+    server = ThreadingHTTPServer(("127.0.0.1", port), MockHandler)
+    server.daemon_threads = True
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded platform responses locally")
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--page-kb', type=int, default=256, help="Filler added to every HTML page")
+    parser.add_argument('--slow-ms', type=int, default=500, help="Delay for slow_* usernames")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds for throttle_* usernames")
+    parser.add_argument('--tail-pct', type=float, default=0.0, help="Percent of other requests delayed by --slow-ms")
+    args = parser.parse_args()
+
+    server = serve(args.port, args.page_kb, args.slow_ms, args.retry_after, args.tail_pct)
+    print(f"Mock platforms listening on http://127.0.0.1:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Cold-start benchmark for main.py.
+
+Runs the real CLI end to end on an empty username list, so it exercises
+argument parsing, imports, engine and session setup without touching the
+network, and fails when the median start-up time exceeds the budget.
+
+    python bench/startup.py --runs 20 --budget-ms 250
+"""
+import argparse, json, os, statistics, subprocess, sys, tempfile, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure(runs, extra_args):
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as handle:
+        empty = handle.name
+
+    command = [sys.executable, os.path.join(ROOT, 'main.py'), '-q', '--no-cache', '-f', empty] + extra_args
+    timings = []
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        os.unlink(empty)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure main.py cold-start time")
+    parser.add_argument('--runs', type=int, default=10, help="Number of process launches")
+    parser.add_argument('--budget-ms', type=float, default=250.0, help="Maximum allowed median start-up time")
+    parser.add_argument('--engine', choices=['threads', 'async'], default='threads', help="Engine to start")
+    args = parser.parse_args()
+
+    timings = measure(args.runs, ['-e', args.engine])
+    result = {
+        "benchmark": "startup",
+        "engine": args.engine,
+        "runs": args.runs,
+        "min_ms": round(min(timings), 1),
+        "median_ms": round(statistics.median(timings), 1),
+        "max_ms": round(max(timings), 1),
+        "budget_ms": args.budget_ms,
+    }
+    result["within_budget"] = result["median_ms"] <= args.budget_ms
+    print(json.dumps(result))
+    sys.exit(0 if result["within_budget"] else 1)
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,145 @@
 from modules.args_parser import parse_args
 from modules.socmed import SOCMED
+from modules.platforms import select_platforms, use_base_url
 from modules.banners import banners
+from modules.bulk import read_usernames
+from modules.config import setup_config
+from modules.output import open_writer
+from modules.render import Renderer
+from modules.ratelimit import RateLimiter, load_rate_limits
+from modules.timeouts import load_timeouts
+from modules.transport import open_session, load_host_pools, load_max_bytes
+from colorama import Fore
 import sys
 
 if __name__ == '__main__':
-    banners()
+    args, logger = parse_args()
+    if not args.quiet:
+        banners()
+    socmed = None
     try:
-        args, logger = parse_args()
         socmed = SOCMED(logger=logger)
         socmed.input = args.input
-        socmed.output = args.output  # This can be None now
+        # A service answers over HTTP, so results are not printed
+        socmed.renderer = Renderer('silent' if args.serve else args.display, start_time=socmed.start_time)
+        socmed.output = open_writer(args.output) if args.output else None
+        if args.checkpoint:
+            from modules.checkpoint import Checkpoint
+            socmed.checkpoint = Checkpoint(args.checkpoint, resume=args.resume, writer=socmed.output)
         socmed.threads = args.threads
-        socmed.instagram_checker()
-        socmed.facebook_checker()
-        socmed.tiktok_checker()
-        socmed.x_checker()
-        socmed.telegram_checker()
-        socmed.lemon8_checker()
-        socmed.threads_checker()
-        socmed.snapchat_checker()
+        socmed.platforms = select_platforms(args.platforms)
+        if args.base_url:
+            use_base_url(args.base_url)
+        config = setup_config()
+        socmed.max_bytes.update(load_max_bytes(config))
+        if args.max_bytes:
+            socmed.max_bytes = {name: args.max_bytes for name in socmed.max_bytes}
+        socmed.timeouts = load_timeouts(config, socmed.timeouts)
+        if args.connect_timeout or args.read_timeout:
+            socmed.timeouts = {
+                name: (args.connect_timeout or connect, args.read_timeout or read)
+                for name, (connect, read) in socmed.timeouts.items()
+            }
+        socmed.deadline = args.deadline
+        socmed.hedge = args.hedge
+        socmed.batch_size = args.batch_size
+        socmed.existence_only = args.existence_only
+        socmed.show_metrics = args.metrics
+        socmed.stats_file = args.stats_file
+        if args.metrics_port:
+            socmed.metrics.serve(args.metrics_port)
+        socmed.session = open_session(
+            pool_size=args.pool_size or args.threads,
+            host_pools=load_host_pools(config),
+            keep_alive=not args.no_keep_alive,
+            http2=args.http2,
+            logger=logger
+        )
+        socmed.limiter = RateLimiter(
+            default_rps=args.rps,
+            platform_rps=load_rate_limits(config),
+            retries=args.retries
+        )
+        if args.proxies:
+            from modules.proxies import ProxyPool, load_proxies, load_proxy_settings
+            proxies = load_proxies(args.proxies)
+            if args.engine == 'async' and any(url.startswith('socks') for url in proxies):
+                raise ValueError("The async engine only supports http:// and https:// proxies")
+            socmed.proxies = ProxyPool(
+                proxies,
+                session_options={
+                    "pool_size": args.pool_size or args.threads,
+                    "host_pools": load_host_pools(config),
+                    "keep_alive": not args.no_keep_alive,
+                },
+                limiter_options={
+                    "default_rps": args.rps,
+                    "platform_rps": load_rate_limits(config),
+                    "retries": args.retries,
+                },
+                **load_proxy_settings(config)
+            )
+        if args.schedule or args.priority or args.stop_after:
+            from modules.scheduler import Scheduler, load_schedule_settings
+            socmed.scheduler = Scheduler(
+                socmed.metrics,
+                priorities=args.priority or (),
+                stop_after=args.stop_after,
+                **load_schedule_settings(config)
+            )
+        if not args.no_cache and not args.coordinator:
+            # A coordinator runs no checks itself; its workers use the cache
+            from modules.cache import ResultCache, load_cache_settings
+            socmed.cache = ResultCache(refresh=args.refresh, **load_cache_settings(config))
+
+        engine = socmed
+        if args.engine == 'async':
+            from modules.async_engine import AsyncSOCMED
+            engine = AsyncSOCMED(
+                socmed,
+                concurrency=args.concurrency,
+                per_host=args.per_host,
+                keep_alive=not args.no_keep_alive
+            )
+
+        usernames = None
+        if args.variants:
+            from modules.variants import Sweep, expand_all, load_variant_settings
+            socmed.sweep = Sweep()
+            settings = load_variant_settings(config)
+            if args.variant_rules:
+                settings['rules'] = args.variant_rules
+            seeds = read_usernames(args.file) if args.file else [args.input]
+            usernames = expand_all(seeds, **settings)
+        elif args.file:
+            usernames = read_usernames(args.file)
+
+        if args.export:
+            from modules.output import export_records
+            count = export_records(args.export, socmed.output)
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Exported {count} records from {args.export} to {args.output}")
+        elif args.serve:
+            from modules.distributed import parse_address
+            from modules.service import Service
+            Service(socmed, parse_address(args.serve), capacity=args.serve_capacity).run()
+        elif args.worker:
+            from modules.distributed import Worker, parse_address
+            Worker(socmed, parse_address(args.worker)).run()
+        elif args.coordinator:
+            from modules.distributed import Coordinator, TaskQueue, parse_address, spawn_workers
+            queue = TaskQueue(args.queue_db, resume=args.resume, lease_seconds=args.lease, retries=args.task_retries)
+            try:
+                spawn = spawn_workers(args, args.spawn_workers) if args.spawn_workers else None
+                Coordinator(socmed, queue, parse_address(args.coordinator)).run(usernames or [args.input], spawn)
+            finally:
+                queue.close()
+        elif usernames is not None:
+            engine.run_bulk(usernames)
+        else:
+            engine.run_checkers()
     except Exception as e:
         logger.error(f"Application failed: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        if socmed:
+            socmed.close()
\ No newline at end of file
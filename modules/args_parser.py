@@ -2,6 +2,10 @@ import argparse
 import os
 import logging
 from modules.logging import setup_logging
+from modules.platforms import PLATFORMS
+from modules.bulk import clean_username
+from modules.output import COLUMNAR, split_extension
+from modules.variants import RULES as VARIANT_RULES, parse_rules
 
 def validate_file(path):
     """Validate that the input file exists"""
@@ -9,12 +13,48 @@ def validate_file(path):
         raise argparse.ArgumentTypeError(f"File '{path}' does not exist")
     return path
 
-def validate_json_output(path):
-    """Validate that output path ends with .json"""
-    if not path.lower().endswith('.json'):
-        raise argparse.ArgumentTypeError("Output file must be in .json format")
+def validate_username_file(path):
+    """Validate that the username list exists, '-' reads from stdin"""
+    if path == '-':
+        return path
+    return validate_file(path)
+
+def validate_platforms(value):
+    """Validate a comma-separated list of registered platform names"""
+    names = [name.strip().lower() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in PLATFORMS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Unknown platform(s): {', '.join(unknown)} (choose from {', '.join(PLATFORMS)})"
+        )
+    return names
+
+def validate_variant_rules(value):
+    """Validate a comma-separated list of variant rules"""
+    rules = parse_rules(value)
+    unknown = [rule for rule in rules if rule not in VARIANT_RULES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Unknown variant rule(s): {', '.join(unknown)} (choose from {', '.join(VARIANT_RULES)})"
+        )
+    return rules
+
+def validate_output(path):
+    """Validate that output path is .json, .jsonl or .csv, optionally .gz/.zst compressed, or .parquet/.arrow"""
+    fmt, _ = split_extension(path)
+    if fmt is None:
+        raise argparse.ArgumentTypeError(
+            "Output file must be .json, .jsonl or .csv (optionally .gz or .zst), or .parquet or .arrow"
+        )
     return path
 
+def validate_threads(value):
+    """Validate that thread count is between 1 and 32"""
+    threads = int(value)
+    if not 1 <= threads <= 32:
+        raise argparse.ArgumentTypeError("Threads must be between 1 and 32")
+    return threads
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -23,28 +63,303 @@ def parse_args():
     )
 
     # Required arguments
-    parser.add_argument(
+    # One of these is required unless running as a --worker
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
         '-i', '--input',
-        type=str,
-        required=True,
+        type=clean_username,
         help="Username to check"
     )
 
+    target.add_argument(
+        '-f', '--file',
+        type=validate_username_file,
+        help="Newline-delimited file of usernames to check ('-' reads stdin)"
+    )
+
     parser.add_argument(
         '-o', '--output',
-        type=validate_json_output,
+        type=validate_output,
         required=False,
-        help="Path to output file (must be .json format)"
+        help="Path to output file: .jsonl appends one record per line, .json writes an array, .csv appends "
+             "typed rows; add .gz or .zst to compress. .parquet and .arrow write typed columns (needs pyarrow)"
     )
 
     # Optional arguments
+    parser.add_argument(
+        '-p', '--platforms',
+        type=validate_platforms,
+        help="Comma-separated platforms to check, e.g. instagram,tiktok (default: all)"
+    )
+
     parser.add_argument(
         '-t', '--threads',
-        type=int,
+        type=validate_threads,
         default=3,
         help="Number of threads to use (1-32)"
     )
 
+    parser.add_argument(
+        '-e', '--engine',
+        choices=['threads', 'async'],
+        default='threads',
+        help="Request engine: worker threads or a single asyncio event loop (needs aiohttp)"
+    )
+
+    parser.add_argument(
+        '-c', '--concurrency',
+        type=int,
+        default=100,
+        help="Maximum in-flight requests for the async engine"
+    )
+
+    parser.add_argument(
+        '--per-host',
+        type=int,
+        default=10,
+        help="Maximum open connections per host for the async engine"
+    )
+
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        help="Keep-alive connections per platform host (defaults to --threads); "
+             "override single hosts in the [pools] section of config.ini"
+    )
+
+    parser.add_argument(
+        '--no-keep-alive',
+        action='store_true',
+        help="Close connections after every request"
+    )
+
+    parser.add_argument(
+        '--http2',
+        action='store_true',
+        help="Use HTTP/2 for the threads engine when httpx[http2] is installed"
+    )
+
+    parser.add_argument(
+        '--max-bytes',
+        type=int,
+        help="Stop reading any response body after this many bytes; "
+             "set per-platform caps in the [max_bytes] section of config.ini"
+    )
+
+    parser.add_argument(
+        '--rps',
+        type=float,
+        default=10.0,
+        help="Requests-per-second ceiling per platform host; the limiter backs off "
+             "below it on 429/503. Override platforms in [rate_limits] of config.ini"
+    )
+
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=3,
+        help="Retries with jittered exponential backoff for throttled (429/503) responses"
+    )
+
+    parser.add_argument(
+        '--proxies',
+        type=validate_file,
+        help="File of proxy URLs, one per line (http://, https://, socks5://); requests are spread across them "
+             "by latency and success rate, and --rps applies per proxy"
+    )
+
+    parser.add_argument(
+        '--connect-timeout',
+        type=float,
+        help="Seconds to wait for a connection to any platform (default 5); "
+             "set per-platform values in the [timeouts] section of config.ini"
+    )
+
+    parser.add_argument(
+        '--read-timeout',
+        type=float,
+        help="Seconds to wait between bytes of a response (default 10)"
+    )
+
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        help="Hard limit in seconds for all platform checks of one username; "
+             "checks that miss it are recorded with status 'timeout'"
+    )
+
+    parser.add_argument(
+        '--hedge',
+        action='store_true',
+        help="Send a duplicate request when one takes longer than the platform's recent p95"
+    )
+
+    parser.add_argument(
+        '--existence-only',
+        action='store_true',
+        help="Only settle whether each profile exists: platforms with a reliable status answer "
+             "(lemon8, threads, snapchat) get a HEAD or short ranged GET, and the full page is "
+             "fetched only when that status is ambiguous. Found records carry no stats"
+    )
+
+    parser.add_argument(
+        '--schedule',
+        action='store_true',
+        help="Reorder checks so cheap platforms run first, costed from this run's latency and bytes"
+    )
+
+    parser.add_argument(
+        '--priority',
+        type=validate_platforms,
+        action='append',
+        help="Comma-separated platforms to check for every username before the rest; repeat for further "
+             "classes, e.g. --priority instagram,x --priority tiktok (implies --schedule)"
+    )
+
+    parser.add_argument(
+        '--stop-after',
+        type=int,
+        help="Skip a username's remaining platforms once it is found on this many (implies --schedule)"
+    )
+
+    parser.add_argument(
+        '--variants',
+        action='store_true',
+        help="Treat each username as a seed and also check its variants (john.doe, johndoe, jdoe, johndoe1, ...)"
+    )
+
+    parser.add_argument(
+        '--variant-rules',
+        type=validate_variant_rules,
+        help=f"Comma-separated variant rules to apply (default: all of {', '.join(VARIANT_RULES)}); "
+             "separators and suffixes are set in the [variants] section of config.ini"
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=100,
+        help="Usernames per request on platforms with a batch endpoint (X) during bulk runs; 1 disables batching"
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Do not read or write the on-disk result cache"
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help="Ignore cached results but store fresh ones"
+    )
+
+    parser.add_argument(
+        '-d', '--display',
+        choices=['box', 'compact', 'progress', 'silent'],
+        default='box',
+        help="Result output: bordered boxes, one line per result, a live progress bar, or nothing"
+    )
+
+    parser.add_argument(
+        '--checkpoint',
+        help="Journal every finished (username, platform) check to this file"
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help="Continue from --checkpoint (skip checks that already have a verdict and retry failed ones), "
+             "or from the --coordinator's --queue-db"
+    )
+
+    parser.add_argument(
+        '--metrics',
+        action='store_true',
+        help="Print per-platform outcome counts and phase timings at the end of the run"
+    )
+
+    parser.add_argument(
+        '--stats-file',
+        help="Write per-platform counters and latency histograms to this JSON file when the run ends"
+    )
+
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help="Serve live metrics on 127.0.0.1:PORT (/metrics for Prometheus, /stats.json)"
+    )
+
+    parser.add_argument(
+        '--coordinator',
+        metavar='HOST:PORT',
+        help="Queue the checks for worker processes connecting on HOST:PORT instead of running them here"
+    )
+
+    parser.add_argument(
+        '--worker',
+        metavar='HOST:PORT',
+        help="Run checks handed out by the coordinator at HOST:PORT until it has none left"
+    )
+
+    parser.add_argument(
+        '--spawn-workers',
+        type=int,
+        default=0,
+        help="With --coordinator, also start this many local worker processes"
+    )
+
+    parser.add_argument(
+        '--export',
+        metavar='RESULTS',
+        type=validate_file,
+        help="Convert an earlier .jsonl or .json results file (optionally .gz/.zst) to -o's format instead of running checks"
+    )
+
+    parser.add_argument(
+        '--serve',
+        metavar='HOST:PORT',
+        help="Keep running and answer lookups over HTTP/JSON on HOST:PORT (e.g. :8080) with a warm session and cache"
+    )
+
+    parser.add_argument(
+        '--serve-capacity',
+        type=int,
+        help="Most checks the service queues or runs at once before it answers 429 (default: threads * 16)"
+    )
+
+    parser.add_argument(
+        '--queue-db',
+        default="osint_queue.sqlite",
+        help="SQLite file holding the coordinator's task queue; --resume continues its unfinished tasks"
+    )
+
+    parser.add_argument(
+        '--lease',
+        type=float,
+        default=300.0,
+        help="Seconds a worker may hold a task before the coordinator hands it to another worker"
+    )
+
+    parser.add_argument(
+        '--task-retries',
+        type=int,
+        default=2,
+        help="Times the coordinator re-queues a task that ended in error, blocked or timeout"
+    )
+
+    parser.add_argument(
+        '--base-url',
+        help="Send requests to BASE_URL/<platform>/... instead of the real sites (e.g. bench/mock_server.py)"
+    )
+
+    parser.add_argument(
+        '-q', '--quiet', '--no-banner',
+        dest='quiet',
+        action='store_true',
+        help="Skip the banner and screen clear, and log without colours"
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='count',
@@ -53,9 +368,41 @@ def parse_args():
     )
 
     args = parser.parse_args()
+    if args.export and (args.input or args.file or args.worker or args.serve or args.coordinator):
+        parser.error("--export converts a results file and runs no checks")
+    if args.export and not args.output:
+        parser.error("--export needs -o/--output")
+    if args.export and split_extension(args.export)[0] not in ('.jsonl', '.json'):
+        parser.error("--export reads .jsonl or .json results, optionally .gz or .zst")
+    if not (args.input or args.file or args.worker or args.serve or args.export):
+        parser.error("one of the arguments -i/--input -f/--file is required")
+    if args.serve and (args.input or args.file or args.coordinator or args.worker):
+        parser.error("--serve takes its usernames from HTTP requests")
+    if args.serve and (args.checkpoint or args.variants or args.schedule or args.priority or args.stop_after):
+        parser.error("--serve does not support --checkpoint, --variants, --schedule, --priority or --stop-after")
+    if args.serve and args.engine == 'async':
+        parser.error("--serve runs on the threads engine")
+    if args.worker and (args.input or args.file or args.coordinator):
+        parser.error("--worker takes its usernames from the coordinator")
+    if args.spawn_workers and not args.coordinator:
+        parser.error("--spawn-workers needs --coordinator")
+    if args.resume and not (args.checkpoint or args.coordinator):
+        parser.error("--resume needs --checkpoint or --coordinator")
+    if args.resume and args.output and split_extension(args.output)[0] in ('.json', *COLUMNAR):
+        parser.error("--resume appends results, use .jsonl or .csv output")
+    if args.checkpoint and args.output and split_extension(args.output)[0] in COLUMNAR:
+        parser.error("--checkpoint needs output that is readable after a crash, use .jsonl or .csv")
+    if args.proxies and args.http2:
+        parser.error("--http2 does not support --proxies")
+    if (args.schedule or args.priority or args.stop_after) and (args.coordinator or args.worker):
+        parser.error("--schedule, --priority and --stop-after are not supported in coordinator/worker mode")
+    if args.stop_after is not None and args.stop_after < 1:
+        parser.error("--stop-after must be at least 1")
+    if args.variant_rules and not args.variants:
+        parser.error("--variant-rules needs --variants")
     
     # Configure logging based on verbosity
-    logger = setup_logging("SOCMED")
+    logger = setup_logging("SOCMED", plain=args.quiet)
     if args.verbose >= 2:
         logger.setLevel(logging.DEBUG)
     elif args.verbose == 1:
@@ -0,0 +1,264 @@
+import asyncio, time
+from urllib.parse import urlsplit
+from modules.platforms import PLATFORMS
+from modules.ratelimit import Blocked, THROTTLE_STATUSES
+from modules.timeouts import Timeout, DEFAULT_TIMEOUT, check_deadline, request_timeout
+from modules.transport import BodyReader, chunk_size, phase_timings
+
+class AsyncSOCMED:
+    """Run SOCMED's platform checks as coroutines on a single event loop.
+
+    Requests go through one aiohttp session whose connector caps the total
+    number of open connections (concurrency) and the connections per host
+    (per_host). Fetched pages are handed to the same parse methods the
+    threaded engine uses, so results are identical.
+    """
+
+    def __init__(self, socmed, concurrency=100, per_host=10, keep_alive=True):
+        self.socmed = socmed
+        self.logger = socmed.logger
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.keep_alive = keep_alive
+        self.connections = {}
+        # In-flight fetches by (platform, normalised username), shared by duplicate lookups
+        self.inflight = {}
+
+    def run_checkers(self):
+        elapsed = self.run_bulk([self.socmed.input], summary=False)
+        self.socmed._print_summary(1, elapsed, f"async engine ({self.concurrency} concurrent)", self.connections)
+        return elapsed
+
+    def run_bulk(self, usernames, summary=True):
+        return asyncio.run(self._run(usernames, summary))
+
+    async def _run(self, usernames, summary):
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError("The async engine requires aiohttp (pip install aiohttp)")
+
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.per_host,
+            force_close=not self.keep_alive
+        )
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection("new"))
+        trace.on_connection_reuseconn.append(self._on_connection("reused"))
+        trace.on_connection_create_start.append(self._on_connect_start)
+        trace.on_connection_create_end.append(self._on_connect_end)
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        counted = [0]
+        started = time.perf_counter()
+
+        async with aiohttp.ClientSession(connector=connector, trace_configs=[trace]) as session:
+            workers = [asyncio.create_task(self._worker(session, queue)) for _ in range(self.concurrency)]
+            tasks = self.socmed._scheduled(usernames, counted)
+            if self.socmed.scheduler is None:
+                for task in tasks:
+                    await queue.put(task)
+            else:
+                # The scheduler may wait for results, which arrive on this loop
+                loop = asyncio.get_running_loop()
+                while True:
+                    task = await loop.run_in_executor(None, next, tasks, None)
+                    if task is None:
+                        break
+                    await queue.put(task)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        count = counted[0]
+
+        elapsed = time.perf_counter() - started
+        self.socmed.renderer.drain()
+        if summary:
+            self.socmed._print_summary(count, elapsed, f"async engine ({self.concurrency} concurrent)", self.connections)
+        return elapsed
+
+    def _on_connection(self, kind):
+        async def count(session, context, params):
+            # Connection signals carry no URL, the request passes its host in
+            host = (context.trace_request_ctx or {}).get("host", "unknown")
+            entry = self.connections.setdefault(host, {"new": 0, "reused": 0})
+            entry[kind] += 1
+        return count
+
+    async def _on_connect_start(self, session, context, params):
+        context.trace_request_ctx["connect_started"] = time.perf_counter()
+
+    async def _on_connect_end(self, session, context, params):
+        # Connection creation includes DNS resolution, TCP and TLS
+        ctx = context.trace_request_ctx
+        ctx["connect"] = ctx.get("connect", 0.0) + time.perf_counter() - ctx["connect_started"]
+
+    async def _worker(self, session, queue):
+        while True:
+            task = await queue.get()
+            if task is None:
+                return
+            check = self._check_batch if isinstance(task[1], list) else self._check
+            await check(session, *task)
+
+    async def _check(self, session, name, username, deadline=None):
+        socmed = self.socmed
+        try:
+            cached = await self._offload(socmed._from_cache, name, username)
+            if cached:
+                return cached
+
+            if socmed.existence_only and PLATFORMS[name].probe:
+                status, _ = await self._shared_fetch(session, name, username, deadline, probe=True)
+                settled = await self._offload(socmed._settle_probe, name, username, status)
+                if settled:
+                    return settled
+
+            status, body = await self._shared_fetch(session, name, username, deadline)
+            return await self._offload(socmed._report, name, username, status, body.text)
+
+        except Blocked as e:
+            await self._offload(socmed._report_failure, name, username, "blocked", e)
+        except Timeout as e:
+            await self._offload(socmed._report_failure, name, username, "timeout", e)
+        except Exception as e:
+            await self._offload(socmed._report_error, name, username, e)
+
+    async def _check_batch(self, session, name, usernames, deadline=None):
+        socmed = self.socmed
+        usernames = await self._offload(socmed._uncached, name, usernames)
+        if not usernames:
+            return
+        try:
+            status, body = await self._fetch(session, name, socmed._batch_request(name, usernames), deadline)
+            await self._offload(socmed._report_batch, name, usernames, status, body.text)
+        except Exception as e:
+            await self._offload(socmed._fail_batch, name, usernames, e)
+
+    async def _offload(self, method, *args):
+        """Run a SOCMED cache or report method on the default executor.
+
+        They read and write the SQLite cache, the output file and the
+        checkpoint, any of which can block on disk and would otherwise stall
+        every request in flight.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    async def _shared_fetch(self, session, name, username, deadline=None, probe=False):
+        key = (name, self.socmed._key(name, username), probe)
+        task = self.inflight.get(key)
+        if task is None:
+            platform = PLATFORMS[name]
+            request = platform.probe_request(username) if probe else platform.request(username)
+            task = asyncio.ensure_future(self._fetch(session, name, request, deadline))
+            self.inflight[key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+        else:
+            self.socmed.metrics.count(name, 'coalesced')
+        # Shielded so one waiter being cancelled does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, session, name, request, deadline=None):
+        socmed = self.socmed
+        limiter = socmed.limiter
+        for attempt in range(limiter.retries + 1):
+            proxy = socmed.proxies.choose(name) if socmed.proxies is not None else None
+            limiter = proxy.limiter if proxy else socmed.limiter
+            await self._sleep(limiter.reserve(name), deadline)
+            try:
+                status, body = await self._hedged_get(session, name, request, deadline, proxy)
+            except Exception as e:
+                # Retry through the pool; the failed proxy now weighs less or is quarantined
+                if proxy is None or isinstance(e, Timeout) or attempt == socmed.limiter.retries:
+                    raise
+                continue
+            if status not in THROTTLE_STATUSES:
+                limiter.succeeded(name)
+                return status, body
+
+            limiter.throttled(name, body.headers)
+            self.socmed.metrics.count(name, 'throttled')
+            if attempt < limiter.retries:
+                await self._sleep(limiter.backoff(attempt), deadline)
+
+        raise Blocked(f"HTTP {status} after {limiter.retries} retries")
+
+    async def _sleep(self, delay, deadline):
+        if delay > 0:
+            check_deadline(deadline, delay)
+            await asyncio.sleep(delay)
+
+    async def _hedged_get(self, session, name, request, deadline, proxy=None):
+        """One GET, duplicated if it outlives the platform's p95 when hedging is on"""
+        socmed = self.socmed
+        delay = socmed.latency.p95(name) if socmed.hedge else None
+        if delay is None:
+            return await self._get(session, name, request, deadline, proxy)
+
+        primary = asyncio.ensure_future(self._get(session, name, request, deadline, proxy))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        limiter = proxy.limiter if proxy else socmed.limiter
+        if done or not limiter.try_acquire(name):
+            return await primary
+
+        backup = asyncio.ensure_future(self._get(session, name, request, deadline, proxy))
+        socmed.metrics.count(name, 'hedged')
+        tasks = [primary, backup]
+        try:
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.index):
+                    tasks.remove(task)
+                    if task.exception() is None or not tasks:
+                        if task is backup and task.exception() is None:
+                            socmed.metrics.count(name, 'hedge_wins')
+                        return task.result()
+        finally:
+            # The slower copy is no longer needed
+            for task in tasks:
+                task.cancel()
+
+    async def _get(self, session, name, request, deadline, proxy=None):
+        import aiohttp
+
+        connect, read = request_timeout(self.socmed.timeouts.get(name, DEFAULT_TIMEOUT), deadline)
+        context = {"host": urlsplit(request["url"]).hostname}
+        started = time.perf_counter()
+        try:
+            async with session.request(
+                request.get("method", "GET"),
+                request["url"],
+                params=request.get("params"),
+                headers=request["headers"],
+                allow_redirects=request.get("allow_redirects", True),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+                proxy=proxy.url if proxy else None,
+                trace_request_ctx=context
+            ) as response:
+                first_byte = time.perf_counter()
+                max_bytes = request["max_bytes"] if "max_bytes" in request else self.socmed.max_bytes.get(name)
+                body = BodyReader(request.get("stop"), max_bytes, response.charset or 'utf-8')
+                body.headers = response.headers
+                async for chunk in response.content.iter_chunked(chunk_size(max_bytes)):
+                    if body.feed(chunk):
+                        # Drop the connection rather than download the rest
+                        response.close()
+                        break
+                    check_deadline(deadline)
+        except Exception as e:
+            timed_out = isinstance(e, (asyncio.TimeoutError, Timeout))
+            if proxy:
+                self.socmed.proxies.record(proxy, name, 'timeout' if timed_out else 'error')
+            if isinstance(e, asyncio.TimeoutError):
+                raise Timeout(f"Request timed out: {e!r}")
+            raise
+
+        finished = time.perf_counter()
+        body.timings = phase_timings(started, first_byte, finished, context.get("connect"))
+        self.socmed._record_fetch(name, body, request.get("probe", False))
+        throttled = response.status in THROTTLE_STATUSES
+        if not throttled and not request.get("probe"):
+            self.socmed.latency.record(name, finished - started)
+        if proxy:
+            self.socmed.proxies.record(proxy, name, 'blocked' if throttled else 'ok', finished - started)
+        return response.status, body
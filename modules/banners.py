@@ -1,11 +1,11 @@
-import os, time
 from sys import stdout
 from colorama import Fore, Style
 
 # =========================================================================================================== #
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear + cursor home instead of spawning a 'clear'/'cls' shell
+    stdout.write("\033[2J\033[H")
 
 # =========================================================================================================== #
 
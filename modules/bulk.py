@@ -0,0 +1,19 @@
+import sys
+
+def clean_username(value):
+    """Strip whitespace and a leading @ from a username as typed"""
+    return value.strip().lstrip('@').strip()
+
+def read_usernames(path):
+    """Yield usernames one per line from a file, or from stdin when path is '-'"""
+    handle = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        for line in handle:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                username = clean_username(line)
+                if username:
+                    yield username
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
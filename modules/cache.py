@@ -0,0 +1,125 @@
+import json, sqlite3, threading, time
+
+class ResultCache:
+    """SQLite cache of checker results keyed by (platform, username).
+
+    Found results live for ttl seconds and not-found results for
+    negative_ttl, both overridable per platform. When the table grows past
+    max_entries the least recently used rows are evicted.
+    """
+    # Evict at most once per this many writes instead of counting on every put
+    EVICT_EVERY = 256
+
+    def __init__(self, path="osint_cache.sqlite", ttl=6 * 3600, negative_ttl=3600,
+                 platform_ttls=None, max_entries=100000, refresh=False):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.platform_ttls = platform_ttls or {}
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.lock = threading.Lock()
+
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                platform TEXT NOT NULL,
+                username TEXT NOT NULL,
+                found INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                expires REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (platform, username)
+            )
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    def _ttl(self, platform, found):
+        positive, negative = self.platform_ttls.get(platform, (self.ttl, self.negative_ttl))
+        return positive if found else negative
+
+    def get(self, platform, username):
+        """Return the cached (data, stats) for a lookup, or None on a miss"""
+        if self.refresh:
+            with self.lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        with self.lock:
+            row = self.db.execute(
+                "SELECT payload FROM results WHERE platform = ? AND username = ? AND expires > ?",
+                (platform, username, now)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.db.execute(
+                "UPDATE results SET accessed = ? WHERE platform = ? AND username = ?",
+                (now, platform, username)
+            )
+
+        payload = json.loads(row[0])
+        return payload["data"], payload["stats"]
+
+    def put(self, platform, username, data, stats):
+        now = time.time()
+        payload = json.dumps({"data": data, "stats": stats})
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (platform, username, int(data["found"]), payload, now + self._ttl(platform, data["found"]), now)
+            )
+            self.writes += 1
+            if self.writes % self.EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self):
+        count = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            self.db.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY accessed LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def close(self):
+        with self.lock:
+            self._evict()
+            self.db.close()
+
+def load_cache_settings(config):
+    """Read [cache] options from config.ini.
+
+    Recognised keys: path, ttl, negative_ttl, max_entries, and per-platform
+    <platform>_ttl / <platform>_negative_ttl overrides.
+    """
+    if not config.has_section('cache'):
+        return {}
+
+    section = config['cache']
+    settings = {}
+    for key in ('ttl', 'negative_ttl', 'max_entries'):
+        if key in section:
+            settings[key] = section.getint(key)
+    if 'path' in section:
+        settings['path'] = section['path']
+
+    ttl = settings.get('ttl', 6 * 3600)
+    negative_ttl = settings.get('negative_ttl', 3600)
+    platform_ttls = {}
+    for key in section:
+        if key.endswith('_negative_ttl'):
+            platform = key[:-len('_negative_ttl')]
+            positive = platform_ttls.get(platform, (ttl, negative_ttl))[0]
+            platform_ttls[platform] = (positive, section.getint(key))
+        elif key.endswith('_ttl') and key not in ('ttl', 'negative_ttl'):
+            platform = key[:-len('_ttl')]
+            negative = platform_ttls.get(platform, (ttl, negative_ttl))[1]
+            platform_ttls[platform] = (section.getint(key), negative)
+    settings['platform_ttls'] = platform_ttls
+    return settings
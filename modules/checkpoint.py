@@ -0,0 +1,71 @@
+import os, threading, time
+
+# Outcomes that settle a (platform, username) pair; anything else is retried on resume
+VERDICTS = ('found', 'not_found')
+
+class Checkpoint:
+    """Append-only journal of finished (platform, username) checks.
+
+    Each completed check appends one "platform<TAB>username<TAB>status"
+    line. Lines are buffered and written in batches like ResultWriter, and
+    the result writer is flushed first so a journalled check always has its
+    record on disk. With resume=True the existing journal is loaded and
+    pairs whose latest status is a verdict are reported as done.
+    """
+
+    def __init__(self, path, resume=False, writer=None, batch_size=256, flush_interval=1.0, fsync_interval=5.0):
+        self.path = path
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.finished = self._load(path) if resume else set()
+        self.skipped = 0
+        self.buffer = []
+        self.lock = threading.Lock()
+        self.last_flush = self.last_fsync = time.monotonic()
+        self.handle = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    @staticmethod
+    def _load(path):
+        latest = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as handle:
+                for line in handle:
+                    parts = line.rstrip('\n').split('\t')
+                    # A crash can leave the last line half written
+                    if len(parts) == 3 and line.endswith('\n'):
+                        latest[(parts[0], parts[1])] = parts[2]
+        return {pair for pair, status in latest.items() if status in VERDICTS}
+
+    def done(self, platform, username):
+        """True if this pair already has a verdict in the journal; counts it as skipped"""
+        if (platform, username) in self.finished:
+            self.skipped += 1
+            return True
+        return False
+
+    def mark(self, platform, username, status):
+        with self.lock:
+            self.buffer.append(f"{platform}\t{username}\t{status}\n")
+            if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def _flush(self):
+        if self.writer:
+            self.writer.flush()
+        if self.buffer:
+            self.handle.write(''.join(self.buffer))
+            self.buffer = []
+        self.handle.flush()
+        now = time.monotonic()
+        self.last_flush = now
+        if now - self.last_fsync >= self.fsync_interval:
+            os.fsync(self.handle.fileno())
+            self.last_fsync = now
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            os.fsync(self.handle.fileno())
+            self.handle.close()
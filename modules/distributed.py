@@ -0,0 +1,452 @@
+import json, os, socket, sqlite3, subprocess, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from colorama import Fore
+from modules.checkpoint import VERDICTS
+from modules.platforms import PLATFORMS, unbatched
+
+# Tasks inserted into the queue per transaction while the username list is read
+INSERT_BATCH = 500
+
+def parse_address(value):
+    """Split HOST:PORT, defaulting the host to 127.0.0.1 for a bare :PORT"""
+    host, _, port = value.rpartition(':')
+    return host or "127.0.0.1", int(port)
+
+# =============================================================== [QUEUE] =============================================================== #
+
+class TaskQueue:
+    """SQLite table of (platform, username) tasks and their state.
+
+    Tasks are keyed by the platform-normalised username, so spellings the
+    platform treats as one name are one task, run as the first one queued.
+    A task is pending until a worker leases it, then done (a verdict),
+    pending again (a failure with retries left) or failed. Leases that
+    outlive lease_seconds go back to pending, so a dead worker's tasks are
+    handed to the others. Results for a task that is no longer leased are
+    ignored, so a late duplicate never produces a second record.
+    """
+    # Expired leases are looked for at most this often
+    REAP_EVERY = 1.0
+
+    def __init__(self, path="osint_queue.sqlite", resume=False, lease_seconds=300.0, retries=2):
+        self.lease_seconds = lease_seconds
+        self.retries = retries
+        self.retried = 0
+        self.last_reap = 0.0
+        self.lock = threading.Lock()
+
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(tasks)")]
+        if columns and 'key' not in columns:
+            if resume:
+                raise RuntimeError(f"{path} was written by an older version and cannot be resumed")
+            self.db.execute("DROP TABLE tasks")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                platform TEXT NOT NULL,
+                key TEXT NOT NULL,
+                username TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT,
+                lease_expires REAL,
+                PRIMARY KEY (platform, key)
+            )
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state)")
+        if resume:
+            # Whoever held these leases is gone
+            self.db.execute("UPDATE tasks SET state = 'pending' WHERE state = 'leased'")
+        else:
+            self.db.execute("DELETE FROM tasks")
+
+    def add(self, tasks):
+        """Queue (platform, key, username) tasks, skipping keys already queued; returns how many were new"""
+        with self.lock:
+            before = self.db.total_changes
+            self.db.execute("BEGIN")
+            self.db.executemany("INSERT OR IGNORE INTO tasks (platform, key, username) VALUES (?, ?, ?)", tasks)
+            self.db.execute("COMMIT")
+            return self.db.total_changes - before
+
+    def lease(self, worker, count):
+        if count <= 0:
+            return []
+        now = time.time()
+        with self.lock:
+            self.db.execute("BEGIN")
+            if now - self.last_reap >= self.REAP_EVERY:
+                self.db.execute("UPDATE tasks SET state = 'pending' WHERE state = 'leased' AND lease_expires < ?", (now,))
+                self.last_reap = now
+            rows = self.db.execute(
+                "SELECT rowid, platform, username FROM tasks WHERE state = 'pending' ORDER BY rowid LIMIT ?", (count,)
+            ).fetchall()
+            self.db.executemany(
+                "UPDATE tasks SET state = 'leased', worker = ?, lease_expires = ? WHERE rowid = ?",
+                [(worker, now + self.lease_seconds, row[0]) for row in rows]
+            )
+            self.db.execute("COMMIT")
+        return [[platform, username] for _, platform, username in rows]
+
+    def complete(self, results):
+        """Settle reported (platform, key, status) tasks.
+
+        Returns the (platform, key) of the ones that are final: verdicts,
+        and failures that have used up their retries. The rest are queued
+        again.
+        """
+        final = []
+        with self.lock:
+            self.db.execute("BEGIN")
+            for platform, key, status in results:
+                row = self.db.execute(
+                    "SELECT state, attempts FROM tasks WHERE platform = ? AND key = ?", (platform, key)
+                ).fetchone()
+                if row is None or row[0] != 'leased':
+                    continue
+                if status in VERDICTS:
+                    state = 'done'
+                elif row[1] < self.retries:
+                    state = 'pending'
+                    self.retried += 1
+                else:
+                    state = 'failed'
+                self.db.execute(
+                    "UPDATE tasks SET state = ?, attempts = attempts + ? WHERE platform = ? AND key = ?",
+                    (state, int(status not in VERDICTS), platform, key)
+                )
+                if state != 'pending':
+                    final.append((platform, key))
+            self.db.execute("COMMIT")
+        return final
+
+    def counts(self):
+        with self.lock:
+            return dict(self.db.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state").fetchall())
+
+    def active(self):
+        """Tasks still pending or leased"""
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM tasks WHERE state IN ('pending', 'leased')").fetchone()[0]
+
+    def workers(self):
+        """Settled tasks per worker"""
+        with self.lock:
+            return dict(self.db.execute(
+                "SELECT worker, COUNT(*) FROM tasks WHERE state IN ('done', 'failed') GROUP BY worker"
+            ).fetchall())
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+# =============================================================== [COORDINATOR] =============================================================== #
+
+class Coordinator:
+    """Feeds (platform, username) tasks to workers over TCP and collects their results.
+
+    Workers send one JSON line per sync: the results they have finished
+    and how many new tasks they want. The reply carries the leased tasks,
+    and done=true once the username list is exhausted and every task is
+    settled. Final results go through the coordinator's SOCMED, so output,
+    checkpoint, display and metrics work as in a local run. The run gives up
+    once no worker has been connected for a whole lease period.
+    """
+    # Seconds between looks at whether the run has been abandoned
+    IDLE_CHECK_EVERY = 1.0
+
+    def __init__(self, socmed, queue, address):
+        self.socmed = socmed
+        self.queue = queue
+        self.address = address
+        self.producing = True
+        self.finished = threading.Event()
+        self.connected = set()
+        self.released = set()
+        self.connections = 0
+        self.last_seen = time.monotonic()
+        self.lock = threading.Lock()
+
+    def run(self, usernames, spawn=None):
+        """Queue every username on the selected platforms and wait until all tasks are settled.
+
+        spawn, if given, is called with the listening address once the
+        server is up, e.g. to start local worker processes.
+        """
+        server = self.serve()
+        workers = spawn(server.server_address) if spawn else []
+        started = time.perf_counter()
+        count = 0
+        try:
+            self.socmed.renderer.expect(self.queue.active())
+            tasks = []
+            for username in usernames:
+                count += 1
+                tasks += [(platform.name, self.socmed._key(platform.name, username), username)
+                          for platform in self.socmed._unfinished(username)]
+                if len(tasks) >= INSERT_BATCH:
+                    self.socmed.renderer.expect(self.queue.add(tasks))
+                    tasks = []
+            self.socmed.renderer.expect(self.queue.add(tasks))
+            self.producing = False
+            with self.lock:
+                # Workers get a full lease period from when the queue is complete
+                self.last_seen = time.monotonic()
+            self._check_finished()
+            while not self.finished.wait(self.IDLE_CHECK_EVERY):
+                self._check_abandoned()
+            elapsed = time.perf_counter() - started
+            for process in workers:
+                process.wait()
+            self._release_workers()
+        finally:
+            server.shutdown()
+            server.server_close()
+            for process in workers:
+                if process.poll() is None:
+                    process.terminate()
+
+        self.socmed.renderer.drain()
+        self._print_summary(count, elapsed)
+        return elapsed
+
+    def serve(self):
+        import socketserver
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                coordinator._connection(1)
+                try:
+                    for line in self.rfile:
+                        reply = coordinator.sync(json.loads(line))
+                        self.wfile.write(json.dumps(reply).encode() + b'\n')
+                        self.wfile.flush()
+                finally:
+                    coordinator._connection(-1)
+
+        server = socketserver.ThreadingTCPServer(self.address, Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def sync(self, message):
+        worker = message["worker"]
+        with self.lock:
+            self.connected.add(worker)
+            self.last_seen = time.monotonic()
+            self.socmed.bytes_read += message.get("bytes", 0)
+            self.socmed.cut_short += message.get("cut_short", 0)
+
+        results = {(name, self.socmed._key(name, username)): (username, status, data)
+                   for name, username, status, data in message["results"]}
+        final = self.queue.complete([(name, key, status) for (name, key), (_, status, _) in results.items()])
+        for name, key in final:
+            self._settle(worker, name, *results[(name, key)])
+
+        tasks = self.queue.lease(worker, message["want"])
+        if not tasks:
+            self._check_finished()
+        done = self.finished.is_set()
+        if done:
+            with self.lock:
+                self.released.add(worker)
+        return {"tasks": tasks, "done": done}
+
+    def _settle(self, worker, name, username, status, data):
+        socmed = self.socmed
+        if status in VERDICTS:
+            stats = data.get("stats")
+            display = PLATFORMS[name].display
+            socmed._emit(name, data, display(stats) if display and stats else stats, username)
+            return
+        if data is not None:
+            socmed._timed_save(name, data)
+        socmed._report_error(name, username, RuntimeError(f"{status} on worker {worker}"), status)
+
+    def _release_workers(self, grace=5.0):
+        """Keep serving until every worker has been told the run is over, or grace runs out"""
+        until = time.monotonic() + grace
+        while time.monotonic() < until:
+            with self.lock:
+                if self.released >= self.connected:
+                    return
+            time.sleep(0.05)
+
+    def _check_finished(self):
+        if not self.producing and not self.queue.active():
+            self.finished.set()
+
+    def _connection(self, change):
+        with self.lock:
+            self.connections += change
+            self.last_seen = time.monotonic()
+
+    def _check_abandoned(self):
+        """Give up when no worker is connected and none has synced for a lease period"""
+        with self.lock:
+            idle = time.monotonic() - self.last_seen
+            if self.connections or idle < self.queue.lease_seconds:
+                return
+        raise RuntimeError(f"No worker connected for {idle:.0f}s with {self.queue.active()} tasks unsettled; "
+                           f"start workers and rerun with --resume")
+
+    def _print_summary(self, count, elapsed):
+        socmed = self.socmed
+        if socmed.renderer.silent:
+            return
+        counts = self.queue.counts()
+        socmed._print_summary(count, elapsed, f"{len(self.connected)} workers")
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Distributed: {counts.get('done', 0)} tasks settled, "
+              f"{self.queue.retried} retried, {counts.get('failed', 0)} failed after {self.queue.retries} retries")
+        for worker, settled in sorted(self.queue.workers().items()):
+            socmed.logger.info(f"{worker}: {settled} tasks")
+
+# =============================================================== [WORKER] =============================================================== #
+
+class Outbox:
+    """Collects a worker's finished checks until the next sync.
+
+    Stands in for both the result writer and the checkpoint of the
+    worker's SOCMED: write() receives each record and mark() each outcome,
+    which always follows its record. A local writer, if given, still gets
+    every record.
+    """
+
+    def __init__(self, writer=None):
+        self.writer = writer
+        self.records = {}
+        self.results = []
+        self.lock = threading.Lock()
+
+    def write(self, data):
+        if self.writer:
+            self.writer.write(data)
+        with self.lock:
+            self.records[(data["platform"], data["username"])] = data
+
+    def flush(self):
+        if self.writer:
+            self.writer.flush()
+
+    def done(self, platform, username):
+        return False
+
+    def mark(self, platform, username, status):
+        with self.lock:
+            data = self.records.pop((PLATFORMS[platform].record, username), None)
+            self.results.append([platform, username, status, data])
+
+    def take(self):
+        with self.lock:
+            results, self.results = self.results, []
+        return results
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+class Worker:
+    """Pulls tasks from a coordinator and runs them on a SOCMED's thread pool"""
+
+    def __init__(self, socmed, address, poll=0.2):
+        self.socmed = socmed
+        self.address = address
+        self.poll = poll
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.outbox = Outbox(socmed.output)
+        socmed.output = socmed.checkpoint = self.outbox
+        self.sent = (0, 0)
+
+    def run(self):
+        socmed = self.socmed
+        max_pending = socmed.threads * 4
+        pending = set()
+        done = False
+        if socmed.hedge:
+            socmed.hedger = ThreadPoolExecutor(max_workers=socmed.threads * 2)
+
+        with socket.create_connection(self.address) as connection, \
+                ThreadPoolExecutor(max_workers=socmed.threads) as executor:
+            stream = connection.makefile('rwb')
+            while not done:
+                results = self.outbox.take()
+                want = max_pending - len(pending)
+                if not (results or want >= max_pending // 2 or not pending):
+                    _, pending = wait(pending, timeout=self.poll, return_when=FIRST_COMPLETED)
+                    continue
+
+                reply = self._sync(stream, results, want)
+                done = reply["done"]
+                pending |= self._submit(executor, reply["tasks"])
+                if pending:
+                    _, pending = wait(pending, timeout=self.poll, return_when=FIRST_COMPLETED)
+                elif not done:
+                    time.sleep(self.poll)
+
+    def _sync(self, stream, results, want):
+        socmed = self.socmed
+        # Transfer totals are sent as deltas so the coordinator can add them up
+        totals = (socmed.bytes_read, socmed.cut_short)
+        message = {
+            "worker": self.name,
+            "results": results,
+            "want": want,
+            "bytes": totals[0] - self.sent[0],
+            "cut_short": totals[1] - self.sent[1],
+        }
+        self.sent = totals
+        stream.write(json.dumps(message).encode() + b'\n')
+        stream.flush()
+        line = stream.readline()
+        if not line:
+            raise ConnectionError("Coordinator closed the connection")
+        return json.loads(line)
+
+    def _submit(self, executor, tasks):
+        """Start leased tasks, grouping those on platforms with a batch endpoint"""
+        socmed = self.socmed
+        futures = set()
+        batches = {}
+        for name, username in tasks:
+            batch = PLATFORMS[name].batch
+            if batch and min(socmed.batch_size, batch.size) > 1:
+                batches.setdefault(name, []).append(username)
+            else:
+                futures.add(executor.submit(socmed.check, name, username, socmed._deadline_for()))
+        for name, usernames in batches.items():
+            size = min(socmed.batch_size, PLATFORMS[name].batch.size)
+            for start in range(0, len(usernames), size):
+                target = unbatched(usernames[start:start + size])
+                check = socmed.check_batch if isinstance(target, list) else socmed.check
+                futures.add(executor.submit(check, name, target, socmed._deadline_for()))
+        return futures
+
+# Worker options passed on to locally spawned workers, as (attribute, flag)
+FORWARDED = (
+    ('threads', '-t'), ('rps', '--rps'), ('retries', '--retries'), ('connect_timeout', '--connect-timeout'),
+    ('read_timeout', '--read-timeout'), ('deadline', '--deadline'), ('max_bytes', '--max-bytes'),
+    ('pool_size', '--pool-size'), ('batch_size', '--batch-size'), ('base_url', '--base-url'),
+    ('proxies', '--proxies'),
+)
+FORWARDED_FLAGS = (
+    ('hedge', '--hedge'), ('http2', '--http2'), ('no_keep_alive', '--no-keep-alive'),
+    ('no_cache', '--no-cache'), ('refresh', '--refresh'), ('existence_only', '--existence-only'),
+)
+
+def spawn_workers(args, count):
+    """Return a callable that starts count local worker processes for a coordinator address"""
+    main = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+    def spawn(address):
+        command = [sys.executable, main, '--worker', f"{address[0]}:{address[1]}", '-q', '-d', 'silent']
+        for attribute, flag in FORWARDED:
+            value = getattr(args, attribute)
+            if value is not None:
+                command += [flag, str(value)]
+        command += [flag for attribute, flag in FORWARDED_FLAGS if getattr(args, attribute)]
+        return [subprocess.Popen(command) for _ in range(count)]
+    return spawn
@@ -0,0 +1,173 @@
+from html.parser import HTMLParser
+
+# Targeted extractors used by the checkers instead of full BeautifulSoup
+# trees. The tokenizer only builds nodes for elements a checker asked for
+# and stops reading the page as soon as every target has been found.
+
+class _Done(Exception):
+    pass
+
+class Node:
+    """A captured element: tag, attributes, and its captured children"""
+
+    def __init__(self, tag, attrs):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def has_class(self, *classes):
+        names = (self.attrs.get('class') or '').split()
+        return all(name in names for name in classes)
+
+    def strings(self):
+        for child in self.children:
+            if isinstance(child, Node):
+                yield from child.strings()
+            else:
+                yield child
+
+    def text(self):
+        """Same as BeautifulSoup's get_text(strip=True)"""
+        return ''.join(s.strip() for s in self.strings() if s.strip())
+
+    def find(self, tag, *classes, **attrs):
+        for node in self.find_all(tag, *classes, **attrs):
+            return node
+        return None
+
+    def find_all(self, tag, *classes, **attrs):
+        for child in self.children:
+            if isinstance(child, Node):
+                if _matches(child.tag, child.attrs, tag, classes, attrs):
+                    yield child
+                yield from child.find_all(tag, *classes, **attrs)
+
+class Target:
+    """Describe elements to capture: tag name, required classes and attributes.
+
+    Attribute values may be strings or compiled regexes. limit is the number
+    of matches after which the target is satisfied; None captures every
+    match and keeps the scan running to the end of the document.
+    """
+
+    def __init__(self, tag, *classes, limit=1, **attrs):
+        self.tag = tag
+        self.classes = classes
+        self.attrs = attrs
+        self.limit = limit
+
+    def matches(self, tag, attrs):
+        return _matches(tag, attrs, self.tag, self.classes, self.attrs)
+
+def _matches(tag, attrs, want_tag, classes, want_attrs):
+    if tag != want_tag:
+        return False
+    if classes:
+        names = (attrs.get('class') or '').split()
+        if not all(name in names for name in classes):
+            return False
+    for key, value in want_attrs.items():
+        actual = attrs.get(key)
+        if actual is None:
+            return False
+        if hasattr(value, 'search'):
+            if not value.search(actual):
+                return False
+        elif actual != value:
+            return False
+    return True
+
+# Elements that never have a closing tag
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr'
+}
+
+class _Scanner(HTMLParser):
+    def __init__(self, targets, stop_at=None):
+        super().__init__(convert_charrefs=True)
+        self.targets = targets
+        self.stop_at = stop_at
+        self.results = {key: [] for key in targets}
+        self.open = []  # stack of nodes currently being captured
+
+    def _satisfied(self):
+        return all(
+            target.limit is not None and len(self.results[key]) >= target.limit
+            for key, target in self.targets.items()
+        )
+
+    def handle_starttag(self, tag, attrs):
+        if tag == self.stop_at and not self.open:
+            raise _Done()
+
+        attrs = {key: value or '' for key, value in attrs}
+        node = None
+        for key, target in self.targets.items():
+            found = self.results[key]
+            if (target.limit is None or len(found) < target.limit) and target.matches(tag, attrs):
+                node = node or Node(tag, attrs)
+                found.append(node)
+
+        if self.open:
+            node = node or Node(tag, attrs)
+            self.open[-1].children.append(node)
+
+        if node is not None and tag not in VOID_TAGS:
+            self.open.append(node)
+        elif not self.open and self._satisfied():
+            raise _Done()
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if self.open and self.open[-1].tag == tag and tag not in VOID_TAGS:
+            self.open.pop()
+            self._check_done()
+
+    def handle_endtag(self, tag):
+        if tag == self.stop_at and not self.open:
+            raise _Done()
+        if not self.open:
+            return
+        # Close the innermost matching element, tolerating unclosed children
+        for index in range(len(self.open) - 1, -1, -1):
+            if self.open[index].tag == tag:
+                del self.open[index:]
+                break
+        self._check_done()
+
+    def handle_data(self, data):
+        if self.open:
+            self.open[-1].children.append(data)
+
+    def _check_done(self):
+        if not self.open and self._satisfied():
+            raise _Done()
+
+def scan(html, targets, stop_at=None):
+    """Capture the elements described by targets ({key: Target}) from html.
+
+    Returns {key: [Node, ...]}. Scanning stops once every target reached its
+    limit, or at the first stop_at tag (e.g. 'body' for head-only scans).
+    """
+    scanner = _Scanner(targets, stop_at=stop_at)
+    try:
+        scanner.feed(html)
+        scanner.close()
+    except _Done:
+        pass
+    return scanner.results
+
+def meta_content(html, attr, *names):
+    """Return {name: content} for <meta attr="name" content="..."> tags in <head>"""
+    targets = {name: Target('meta', **{attr: name}) for name in names}
+    found = scan(html, targets, stop_at='body')
+    return {name: nodes[0].get('content') for name, nodes in found.items() if nodes and 'content' in nodes[0].attrs}
+
+def first(html, tag, *classes, **attrs):
+    """Return the first element matching tag, classes and attrs, or None"""
+    nodes = scan(html, {'node': Target(tag, *classes, **attrs)})['node']
+    return nodes[0] if nodes else None
@@ -1,8 +1,7 @@
 import logging
-import coloredlogs
 
-def setup_logging(name=__name__):
-    """Configure colored logging with custom settings"""
+def setup_logging(name=__name__, plain=False):
+    """Configure colored logging with custom settings, or a plain handler for quiet runs"""
     logger = logging.getLogger(name)
     
     # Clear any existing handlers
@@ -10,6 +9,14 @@ def setup_logging(name=__name__):
         logger.handlers.clear()
 
     fmt = '%(asctime)s %(name)s[%(process)d] %(levelname)s %(message)s'
+    if plain:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(fmt, datefmt='%H:%M:%S'))
+        logger.addHandler(handler)
+        return logger
+
+    # coloredlogs pulls in humanfriendly, only import it when colours are wanted
+    import coloredlogs
     coloredlogs.install(
         logger=logger,
         fmt=fmt,
@@ -0,0 +1,194 @@
+import json, threading
+
+# Histogram upper bounds in seconds, Prometheus style (an implicit +Inf follows)
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Request phases timed for every fetch; "fetch" is the whole request and
+# "probe" a whole --existence-only probe, which is kept out of the others
+PHASES = ('connect', 'first_byte', 'body', 'fetch', 'probe', 'parse', 'write')
+
+# Outcome and event counters kept per platform
+COUNTERS = ('requests', 'found', 'not_found', 'error', 'blocked', 'timeout',
+            'cache_hits', 'coalesced', 'throttled', 'hedged', 'hedge_wins', 'bytes',
+            'probes', 'probe_hits', 'probe_bytes', 'skipped')
+
+class Histogram:
+    """Fixed-bucket latency histogram; cheap to update and to merge into text formats"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        index = 0
+        while index < len(BUCKETS) and seconds > BUCKETS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q):
+        """Estimate a quantile by interpolating inside the bucket that holds it"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = BUCKETS[index - 1] if index else 0.0
+                upper = BUCKETS[index] if index < len(BUCKETS) else BUCKETS[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return BUCKETS[-1]
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*map(str, BUCKETS), "+Inf"], self.counts)),
+        }
+
+class Metrics:
+    """Per-platform phase histograms and outcome counters, shared by all workers"""
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def observe(self, platform, phase, seconds):
+        with self.lock:
+            self._histogram(platform, phase).observe(seconds)
+
+    def observe_fetch(self, platform, body, probe=False):
+        """Record the phase timings and size of one fetched response"""
+        with self.lock:
+            counters = self._counters(platform)
+            if probe:
+                self._histogram(platform, 'probe').observe(body.timings['fetch'])
+                counters['probes'] += 1
+                counters['probe_bytes'] += body.size
+                return
+            for phase, seconds in body.timings.items():
+                self._histogram(platform, phase).observe(seconds)
+            counters['requests'] += 1
+            counters['bytes'] += body.size
+
+    def count(self, platform, counter, amount=1):
+        with self.lock:
+            self._counters(platform)[counter] += amount
+
+    def total(self, counter):
+        """Sum of one counter across platforms"""
+        with self.lock:
+            return sum(counters[counter] for counters in self.counters.values())
+
+    def fetch_cost(self, platform):
+        """(mean seconds, mean bytes) of platform's full fetches so far, or None before the first"""
+        with self.lock:
+            fetches = self.phases.get((platform, 'fetch'))
+            counters = self.counters.get(platform)
+            if not fetches or not fetches.count or not counters or not counters['requests']:
+                return None
+            return fetches.total / fetches.count, counters['bytes'] / counters['requests']
+
+    def merged(self, phase):
+        """One histogram of a phase across every platform"""
+        merged = Histogram()
+        with self.lock:
+            for (_, name), histogram in self.phases.items():
+                if name == phase:
+                    merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+                    merged.total += histogram.total
+                    merged.count += histogram.count
+        return merged
+
+    def _histogram(self, platform, phase):
+        key = (platform, phase)
+        if key not in self.phases:
+            self.phases[key] = Histogram()
+        return self.phases[key]
+
+    def _counters(self, platform):
+        if platform not in self.counters:
+            self.counters[platform] = dict.fromkeys(COUNTERS, 0)
+        return self.counters[platform]
+
+    def to_dict(self):
+        with self.lock:
+            stats = {}
+            for platform in sorted({platform for platform, _ in self.phases} | set(self.counters)):
+                stats[platform] = {
+                    "counters": dict(self.counters.get(platform, dict.fromkeys(COUNTERS, 0))),
+                    "phases": {
+                        phase: self.phases[(platform, phase)].to_dict()
+                        for phase in PHASES if (platform, phase) in self.phases
+                    },
+                }
+            return stats
+
+    def write_json(self, path):
+        with open(path, 'w') as handle:
+            json.dump(self.to_dict(), handle, indent=2)
+
+    def prometheus(self):
+        """Render every metric in the Prometheus text exposition format"""
+        lines = [
+            "# HELP osint_phase_seconds Time spent in each request phase",
+            "# TYPE osint_phase_seconds histogram",
+        ]
+        with self.lock:
+            for (platform, phase), histogram in sorted(self.phases.items()):
+                labels = f'platform="{platform}",phase="{phase}"'
+                cumulative = 0
+                for bound, count in zip([*map(str, BUCKETS), "+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append(f'osint_phase_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"osint_phase_seconds_sum{{{labels}}} {histogram.total:.6f}")
+                lines.append(f"osint_phase_seconds_count{{{labels}}} {histogram.count}")
+
+            lines += ["# HELP osint_events_total Requests, outcomes and retries per platform",
+                      "# TYPE osint_events_total counter"]
+            for platform, counters in sorted(self.counters.items()):
+                for counter, value in counters.items():
+                    if not counter.endswith('bytes'):
+                        lines.append(f'osint_events_total{{platform="{platform}",event="{counter}"}} {value}')
+
+            lines += ["# HELP osint_bytes_total Response bytes read per platform, for pages and probes",
+                      "# TYPE osint_bytes_total counter"]
+            for platform, counters in sorted(self.counters.items()):
+                lines.append(f'osint_bytes_total{{platform="{platform}",kind="page"}} {counters["bytes"]}')
+                lines.append(f'osint_bytes_total{{platform="{platform}",kind="probe"}} {counters["probe_bytes"]}')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host="127.0.0.1"):
+        """Expose /metrics (Prometheus text) and /stats.json on a background thread"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body, content_type = metrics.prometheus().encode(), 'text/plain; version=0.0.4'
+                elif self.path == '/stats.json':
+                    body, content_type = json.dumps(metrics.to_dict()).encode(), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
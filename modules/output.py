@@ -0,0 +1,209 @@
+import csv, gzip, io, json, os, threading, time
+from modules.records import Result
+
+# Output files are picked by extension:
+#   .jsonl           one JSON object per line, appended across runs
+#   .json            a single JSON array, rewritten on every run
+#   .csv             one typed row per record (see records.Result), appended across runs
+#   + .gz / .zst     gzip or zstandard (needs the zstandard package) compression
+#   .parquet/.arrow  typed columns in Parquet or Arrow IPC (needs pyarrow), rewritten on every run
+FORMATS = ('.jsonl', '.json', '.csv', '.parquet', '.arrow')
+COMPRESSION = ('.gz', '.zst')
+COLUMNAR = ('.parquet', '.arrow')
+
+def split_extension(path):
+    """Return (format, compression) for an output path, or (None, None) if unsupported"""
+    lower = path.lower()
+    compression = next((ext for ext in COMPRESSION if lower.endswith(ext)), None)
+    if compression:
+        lower = lower[:-len(compression)]
+    fmt = next((ext for ext in FORMATS if lower.endswith(ext)), None)
+    if fmt in COLUMNAR and compression:
+        # Parquet and Arrow compress internally
+        return None, None
+    return fmt, compression
+
+def open_writer(path):
+    """The result writer for path's format"""
+    fmt, _ = split_extension(path)
+    return ColumnarWriter(path) if fmt in COLUMNAR else ResultWriter(path)
+
+class ResultWriter:
+    """Long-lived, thread-safe writer for result records.
+
+    Records are serialised by the calling worker and buffered; the buffer
+    is written out in one call once batch_size records are queued or
+    flush_interval seconds have passed, and the file is fsync'd at most
+    every fsync_interval seconds. close() writes whatever is left and, for
+    .json output, the closing bracket of the array.
+    """
+
+    def __init__(self, path, batch_size=256, flush_interval=1.0, fsync_interval=5.0):
+        fmt, compression = split_extension(path)
+        if fmt is None:
+            raise ValueError(f"Unsupported output format: {path}")
+
+        self.path = path
+        self.array = fmt == '.json'
+        self.csv = fmt == '.csv'
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.buffer = []
+        self.count = 0
+        self.lock = threading.Lock()
+        self.last_flush = self.last_fsync = time.monotonic()
+
+        self.raw = open(path, 'wb' if self.array else 'ab')
+        # Checked before a compressor writes its own header
+        empty = self.raw.tell() == 0
+        if compression == '.gz':
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode='wb')
+        elif compression == '.zst':
+            try:
+                import zstandard
+            except ImportError:
+                self.raw.close()
+                raise RuntimeError("Writing .zst output requires the zstandard package")
+            self.stream = zstandard.ZstdCompressor().stream_writer(self.raw, closefd=False)
+        else:
+            self.stream = self.raw
+        if self.csv and empty:
+            self.stream.write(csv_line(Result.COLUMNS).encode('utf-8'))
+
+    def write(self, data):
+        line = csv_line(Result.from_dict(data).row()).rstrip('\n') if self.csv else json.dumps(data)
+        with self.lock:
+            self.buffer.append(line)
+            if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def _flush(self):
+        if self.buffer:
+            if self.array:
+                payload = (',\n' if self.count else '[\n') + ',\n'.join(self.buffer)
+            else:
+                payload = '\n'.join(self.buffer) + '\n'
+            self.stream.write(payload.encode('utf-8'))
+            self.count += len(self.buffer)
+            self.buffer = []
+
+        if self.stream is not self.raw:
+            self.stream.flush()
+        self.raw.flush()
+        now = time.monotonic()
+        self.last_flush = now
+        if now - self.last_fsync >= self.fsync_interval:
+            os.fsync(self.raw.fileno())
+            self.last_fsync = now
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            if self.array:
+                self.stream.write(b'\n]\n' if self.count else b'[]\n')
+            if self.stream is not self.raw:
+                self.stream.close()
+            self.raw.flush()
+            os.fsync(self.raw.fileno())
+            self.raw.close()
+
+class ColumnarWriter:
+    """Writer for Parquet or Arrow IPC output, built on pyarrow.
+
+    Records are reduced to typed Result rows and held in memory until
+    batch_size of them are waiting, then written as one row group or
+    record batch. Both formats need their footer, written by close(),
+    before the file can be read, so flush() does nothing.
+    """
+
+    def __init__(self, path, batch_size=65536):
+        try:
+            import pyarrow
+        except ImportError:
+            raise RuntimeError("Writing .parquet or .arrow output requires the pyarrow package")
+        self.pa = pyarrow
+        self.path = path
+        self.batch_size = batch_size
+        self.rows = []
+        self.count = 0
+        self.lock = threading.Lock()
+
+        labels = pyarrow.dictionary(pyarrow.int8(), pyarrow.string())
+        count = pyarrow.int64()
+        self.schema = pyarrow.schema([
+            ('platform', labels), ('username', pyarrow.string()), ('found', pyarrow.bool_()),
+            ('status', labels), ('url', pyarrow.string()), ('name', pyarrow.string()),
+            ('followers', count), ('following', count), ('likes', count), ('posts', count),
+        ])
+        if split_extension(path)[0] == '.parquet':
+            import pyarrow.parquet
+            self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        else:
+            import pyarrow.ipc
+            self.writer = pyarrow.ipc.new_file(path, self.schema)
+
+    def write(self, data):
+        row = Result.from_dict(data).row()
+        with self.lock:
+            self.rows.append(row)
+            if len(self.rows) >= self.batch_size:
+                self._write_rows()
+
+    def _write_rows(self):
+        if not self.rows:
+            return
+        columns = list(zip(*self.rows))
+        arrays = [self.pa.array(values, type=field.type) for values, field in zip(columns, self.schema)]
+        self.writer.write_batch(self.pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.count += len(self.rows)
+        self.rows = []
+
+    def flush(self):
+        pass
+
+    def close(self):
+        with self.lock:
+            self._write_rows()
+            self.writer.close()
+
+def csv_line(values):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerow(['' if value is None else value for value in values])
+    return buffer.getvalue()
+
+def export_records(path, writer):
+    """Copy every record of a .jsonl or .json output file into writer; returns how many"""
+    count = 0
+    for data in read_records(path):
+        writer.write(data)
+        count += 1
+    return count
+
+def read_records(path):
+    """Yield the records of a .jsonl or .json output file, compressed or not"""
+    fmt, compression = split_extension(path)
+    if fmt not in ('.jsonl', '.json'):
+        raise ValueError(f"Can only read records back from .jsonl or .json output: {path}")
+    if compression == '.gz':
+        handle = gzip.open(path, 'rt', encoding='utf-8')
+    elif compression == '.zst':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("Reading .zst output requires the zstandard package")
+        handle = io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True),
+                                  encoding='utf-8')
+    else:
+        handle = open(path, encoding='utf-8')
+    with handle:
+        if fmt == '.json':
+            yield from json.load(handle)
+            return
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,528 @@
+import json, re
+from urllib.parse import urlsplit
+from modules import extract
+from modules.headers import *
+
+# Markers after which a checker has everything it needs from a page
+HEAD_END = re.compile(r'</head>', re.IGNORECASE)
+TIKTOK_SHARE_META = re.compile(r'"shareMeta":\s*\{\s*"title":\s*"([^"]+)",\s*"desc":\s*"([^"]+)"\s*\}')
+SNAPCHAT_TITLE = re.compile(r'UserDetailsCard_title__K9Awz[^>]*>[^<]*</span>')
+
+class Platform:
+    """Declarative description of one platform check.
+
+    url and request_url are templates formatted with the username; the
+    request defaults to the public profile URL. parse(username, status,
+    text) decides whether the profile exists and extracts its stats in one
+    pass, returning (found, stats or None). display optionally maps saved
+    stats to the labels shown in the result box. batch optionally describes
+    an endpoint that answers for many usernames in one request, handle
+    the usernames the platform allows, and probe a cheap existence check
+    for --existence-only.
+    """
+
+    def __init__(self, name, label, record, url, headers, parse, request_url=None,
+                 params=None, allow_redirects=True, stop=None, display=None, batch=None, handle=None, probe=None):
+        self.name = name
+        self.label = label
+        self.record = record
+        self.url = url
+        self.headers = headers
+        self.parse = parse
+        self.request_url = request_url or url
+        self.params = params
+        self.allow_redirects = allow_redirects
+        self.stop = stop
+        self.display = display
+        self.batch = batch
+        self.handle = handle
+        self.probe = probe
+
+    def normalize(self, username):
+        """Canonical form of username on this platform, or None if it cannot exist here"""
+        return self.handle.normalize(username) if self.handle else username
+
+    def profile_url(self, username):
+        return self.url.format(username=username)
+
+    def request(self, username):
+        return {
+            "url": self.request_url.format(username=username),
+            "params": self.params(username) if self.params else None,
+            "headers": self.headers,
+            "allow_redirects": self.allow_redirects,
+            "stop": self.stop,
+        }
+
+    def result(self, username, status, text):
+        """Parse a response into (record, stats to display)"""
+        found, stats = self.parse(username, status, text)
+        return self.verdict(username, found, stats)
+
+    def probe_request(self, username):
+        request = self.request(username)
+        request.update(method=self.probe.method, allow_redirects=False, stop=None,
+                       max_bytes=self.probe.range_bytes, probe=True)
+        if self.probe.range_bytes:
+            request["headers"] = {**request["headers"], "Range": f"bytes=0-{self.probe.range_bytes - 1}"}
+        return request
+
+    def batch_request(self, usernames):
+        return {
+            "url": self.batch.url,
+            "params": self.batch.params(usernames),
+            "headers": self.headers,
+            "allow_redirects": self.allow_redirects,
+            "stop": None,
+            "max_bytes": None,
+        }
+
+    def batch_results(self, usernames, status, text):
+        """Parse a batch response into {username: (record, stats to display)}"""
+        verdicts = self.batch.parse(usernames, status, text)
+        return {username: self.verdict(username, *verdicts[username]) for username in usernames}
+
+    def verdict(self, username, found, stats):
+        data = {
+            "platform": self.record,
+            "username": username,
+            "found": found,
+            "status": "found" if found else "not_found",
+            "url": self.profile_url(username)
+        }
+        if stats is not None:
+            data["stats"] = stats
+        shown = self.display(stats) if self.display and stats else stats
+        return data, shown
+
+    def failure(self, username, status):
+        """Record for a lookup that produced no verdict, e.g. status 'blocked'"""
+        return {
+            "platform": self.record,
+            "username": username,
+            "found": None,
+            "status": status,
+            "url": self.profile_url(username)
+        }
+
+class Batch:
+    """Batched lookup endpoint for a platform.
+
+    params(usernames) builds the query for up to size usernames and
+    parse(usernames, status, text) returns {username: (found, stats)}.
+    """
+
+    def __init__(self, url, params, parse, size=100):
+        self.url = url
+        self.params = params
+        self.parse = parse
+        self.size = size
+
+def unbatched(usernames):
+    """A batch of one as a plain username, so it goes through the platform's single-profile request"""
+    return usernames[0] if len(usernames) == 1 else usernames
+
+class Probe:
+    """Existence check that skips the page: a HEAD, or a GET of the first range_bytes.
+
+    verdict(status) returns True or False when the status settles it, and
+    None when only the full page can tell.
+    """
+
+    def __init__(self, verdict, method='HEAD', range_bytes=None):
+        self.verdict = verdict
+        self.method = method
+        self.range_bytes = range_bytes
+
+def probe_lemon8(status):
+    # Missing profiles redirect to the home page
+    if status == 200:
+        return True
+    if 300 <= status < 400:
+        return False
+    return None
+
+def probe_page(status):
+    # Threads and Snapchat serve any existing profile with a 2xx and answer a missing one with 404,
+    # which their parsers also read as not found; other errors need the page to diagnose
+    if status in (200, 206):
+        return True
+    return False if status == 404 else None
+
+class Handle:
+    """Username rules for a platform: the allowed pattern and whether case matters"""
+
+    def __init__(self, pattern, case_sensitive=False):
+        self.pattern = re.compile(pattern)
+        self.case_sensitive = case_sensitive
+
+    def normalize(self, username):
+        if not self.pattern.fullmatch(username):
+            return None
+        return username if self.case_sensitive else username.lower()
+
+# Letters, digits, periods and underscores; no trailing or doubled period
+INSTAGRAM_HANDLE = Handle(r'(?!.*\.\.)(?!.*\.$)[A-Za-z0-9._]{1,30}')
+TIKTOK_HANDLE = Handle(r'(?!.*\.$)[A-Za-z0-9._]{2,24}')
+
+# =============================================================== [INSTAGRAM] =============================================================== #
+
+def parse_instagram(username, status, text):
+    og_desc = extract.first(text, "meta", property="og:description")
+
+    if og_desc:
+        og_content = og_desc.get("content", "").strip()
+
+        # Check if it matches this profile; Instagram handles are case-insensitive
+        handle = username.lower()
+        lowered = og_content.lower()
+        if f"@{handle}" in lowered or f"&#064;{handle}" in lowered:
+            match = re.search(r"([\d,\.]+)\s+Followers,\s+([\d,\.]+)\s+Following,\s+([\d,\.]+)\s+Posts", og_content)
+            if match:
+                followers, following, posts = match.groups()
+            else:
+                followers = following = posts = "0"
+
+            stats = {
+                "Followers": followers,
+                "Following": following,
+                "Posts": posts
+            }
+            return True, stats
+
+    # fallback to old title-based check
+    title_start = text.find('<title>')
+    title_end = text.find('</title>')
+
+    if title_start == -1 or title_end == -1:
+        return False, None
+
+    title = text[title_start + 7:title_end].strip()
+    handle, lowered = username.lower(), title.lower()
+    found = (f"@{handle})" in lowered or f"&#064;{handle})" in lowered) and "Instagram photos and videos" in title
+    return found, None
+
+# =============================================================== [FACEBOOK] =============================================================== #
+
+def parse_facebook(username, status, text):
+
+    if status == 200 and "userVanity" in text:
+        name_match = re.search(r'"name":"([^"]+)"', text)
+        profile_name = name_match.group(1) if name_match else "Unknown"
+
+        return True, {
+            "name": profile_name,
+            "vanity": "Available"
+        }
+
+    if status == 200 and "content=\"profile\"" in text:
+        return True, None
+
+    return False, None
+
+def display_facebook(stats):
+    return {
+        "Profile Name": stats["name"],
+        "Vanity URL": "✔️ Available"
+    }
+
+# =============================================================== [TIKTOK] =============================================================== #
+
+def parse_tiktok(username, status, text):
+    match = TIKTOK_SHARE_META.search(text)
+
+    if not match:
+        return False, None
+
+    desc = match.group(2)
+
+    username_match = re.search(r'@([^\s]+)', desc)
+    followers_match = re.search(r'([\d.]+[kKmM]?)\sFollowers', desc)
+    following_match = re.search(r'([\d.]+[kKmM]?)\sFollowing', desc)
+    likes_match = re.search(r'([\d.]+[kKmM]?)\sLikes', desc)
+
+    stats = {
+        "Username": username_match.group(0) if username_match else "@UNKNOWN",
+        "Followers": followers_match.group(1) if followers_match else "0",
+        "Following": following_match.group(1) if following_match else "0",
+        "Likes": likes_match.group(1) if likes_match else "0"
+    }
+    return True, stats
+
+# =============================================================== [TWITTER/X] =============================================================== #
+
+def x_params(username):
+    return {
+        'variables': json.dumps({"screen_name": username}, separators=(',', ':')),
+        'features': '{"responsive_web_grok_bio_auto_translation_is_enabled":false,"hidden_profile_subscriptions_enabled":true,"payments_enabled":false,"profile_label_improvements_pcf_label_in_post_enabled":true,"rweb_tipjar_consumption_enabled":true,"verified_phone_label_enabled":false,"subscriptions_verification_info_is_identity_verified_enabled":true,"subscriptions_verification_info_verified_since_enabled":true,"highlights_tweets_tab_ui_enabled":true,"responsive_web_twitter_article_notes_tab_enabled":true,"subscriptions_feature_can_gift_premium":true,"creator_subscriptions_tweet_preview_api_enabled":true,"responsive_web_graphql_skip_user_profile_image_extensions_enabled":false,"responsive_web_graphql_timeline_navigation_enabled":true}',
+        'fieldToggles': '{"withAuxiliaryUserLabels":true}',
+    }
+
+def parse_x(username, status, text):
+    if status != 200:
+        return False, None
+
+    data = json.loads(text)
+    user = data.get("data", {}).get("user", {}).get("result")
+    if not user:
+        return False, None
+
+    stats = {
+        "Username": user["core"]["screen_name"] + " (" + user["core"]["name"] + ")",
+        "Followers": user["legacy"]["followers_count"],
+        "Following": user["legacy"]["friends_count"],
+    }
+    return True, stats
+
+def x_batch_params(usernames):
+    return {'screen_name': ','.join(usernames), 'include_entities': 'false'}
+
+def parse_x_batch(usernames, status, text):
+    # users/lookup answers 404 when none of the names exist and leaves
+    # missing names out of the list otherwise
+    if status == 404:
+        return {username: (False, None) for username in usernames}
+    if status != 200:
+        raise ValueError(f"Unexpected HTTP {status}")
+
+    users = {user["screen_name"].lower(): user for user in json.loads(text)}
+    results = {}
+    for username in usernames:
+        user = users.get(username.lower())
+        if user is None:
+            results[username] = (False, None)
+            continue
+        results[username] = (True, {
+            "Username": user["screen_name"] + " (" + user["name"] + ")",
+            "Followers": user["followers_count"],
+            "Following": user["friends_count"],
+        })
+    return results
+
+# =============================================================== [TELEGRAM] =============================================================== #
+
+def parse_telegram(username, status, text):
+    meta = extract.meta_content(text, 'property', 'og:title', 'og:description', 'twitter:image')
+
+    og_title = meta.get('og:title')
+    og_description = meta.get('og:description')
+    twitter_image = meta.get('twitter:image')
+
+    if og_title and og_description and twitter_image:
+        stats = {
+            "Name": og_title,
+            "Desc": og_description,
+            "Image": twitter_image
+        }
+        return True, stats
+
+    return False, None
+
+# =============================================================== [LEMON8] =============================================================== #
+
+def parse_lemon8(username, status, text):
+    if status != 200:
+        return False, None
+
+    found = extract.scan(text, {
+        'profile': extract.Target('div', 'user-desc-main'),
+        'name': extract.Target('h1', 'user-desc-base-name'),
+        'items': extract.Target('a', 'user-desc-main-info-item', limit=3),
+    })
+
+    if not found['profile']:
+        return False, None
+
+    display_name_tag = found['name'][0] if found['name'] else None
+    display_name = display_name_tag.text() if display_name_tag else "Unknown"
+
+    following = followers = likes_saves = "0"
+
+    for item in found['items']:
+        spans = list(item.find_all('span'))
+        if len(spans) >= 2:
+            value = spans[0].text()
+            label = spans[1].text().lower()
+
+            if 'mengikuti' in label or 'following' in label:
+                following = value
+            elif 'pengikut' in label or 'followers' in label:
+                followers = value
+            elif 'suka dan simpanan' in label or 'likes and saves' in label:
+                likes_saves = value
+
+    stats = {
+        "Name": display_name,
+        "Following": following,
+        "Followers": followers,
+        "Likes/Saves": likes_saves
+    }
+    return True, stats
+
+# =============================================================== [THREADS] =============================================================== #
+
+def parse_threads(username, status, text):
+    # A missing profile is a bare 404, as its existence-only probe sees it
+    if status == 404:
+        return False, None
+    if status >= 400:
+        raise ValueError(f"Unexpected HTTP {status}")
+    profile = extract.first(text, 'div', 'user-desc-main')
+    if profile:
+        title_tag = profile.find('h1', 'user-desc-base-name')
+        title     = title_tag.text() if title_tag else username
+        followers = (
+            profile.find('span', title=re.compile(r'^\d'))
+            .get('title', '0')
+        )
+    else:
+        head = extract.scan(text, {
+            'meta': extract.Target('meta', name='twitter:description'),
+            'title': extract.Target('title'),
+        })
+        # twitter:description meta fallback
+        meta = head['meta'][0] if head['meta'] else None
+        if meta and 'content' in meta.attrs:
+            desc = meta.get('content')
+            m = re.search(r'(?P<followers>\d+)\s+Followers', desc, re.IGNORECASE)
+            followers = m.group('followers') if m else "0"
+        else:
+            # Sibling lookups need the full tree, only built for this rare layout
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(text, 'html.parser')
+            span = soup.find('span', title=re.compile(r'^\d+'))
+            sib  = span.find_next_sibling(string=re.compile(r'followers?', re.IGNORECASE)) if span else None
+            if span and sib:
+                followers = span['title']
+            else:
+                raise ValueError("Could not find followers count")
+
+        # page-title fallback
+        page_title = head['title'][0].text()
+        title = re.split(r'\s*\(@', page_title, 1)[0]
+
+    # **STRIP ANY “ • …” SUFFIX FROM TITLE**
+    title = re.sub(r'\s*•.*$', '', title)
+
+    stats = {
+        "Name": title,
+        "Followers": followers,
+    }
+    return True, stats
+
+# =============================================================== [SNAPCHAT] =============================================================== #
+
+def parse_snapchat(username, status, text):
+    # A missing profile is a bare 404, as its existence-only probe sees it
+    if status == 404:
+        return False, None
+    if status >= 400:
+        raise ValueError(f"Unexpected HTTP {status}")
+    el = extract.first(text, 'span', 'UserDetailsCard_title__K9Awz', 'UserDetailsCard_oneLineTruncation__z0qou')
+    title = el.text() if el else None
+    stats = {
+        "Name": title,
+    }
+    return True, stats
+
+# =============================================================== [REGISTRY] =============================================================== #
+
+PLATFORMS = {}
+
+def register(platform):
+    PLATFORMS[platform.name] = platform
+    return platform
+
+register(Platform(
+    "instagram", "Instagram", "instagram",
+    url="https://www.instagram.com/{username}",
+    headers=instagram_headers,
+    parse=parse_instagram,
+    stop=HEAD_END,
+    handle=INSTAGRAM_HANDLE
+))
+register(Platform(
+    "facebook", "Facebook", "facebook",
+    url="https://www.facebook.com/{username}",
+    headers=facebook_headers,
+    parse=parse_facebook,
+    allow_redirects=False,
+    display=display_facebook,
+    handle=Handle(r'[A-Za-z0-9.]{5,50}')
+))
+register(Platform(
+    "tiktok", "TikTok", "tiktok",
+    url="https://www.tiktok.com/@{username}",
+    headers=tiktok_headers,
+    parse=parse_tiktok,
+    stop=TIKTOK_SHARE_META,
+    handle=TIKTOK_HANDLE
+))
+register(Platform(
+    "x", "X", "X",
+    url="https://x.com/{username}",
+    request_url="https://api.x.com/graphql/x3RLKWW1Tl7JgU7YtGxuzw/UserByScreenName",
+    headers=x_headers,
+    parse=parse_x,
+    params=x_params,
+    batch=Batch("https://api.x.com/1.1/users/lookup.json", x_batch_params, parse_x_batch),
+    handle=Handle(r'[A-Za-z0-9_]{1,15}')
+))
+register(Platform(
+    "telegram", "Telegram", "Telegram",
+    url="https://t.me/{username}",
+    request_url="https://telegram.me/{username}",
+    headers=telegram_headers,
+    parse=parse_telegram,
+    stop=HEAD_END,
+    handle=Handle(r'[A-Za-z][A-Za-z0-9_]{3,30}[A-Za-z0-9]')
+))
+register(Platform(
+    "lemon8", "Lemon8", "lemon8",
+    url="https://www.lemon8-app.com/@{username}",
+    headers=lemon8_headers,
+    parse=parse_lemon8,
+    allow_redirects=False,
+    handle=TIKTOK_HANDLE,
+    probe=Probe(probe_lemon8)
+))
+register(Platform(
+    "threads", "Threads", "threads",
+    url="https://www.threads.com/@{username}",
+    headers=threads_headers,
+    parse=parse_threads,
+    allow_redirects=False,
+    handle=INSTAGRAM_HANDLE,
+    probe=Probe(probe_page)
+))
+register(Platform(
+    "snapchat", "Snapchat", "snapchat",
+    url="https://www.snapchat.com/@{username}",
+    headers=snapchat_headers,
+    parse=parse_snapchat,
+    allow_redirects=False,
+    stop=SNAPCHAT_TITLE,
+    handle=Handle(r'[A-Za-z][A-Za-z0-9._-]{1,13}[A-Za-z0-9]'),
+    probe=Probe(probe_page, method='GET', range_bytes=1024)
+))
+
+def select_platforms(names=None):
+    """Return registered platforms by name, in registry order, without duplicates"""
+    if not names:
+        return list(PLATFORMS.values())
+    unknown = [name for name in names if name not in PLATFORMS]
+    if unknown:
+        raise ValueError(f"Unknown platform(s): {', '.join(unknown)}")
+    return [platform for name, platform in PLATFORMS.items() if name in names]
+
+def use_base_url(base_url):
+    """Point every platform's requests at base_url/<platform>/<original path>.
+
+    Used to run the checkers against a local stand-in server; profile URLs
+    in the records are left unchanged.
+    """
+    base_url = base_url.rstrip('/')
+    for platform in PLATFORMS.values():
+        platform.request_url = f"{base_url}/{platform.name}{urlsplit(platform.request_url).path}"
+        if platform.batch:
+            platform.batch.url = f"{base_url}/{platform.name}{urlsplit(platform.batch.url).path}"
@@ -0,0 +1,163 @@
+import random, threading, time
+from urllib.parse import urlsplit
+from modules.ratelimit import RateLimiter
+from modules.transport import build_session, connection_stats
+
+# Weight given to the newest sample in a proxy's latency average
+LATENCY_ALPHA = 0.2
+
+# Latency assumed for a proxy that has not answered a platform yet, in seconds
+UNKNOWN_LATENCY = 1.0
+
+# Outcomes recorded for every request sent through a proxy
+OUTCOMES = ('ok', 'blocked', 'timeout', 'error')
+
+class ProxyHealth:
+    """How one proxy is doing on one platform"""
+
+    def __init__(self):
+        self.requests = 0
+        self.ok = 0
+        self.latency = None
+        self.strikes = 0
+        self.quarantines = 0
+        self.quarantined_until = 0.0
+
+    def weight(self, prior):
+        """Selection weight: smoothed success rate over average latency"""
+        success = (self.ok + 1) / (self.requests + 2)
+        return success / max(self.latency or prior, 0.01)
+
+class Proxy:
+    """One egress proxy with its own session, connection pools and rate limits"""
+
+    def __init__(self, url, session, limiter):
+        self.url = url
+        parts = urlsplit(url)
+        # Credentials stay out of logs and summaries
+        self.label = f"{parts.scheme}://{parts.hostname}:{parts.port}" if parts.port else f"{parts.scheme}://{parts.hostname}"
+        self.session = session
+        self.limiter = limiter
+        self.health = {}
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        self.seconds = 0.0
+
+class ProxyPool:
+    """Routes each request through the proxy most likely to answer it quickly.
+
+    Proxies are picked at random, weighted per platform by success rate
+    over average latency, so fast healthy proxies take most of the traffic
+    while slower ones keep being sampled. After strikes consecutive
+    blocks, timeouts or errors on a platform, a proxy is quarantined there
+    for quarantine seconds, doubling on each repeat up to max_quarantine.
+    """
+
+    def __init__(self, urls, session_options=None, limiter_options=None,
+                 strikes=3, quarantine=60.0, max_quarantine=3600.0):
+        if not urls:
+            raise ValueError("The proxy list is empty")
+        self.strikes = strikes
+        self.quarantine = quarantine
+        self.max_quarantine = max_quarantine
+        self.proxies = [
+            Proxy(url, make_session(url, **(session_options or {})), RateLimiter(**(limiter_options or {})))
+            for url in urls
+        ]
+        self.lock = threading.Lock()
+
+    def choose(self, name):
+        now = time.monotonic()
+        with self.lock:
+            healths = [proxy.health.setdefault(name, ProxyHealth()) for proxy in self.proxies]
+            ready = [(proxy, health) for proxy, health in zip(self.proxies, healths) if health.quarantined_until <= now]
+            if not ready:
+                # Every proxy is quarantined here; use the one released soonest
+                return min(zip(self.proxies, healths), key=lambda pair: pair[1].quarantined_until)[0]
+            known = [health.latency for _, health in ready if health.latency is not None]
+            prior = sum(known) / len(known) if known else UNKNOWN_LATENCY
+            weights = [health.weight(prior) for _, health in ready]
+        return random.choices([proxy for proxy, _ in ready], weights)[0]
+
+    def record(self, proxy, name, outcome, seconds=None):
+        """Record a request's outcome for proxy on platform name, quarantining it on repeated failures"""
+        with self.lock:
+            health = proxy.health.setdefault(name, ProxyHealth())
+            health.requests += 1
+            proxy.counts[outcome] += 1
+            if seconds is not None:
+                proxy.seconds += seconds
+            if outcome == 'ok':
+                health.ok += 1
+                health.strikes = 0
+                if seconds is not None:
+                    health.latency = seconds if health.latency is None else \
+                        health.latency + LATENCY_ALPHA * (seconds - health.latency)
+                return
+
+            # Requests already in flight when the proxy was quarantined do not extend it
+            if health.quarantined_until > time.monotonic():
+                return
+            health.strikes += 1
+            if health.strikes >= self.strikes:
+                health.strikes = 0
+                period = min(self.max_quarantine, self.quarantine * 2 ** health.quarantines)
+                health.quarantined_until = time.monotonic() + period
+                health.quarantines += 1
+
+    def connection_stats(self):
+        stats = {}
+        for proxy in self.proxies:
+            for host, entry in connection_stats(proxy.session).items():
+                total = stats.setdefault(host, {"new": 0, "reused": 0})
+                total["new"] += entry["new"]
+                total["reused"] += entry["reused"]
+        return stats
+
+    def summary(self):
+        """Per-proxy totals: requests, outcome counts, average latency and quarantines"""
+        with self.lock:
+            rows = []
+            for proxy in self.proxies:
+                requests = sum(proxy.counts.values())
+                timed = proxy.counts['ok'] + proxy.counts['blocked']
+                rows.append({
+                    "proxy": proxy.label,
+                    "requests": requests,
+                    **proxy.counts,
+                    "avg_ms": proxy.seconds / timed * 1000 if timed else None,
+                    "quarantines": sum(health.quarantines for health in proxy.health.values()),
+                })
+            return rows
+
+def make_session(url, **options):
+    session = build_session(**options)
+    session.proxies = {"http": url, "https": url}
+    return session
+
+def load_proxies(path):
+    """Read proxy URLs one per line (scheme://[user:pass@]host:port), skipping blanks and # comments"""
+    with open(path, encoding='utf-8') as handle:
+        urls = [line.strip() for line in handle if line.strip() and not line.lstrip().startswith('#')]
+    for url in urls:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https', 'socks5', 'socks5h') or not parts.hostname:
+            raise ValueError(f"Not a proxy URL: {url}")
+    if any(url.startswith('socks') for url in urls):
+        try:
+            import socks  # noqa: F401
+        except ImportError:
+            raise RuntimeError("SOCKS proxies require the PySocks package (pip install requests[socks])")
+    return urls
+
+def load_proxy_settings(config):
+    """Read [proxies] options from config.ini: strikes, quarantine and max_quarantine"""
+    if not config.has_section('proxies'):
+        return {}
+    section = config['proxies']
+    settings = {}
+    if 'strikes' in section:
+        settings['strikes'] = section.getint('strikes')
+    for key in ('quarantine', 'max_quarantine'):
+        if key in section:
+            settings[key] = section.getfloat(key)
+    return settings
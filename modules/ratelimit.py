@@ -0,0 +1,109 @@
+import random, threading, time
+from email.utils import parsedate_to_datetime
+
+# Status codes that mean "slow down" rather than "profile not found"
+THROTTLE_STATUSES = (429, 503)
+
+class Blocked(Exception):
+    """Raised when a platform keeps throttling after every retry"""
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate adapts to throttling.
+
+    The rate starts at ceiling requests per second, halves on every
+    throttled response and climbs back by a twentieth of the ceiling per
+    success (AIMD). Retry-After pauses the whole bucket until it expires.
+    """
+
+    def __init__(self, ceiling, burst=None, floor=0.1):
+        self.ceiling = ceiling
+        self.floor = min(floor, ceiling)
+        self.rate = ceiling
+        self.capacity = burst or max(1.0, ceiling)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how many seconds to wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def try_acquire(self):
+        """Take a token only if one is available right now"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1 or now < self.paused_until:
+                return False
+            self.tokens -= 1
+            return True
+
+    def throttled(self, retry_after=None):
+        with self.lock:
+            self.rate = max(self.floor, self.rate / 2)
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+    def succeeded(self):
+        with self.lock:
+            self.rate = min(self.ceiling, self.rate + self.ceiling / 20)
+
+class RateLimiter:
+    """One adaptive token bucket per platform host, shared by every worker"""
+
+    def __init__(self, default_rps=10.0, platform_rps=None, retries=3, backoff_base=1.0, backoff_cap=60.0):
+        self.default_rps = default_rps
+        self.platform_rps = platform_rps or {}
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, name):
+        with self.lock:
+            if name not in self.buckets:
+                self.buckets[name] = TokenBucket(self.platform_rps.get(name, self.default_rps))
+            return self.buckets[name]
+
+    def reserve(self, name):
+        return self.bucket(name).reserve()
+
+    def try_acquire(self, name):
+        return self.bucket(name).try_acquire()
+
+    def throttled(self, name, headers):
+        self.bucket(name).throttled(parse_retry_after(headers.get('retry-after')))
+
+    def succeeded(self, name):
+        self.bucket(name).succeeded()
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff for the given retry attempt"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+def parse_retry_after(value):
+    """Return Retry-After in seconds from either a delay or an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def load_rate_limits(config):
+    """Read per-platform requests-per-second ceilings from [rate_limits] in config.ini"""
+    if not config.has_section('rate_limits'):
+        return {}
+    return {name: config.getfloat('rate_limits', name) for name in config.options('rate_limits')}
@@ -0,0 +1,119 @@
+import enum, re
+from modules.platforms import PLATFORMS
+
+# Platforms by registry name, valued by the "platform" string their records carry
+PlatformId = enum.Enum('PlatformId', {name: platform.record for name, platform in PLATFORMS.items()})
+
+class Status(enum.Enum):
+    FOUND = 'found'
+    NOT_FOUND = 'not_found'
+    ERROR = 'error'
+    BLOCKED = 'blocked'
+    TIMEOUT = 'timeout'
+    SKIPPED = 'skipped'
+
+# Stats keys checkers use for each count, mapped to Result fields
+COUNT_KEYS = {
+    'Followers': 'followers',
+    'Following': 'following',
+    'Likes': 'likes',
+    'Likes/Saves': 'likes',
+    'Posts': 'posts',
+}
+
+# Stats keys holding the profile's display name, in order of preference
+NAME_KEYS = ('Name', 'name', 'Username')
+
+# Count suffixes, including Indonesian ribu/juta/miliar from Lemon8's localised pages
+MULTIPLIERS = {'k': 10 ** 3, 'rb': 10 ** 3, 'm': 10 ** 6, 'jt': 10 ** 6, 'b': 10 ** 9, 'miliar': 10 ** 9}
+
+COUNT = re.compile(r'^([\d.,]+)\s*(k|rb|m|jt|b|miliar)?\+?$', re.IGNORECASE)
+
+# Digits grouped in threes, like 12,345 or 1.234.567
+GROUPED = re.compile(r'^\d{1,3}([.,]\d{3})+$')
+
+def parse_count(value):
+    """Turn a displayed count like 1.2M, 12,345, 3,4 rb or 987 into an int, or None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    match = COUNT.match(str(value).replace('\xa0', ' ').strip())
+    if not match:
+        return None
+    digits, suffix = match.groups()
+    if suffix:
+        # 1.2M, and 1,2 jt where the comma is the decimal point
+        if '.' not in digits and digits.count(',') == 1 and len(digits.split(',')[1]) < 3:
+            digits = digits.replace(',', '.')
+        try:
+            return round(float(digits.replace(',', '')) * MULTIPLIERS[suffix.lower()])
+        except ValueError:
+            return None
+    # Without a suffix, commas and dots are only thousands separators; 1.5 is not a count
+    if digits.isdigit():
+        return int(digits)
+    if GROUPED.match(digits):
+        return int(digits.replace(',', '').replace('.', ''))
+    return None
+
+class Result:
+    """One check's outcome, small enough to hold millions of.
+
+    Slots instead of a dict, the platform and status as enums, the profile
+    URL derived on demand and the displayed stats reduced to a display
+    name and integer counts. Counts a platform does not report are None.
+    """
+    __slots__ = ('platform', 'username', 'status', 'name', 'followers', 'following', 'likes', 'posts')
+
+    # Export columns, in order
+    COLUMNS = ('platform', 'username', 'found', 'status', 'url', 'name', 'followers', 'following', 'likes', 'posts')
+
+    def __init__(self, platform, username, status, name=None, followers=None, following=None, likes=None, posts=None):
+        self.platform = platform
+        self.username = username
+        self.status = status
+        self.name = name
+        self.followers = followers
+        self.following = following
+        self.likes = likes
+        self.posts = posts
+
+    @property
+    def found(self):
+        if self.status is Status.FOUND:
+            return True
+        return False if self.status is Status.NOT_FOUND else None
+
+    @property
+    def url(self):
+        return PLATFORMS[self.platform.name].profile_url(self.username)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Result from a record as written to .jsonl output.
+
+        Records missing a username or status, such as ones written before
+        records had a status, get an empty username and a status taken from
+        "found", or error when that is missing too.
+        """
+        status = data.get("status")
+        if status is None:
+            found = data.get("found")
+            status = 'error' if found is None else 'found' if found else 'not_found'
+        result = cls(PlatformId(data["platform"]), data.get("username") or '', Status(status))
+        stats = data.get("stats")
+        if stats:
+            for key, field in COUNT_KEYS.items():
+                if key in stats:
+                    setattr(result, field, parse_count(stats[key]))
+            result.name = next((str(stats[key]) for key in NAME_KEYS if stats.get(key) is not None), None)
+        return result
+
+    def row(self):
+        """Values in COLUMNS order, with the enums as their record strings"""
+        return (self.platform.value, self.username, self.found, self.status.value, self.url,
+                self.name, self.followers, self.following, self.likes, self.posts)
+
+    def __repr__(self):
+        return f"Result({self.platform.name}, @{self.username}, {self.status.value})"
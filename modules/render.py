@@ -0,0 +1,216 @@
+import queue, sys, threading, time
+from colorama import Fore, Style
+
+MODES = ('box', 'compact', 'progress', 'silent')
+
+# Progress bar width in characters
+BAR_WIDTH = 30
+
+class Renderer:
+    """Console output for results, written by a single background thread.
+
+    Workers only queue result tuples; the writer thread formats whatever
+    has piled up and writes it with one call, so output never interleaves
+    and a slow terminal does not stall the checks. Modes:
+
+        box       the bordered result boxes
+        compact   one line per result
+        progress  a live progress bar, with found profiles printed above it
+        silent    nothing, for machine pipelines that read the output file
+    """
+
+    def __init__(self, mode='box', start_time=None, stream=None, refresh=0.1, max_queued=10000):
+        if mode not in MODES:
+            raise ValueError(f"Unknown display mode: {mode}")
+        self.mode = mode
+        self.start_time = start_time or time.strftime("%Y-%m-%d %H:%M:%S")
+        self.stream = stream or sys.stdout
+        self.refresh = refresh
+        self.queue = queue.Queue(maxsize=max_queued)
+        self.thread = None
+        self.lock = threading.Lock()
+
+        self.expected = 0
+        self.done = 0
+        self.found = 0
+        self.missing = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.bar_shown = False
+        self.active = False
+
+    @property
+    def silent(self):
+        return self.mode == 'silent'
+
+    def expect(self, count):
+        """Add count checks to the progress total"""
+        with self.lock:
+            self.expected += count
+
+    def skip(self, count=1):
+        """Take count checks that will not run off the progress total"""
+        with self.lock:
+            self.expected -= count
+
+    def result(self, platform, found, url, stats=None, username=None, status=None):
+        self._put(('result', platform, found, url, stats, username, status))
+
+    def error(self, label, username, status="error"):
+        self._put(('error', label, username, status))
+
+    def drain(self):
+        """Block until everything queued so far has been written"""
+        if self.thread is None:
+            return
+        written = threading.Event()
+        self.queue.put(('drain', written))
+        written.wait()
+
+    def close(self):
+        if self.thread is None:
+            return
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+
+    def _put(self, item):
+        if self.silent:
+            return
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.started = time.monotonic()
+                    self.thread = threading.Thread(target=self._run, name="renderer", daemon=True)
+                    self.thread.start()
+        self.queue.put(item)
+
+# =============================================================== [WRITER] =============================================================== #
+
+    def _run(self):
+        running = True
+        while running:
+            try:
+                items = [self.queue.get(timeout=self.refresh)]
+            except queue.Empty:
+                items = []
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            parts = []
+            waiting = []
+            for item in items:
+                if item is None:
+                    running = False
+                elif item[0] == 'drain':
+                    waiting.append(item[1])
+                elif item[0] == 'result':
+                    parts.append(self._format_result(*item[1:]))
+                else:
+                    parts.append(self._format_error(*item[1:]))
+
+            finishing = waiting or not running
+            if self.mode == 'progress':
+                parts = self._progress(parts, finishing)
+            if parts:
+                self.stream.write(''.join(parts))
+                self.stream.flush()
+            for written in waiting:
+                written.set()
+
+    def _format_result(self, platform, found, url, stats, username, status):
+        with self.lock:
+            self.done += 1
+            if found:
+                self.found += 1
+            elif status in (None, 'not_found'):
+                self.missing += 1
+            else:
+                self.failed += 1
+
+        if self.mode == 'box':
+            return self._box(platform, found, url, stats, username)
+        if self.mode == 'progress' and not found:
+            return ''
+        return self._line(platform, found, url, username)
+
+    def _format_error(self, label, username, status):
+        with self.lock:
+            self.done += 1
+            self.failed += 1
+        if self.mode == 'box':
+            return f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check {label} account: @{username}{Style.RESET_ALL}\n"
+        if self.mode == 'progress':
+            return ''
+        return (f"{Fore.LIGHTBLACK_EX}{time.strftime('%H:%M:%S')} {Fore.YELLOW}! {Fore.RESET}{label.upper():<10} "
+                f"{Fore.CYAN}@{username:<24} {Fore.LIGHTRED_EX}{status}{Style.RESET_ALL}\n")
+
+    def _line(self, platform, found, url, username):
+        icon = f"{Fore.GREEN}✓" if found else f"{Fore.RED}✗"
+        display_url = url.replace("tiktok.com@", "tiktok.com/@")
+        return (f"{Fore.LIGHTBLACK_EX}{time.strftime('%H:%M:%S')} {icon} {Fore.RESET}{platform.upper():<10} "
+                f"{Fore.CYAN}@{username:<24} {Fore.LIGHTBLUE_EX}{display_url}{Style.RESET_ALL}\n")
+
+    def _box(self, platform, found, url, stats, username):
+        status_icon = f"{Fore.GREEN}✓" if found else f"{Fore.RED}✗"
+        status_text = f"{status_icon} {Fore.RESET}{platform.upper()}"
+
+        # Format URL for display
+        display_url = url.replace("tiktok.com@", "tiktok.com/@") if "tiktok.com@" in url else url
+
+        header = f"{Fore.LIGHTBLACK_EX}{self.start_time} {status_text}"
+        username_line = f"{Fore.CYAN}@{username}"
+        url_line = f"{Fore.LIGHTBLUE_EX}{display_url}"
+
+        lines = [
+            f"{Fore.LIGHTBLACK_EX}┌{'─' * 72}┐",
+            f"{Fore.LIGHTBLACK_EX}│ {header:<86}{Fore.LIGHTBLACK_EX}│",
+            f"{Fore.LIGHTBLACK_EX}├{'─' * 72}┤",
+            f"{Fore.LIGHTBLACK_EX}│ {username_line:<76}{Fore.LIGHTBLACK_EX}│",
+            f"{Fore.LIGHTBLACK_EX}│ {url_line:<76}{Fore.LIGHTBLACK_EX}│",
+        ]
+
+        # Stats section if available
+        if found and stats:
+            lines.append(f"{Fore.LIGHTBLACK_EX}├{'─' * 72}┤")
+            max_key_length = max(len(str(key)) for key in stats.keys())
+            for key, value in stats.items():
+                key_part = f"{Fore.LIGHTWHITE_EX}{key}:"
+                value_part = f"{Fore.LIGHTGREEN_EX}{value}"
+                stat_line = f"  {key_part:<{max_key_length + 2}}{value_part}"
+                lines.append(f"{Fore.LIGHTBLACK_EX}│ {stat_line:<81}{Fore.LIGHTBLACK_EX}│")
+
+        lines.append(f"{Fore.LIGHTBLACK_EX}└{'─' * 72}┘")
+        lines.append(".++" + "═" * 80 + "++.")
+        return ''.join(f"{line}{Style.RESET_ALL}\n" for line in lines)
+
+    def _progress(self, parts, finishing):
+        """Clear the bar, write queued lines above it, then redraw it"""
+        if parts:
+            self.active = True
+        if not self.active:
+            return []
+        out = []
+        if self.bar_shown:
+            out.append("\r\033[K")
+        out.extend(parts)
+
+        with self.lock:
+            done, expected = self.done, max(self.expected, self.done)
+            found, missing, failed = self.found, self.missing, self.failed
+        elapsed = time.monotonic() - self.started
+        rate = done / elapsed if elapsed else 0.0
+        filled = int(BAR_WIDTH * done / expected) if expected else 0
+        out.append(f"{Fore.YELLOW}[{'█' * filled}{'·' * (BAR_WIDTH - filled)}] {Fore.WHITE}{done}/{expected} "
+                   f"{Fore.LIGHTBLACK_EX}{rate:.1f}/s  {Fore.GREEN}found {found}  {Fore.RED}missing {missing}  "
+                   f"{Fore.LIGHTRED_EX}failed {failed}{Style.RESET_ALL}")
+        self.bar_shown = True
+        if finishing:
+            # Leave the final bar in place and move below it
+            out.append("\n")
+            self.bar_shown = False
+            self.active = False
+        return out
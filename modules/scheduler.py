@@ -0,0 +1,134 @@
+import threading
+from collections import deque
+from itertools import islice
+
+# Seconds of waiting that one megabyte of response is weighed as when ranking
+# platforms: downloads share the link, so heavy pages cost more than their latency
+SECONDS_PER_MB = 1.0
+
+# Longest wait for a result before the held-back checks are looked at again
+RECHECK_SECONDS = 0.1
+
+class Scheduler:
+    """Orders (platform, username) checks so the first useful answers arrive sooner.
+
+    Checks are read window tasks at a time and run in priority class order:
+    platforms in the first class for every username in the window, then
+    the second class, and so on, with unlisted platforms last. Within a
+    class the cheapest platform goes first, costed from the run's live
+    fetch latency and bytes. Platforms not measured yet count as free, so
+    they are sampled early.
+
+    With stop_after, a username's remaining checks are skipped once it has
+    been found on that many platforms. To give that a chance, a username
+    never has more checks in flight than it still needs finds; its next
+    check waits for an answer while other usernames' checks go ahead.
+    """
+
+    def __init__(self, metrics, priorities=(), stop_after=None, window=1000):
+        self.metrics = metrics
+        self.classes = {name: rank for rank, names in enumerate(priorities) for name in names}
+        self.stop_after = stop_after
+        self.window = window
+        self.found = {}
+        self.outstanding = {}
+        self.active = set()
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.skipped = 0
+
+    def order(self, tasks, skip, deadline_for):
+        """Reorder (platform name, username or list, deadline) tasks window by window.
+
+        skip(name, username) reports a check dropped by the stop condition.
+        Deadlines are restarted from deadline_for() when a username's first
+        check leaves the window, so time spent waiting in it is not charged.
+        """
+        tasks = iter(tasks)
+        while True:
+            window = list(islice(tasks, self.window))
+            if not window:
+                return
+            with self.lock:
+                self.active = {username for _, target, _ in window for username in targets(target)}
+                # Usernames from earlier windows are kept only while they have checks in flight
+                for username in [username for username, count in self.outstanding.items()
+                                 if not count and username not in self.active]:
+                    del self.outstanding[username], self.found[username]
+            costs = {}
+            for name, _, _ in window:
+                if name not in costs:
+                    costs[name] = self.cost(name)
+            last = len(self.classes)
+            window.sort(key=lambda task: (self.classes.get(task[0], last), costs[task[0]] / len(targets(task[1]))))
+
+            deadlines = {}
+            waiting = deque(window)
+            while waiting:
+                held = deque()
+                while waiting:
+                    name, target, _ = task = waiting.popleft()
+                    wanted, stopped = self._admit(target)
+                    for username in stopped:
+                        self.skipped += 1
+                        skip(name, username)
+                    if wanted is None:
+                        held.append(task)
+                    elif wanted:
+                        # A batch keeps the deadline of its first username
+                        deadline = deadlines.setdefault(wanted[0], deadline_for())
+                        yield name, wanted if isinstance(target, list) else wanted[0], deadline
+                if held:
+                    with self.changed:
+                        self.changed.wait(RECHECK_SECONDS)
+                waiting = held
+
+    def _admit(self, target):
+        """(usernames to check now or None to hold the task back, usernames to skip)"""
+        usernames = targets(target)
+        with self.lock:
+            if self.stop_after is None:
+                wanted, stopped = usernames, []
+            else:
+                wanted = [username for username in usernames if self.found.get(username, 0) < self.stop_after]
+                stopped = [username for username in usernames if username not in wanted]
+                if not isinstance(target, list) and wanted:
+                    username = wanted[0]
+                    in_flight = self.outstanding.get(username, 0)
+                    # Checks already in flight could still bring the username to stop_after
+                    if in_flight and self.found.get(username, 0) + in_flight >= self.stop_after:
+                        return None, stopped
+            for username in wanted:
+                self.outstanding[username] = self.outstanding.get(username, 0) + 1
+                self.found.setdefault(username, 0)
+            return wanted, stopped
+
+    def cost(self, name):
+        """Estimated seconds one request to platform name costs, 0.0 until it has been measured"""
+        measured = self.metrics.fetch_cost(name)
+        if measured is None:
+            return 0.0
+        seconds, size = measured
+        return seconds + size / 1024 / 1024 * SECONDS_PER_MB
+
+    def settled(self, username, found):
+        """Record the end of one of username's checks, whatever its outcome"""
+        with self.changed:
+            if username not in self.outstanding:
+                return
+            self.outstanding[username] -= 1
+            if found:
+                self.found[username] += 1
+            if not self.outstanding[username] and username not in self.active:
+                del self.outstanding[username], self.found[username]
+            self.changed.notify_all()
+
+def targets(target):
+    return target if isinstance(target, list) else [target]
+
+def load_schedule_settings(config):
+    """Read [schedule] options from config.ini: window, the number of checks reordered at a time"""
+    if not config.has_section('schedule'):
+        return {}
+    section = config['schedule']
+    return {'window': section.getint('window')} if 'window' in section else {}
@@ -0,0 +1,315 @@
+import json, signal, threading, time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, parse_qs
+from colorama import Fore
+from modules.bulk import clean_username
+from modules.platforms import PLATFORMS, unbatched
+
+# Largest request body accepted, in bytes
+MAX_BODY = 1024 * 1024
+
+# Seconds a client told to back off should wait before retrying
+RETRY_AFTER = 1
+
+class ServiceError(Exception):
+    """A request the service refuses, with the HTTP status to answer it with.
+
+    close is set when the request body was left unread, so the connection
+    cannot carry another request.
+    """
+
+    def __init__(self, status, message, headers=None, close=False):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+        self.close = close
+
+class Tap:
+    """Stands in for the result writer of the service's SOCMED.
+
+    Every record still goes to the local writer, if given, and is also
+    added to the record list of the lookup running on the calling thread.
+    """
+
+    def __init__(self, writer=None):
+        self.writer = writer
+        self.local = threading.local()
+
+    def write(self, data):
+        if self.writer:
+            self.writer.write(data)
+        records = getattr(self.local, 'records', None)
+        if records is not None:
+            records.append(data)
+
+    def flush(self):
+        if self.writer:
+            self.writer.flush()
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+class Service:
+    """Keeps one SOCMED warm and answers lookups over a local HTTP/JSON API.
+
+    The session, connection pools, rate limits, latency history and result
+    cache live as long as the process, so repeated lookups skip the setup
+    a CLI run pays every time. Checks from all requests share one pool of
+    socmed.threads workers. A lookup that would take the number of queued
+    and running checks past capacity is turned away with 429 and
+    Retry-After, so callers back off rather than pile up.
+
+        GET  /health              liveness and current load
+        GET  /stats               service counters plus per-platform metrics
+        GET  /metrics             Prometheus text
+        POST /lookup              {"usernames": [...], "platforms": [...], "stream": false}
+        GET  /lookup?username=a&username=b&platforms=x,instagram&stream=1
+    """
+
+    def __init__(self, socmed, address, capacity=None):
+        self.socmed = socmed
+        self.address = address
+        self.capacity = capacity or socmed.threads * 16
+        self.tap = Tap(socmed.output)
+        socmed.output = self.tap
+        self.in_flight = 0
+        self.requests = 0
+        self.rejected = 0
+        self.checks = 0
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.executor = None
+
+    def run(self):
+        """Serve until interrupted, then let running checks finish"""
+        socmed = self.socmed
+        self.executor = ThreadPoolExecutor(max_workers=socmed.threads)
+        if socmed.hedge:
+            socmed.hedger = ThreadPoolExecutor(max_workers=socmed.threads * 2)
+        server = self.serve()
+        # Stop as on Ctrl+C, so buffered output is flushed when the service is told to stop
+        signal.signal(signal.SIGTERM, self._interrupt)
+        host, port = server.server_address[:2]
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Serving lookups on http://{host}:{port} "
+              f"({socmed.threads} threads, capacity {self.capacity} checks)", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.executor.shutdown(wait=True)
+            if socmed.hedger:
+                socmed.hedger.shutdown(wait=False)
+                socmed.hedger = None
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Served {self.requests} lookups ({self.checks} checks, "
+              f"{self.rejected} turned away) in {time.monotonic() - self.started:.0f}s")
+
+    def _interrupt(self, signum, frame):
+        raise KeyboardInterrupt
+
+    def serve(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so callers can reuse their connection across lookups
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._route()
+
+            def do_POST(self):
+                self._route()
+
+            def _route(self):
+                url = urlsplit(self.path)
+                try:
+                    if url.path == '/lookup':
+                        return service.lookup(self, self._lookup_request(url))
+                    if self.command != 'GET':
+                        raise ServiceError(405, "Use GET")
+                    if url.path == '/health':
+                        return self.send_json(200, service.health())
+                    if url.path == '/stats':
+                        return self.send_json(200, service.stats())
+                    if url.path == '/metrics':
+                        return self.send_body(200, service.socmed.metrics.prometheus().encode(),
+                                              'text/plain; version=0.0.4')
+                    raise ServiceError(404, f"No such endpoint: {url.path}")
+                except ServiceError as e:
+                    # Sending Connection: close also closes it on this side
+                    headers = dict(e.headers, Connection='close') if e.close else e.headers
+                    self.send_json(e.status, {"error": str(e)}, headers)
+
+            def _lookup_request(self, url):
+                if self.command == 'GET':
+                    query = parse_qs(url.query)
+                    return {
+                        "usernames": query.get('username', []),
+                        "platforms": ','.join(query.get('platforms', [])) or None,
+                        "stream": query.get('stream', ['0'])[0] in ('1', 'true'),
+                    }
+                length = int(self.headers.get('Content-Length') or 0)
+                if length > MAX_BODY:
+                    raise ServiceError(413, f"Request body is larger than {MAX_BODY} bytes", close=True)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    raise ServiceError(400, "Request body is not valid JSON")
+                if not isinstance(body, dict):
+                    raise ServiceError(400, "Request body must be a JSON object")
+                if 'username' in body:
+                    body.setdefault('usernames', [body['username']])
+                return body
+
+            def send_json(self, status, payload, headers=None):
+                self.send_body(status, json.dumps(payload).encode(), 'application/json', headers)
+
+            def send_body(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(self.address, Handler)
+        server.daemon_threads = True
+        return server
+
+# =============================================================== [LOOKUPS] =============================================================== #
+
+    def lookup(self, handler, request):
+        """Run a lookup's checks and answer with all records at once, or stream them as NDJSON"""
+        usernames, platforms = self._parse(request)
+        tasks = self._tasks(usernames, platforms)
+        self._admit(sum(len(target) if isinstance(target, list) else 1 for _, target, _ in tasks))
+        started = time.perf_counter()
+        futures = [self.executor.submit(self._check, *task) for task in tasks]
+
+        if not request.get("stream"):
+            results = [record for future in futures for record in future.result()]
+            return handler.send_json(200, {"results": results, "elapsed_s": round(time.perf_counter() - started, 3)})
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/x-ndjson")
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+        try:
+            for future in as_completed(futures):
+                lines = ''.join(json.dumps(record) + '\n' for record in future.result()).encode()
+                handler.wfile.write(f"{len(lines):x}\r\n".encode() + lines + b"\r\n")
+                handler.wfile.flush()
+            handler.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The caller hung up; its checks still finish and warm the cache
+            handler.close_connection = True
+
+    def _parse(self, request):
+        usernames = request.get("usernames")
+        if not isinstance(usernames, list) or not usernames:
+            raise ServiceError(400, "Give one or more usernames")
+        if not all(isinstance(username, str) for username in usernames):
+            raise ServiceError(400, "Usernames must be strings")
+        usernames = [clean_username(username) for username in usernames]
+        if not all(usernames):
+            raise ServiceError(400, "Usernames must not be empty")
+
+        names = request.get("platforms")
+        if names is None:
+            return usernames, self.socmed.platforms
+        if isinstance(names, str):
+            names = names.split(',')
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise ServiceError(400, "Platforms must be a list of strings or a comma-separated string")
+        names = [name.strip().lower() for name in names if name.strip()]
+        unknown = [name for name in names if name not in PLATFORMS]
+        if unknown:
+            raise ServiceError(400, f"Unknown platform(s): {', '.join(unknown)} (choose from {', '.join(PLATFORMS)})")
+        return usernames, [PLATFORMS[name] for name in names]
+
+    def _tasks(self, usernames, platforms):
+        """(platform name, username or list of usernames, deadline) for every check a lookup needs"""
+        socmed = self.socmed
+        tasks = []
+        for platform in platforms:
+            size = min(socmed.batch_size, platform.batch.size) if platform.batch else 1
+            if size <= 1:
+                tasks += [(platform.name, username, socmed._deadline_for()) for username in usernames]
+                continue
+            for start in range(0, len(usernames), size):
+                tasks.append((platform.name, unbatched(usernames[start:start + size]), socmed._deadline_for()))
+        return tasks
+
+    def _admit(self, count):
+        """Reserve room for count checks, or turn the lookup away"""
+        with self.lock:
+            self.requests += 1
+            if count > self.capacity:
+                self.rejected += 1
+                raise ServiceError(413, f"Lookup needs {count} checks, more than the service's capacity of {self.capacity}")
+            if self.in_flight + count > self.capacity:
+                self.rejected += 1
+                raise ServiceError(429, f"Service is busy with {self.in_flight} checks, retry shortly",
+                                   {"Retry-After": str(RETRY_AFTER)})
+            self.in_flight += count
+            self.checks += count
+
+    def _check(self, name, target, deadline):
+        """Run one check (or batch) on a pool thread and return the records it produced"""
+        socmed = self.socmed
+        usernames = target if isinstance(target, list) else [target]
+        records = self.tap.local.records = []
+        try:
+            if isinstance(target, list):
+                socmed.check_batch(name, target, deadline)
+            else:
+                socmed.check(name, target, deadline)
+        except Exception as e:
+            socmed.logger.error(f"{name} failed for @{', @'.join(usernames)}: {str(e)}")
+        finally:
+            self.tap.local.records = None
+            with self.lock:
+                self.in_flight -= len(usernames)
+        # Errors are logged and counted but leave no record; answer with one anyway,
+        # counting repeats so a name given twice gets two records
+        missing = Counter(usernames)
+        missing.subtract(record["username"] for record in records)
+        records += [PLATFORMS[name].failure(username, "error") for username, count in missing.items()
+                    for _ in range(count)]
+        return records
+
+    def health(self):
+        with self.lock:
+            in_flight = self.in_flight
+        return {
+            "status": "busy" if in_flight >= self.capacity else "ok",
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "in_flight": in_flight,
+            "capacity": self.capacity,
+        }
+
+    def stats(self):
+        socmed = self.socmed
+        with self.lock:
+            service = {"requests": self.requests, "rejected": self.rejected, "checks": self.checks,
+                       "in_flight": self.in_flight, "capacity": self.capacity}
+        connections = socmed._connection_stats()
+        return {
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "service": service,
+            "downloaded_bytes": socmed.bytes_read,
+            "connections": {
+                "new": sum(entry["new"] for entry in connections.values()),
+                "reused": sum(entry["reused"] for entry in connections.values()),
+            },
+            "cache": {"hits": socmed.cache.hits, "misses": socmed.cache.misses} if socmed.cache is not None else None,
+            "platforms": socmed.metrics.to_dict(),
+        }
@@ -1,518 +1,521 @@
-import requests, json, re
-from bs4 import BeautifulSoup
+import threading, time
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED, ALL_COMPLETED
 from modules.logging import setup_logging
-from modules.headers import *
-from colorama import Fore, Style, init
+from modules.platforms import PLATFORMS, select_platforms, unbatched
+from modules.ratelimit import RateLimiter, Blocked, THROTTLE_STATUSES
+from modules.timeouts import Timeout, DEFAULT_TIMEOUT, LatencyTracker, check_deadline
+from modules.metrics import Metrics
+from modules.coalesce import SingleFlight
+from modules.render import Renderer
+from modules.transport import build_session, connection_stats, fetch
+from colorama import Fore, init
 from datetime import datetime
 
 init(autoreset=True)
 
 class SOCMED:
+    # Stop reading a body once the page is this large, unless overridden
+    DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+
     def __init__(self, logger=None):
         self.input = None
         self.output = None
-        self.session = requests.Session()
+        self.threads = 3
+        self.platforms = select_platforms()
+        self.max_bytes = {name: self.DEFAULT_MAX_BYTES for name in PLATFORMS}
+        self.bytes_read = 0
+        self.cache = None
+        self.limiter = RateLimiter()
+        self.cut_short = 0
+        self.timeouts = {name: DEFAULT_TIMEOUT for name in PLATFORMS}
+        self.deadline = None
+        self.hedge = False
+        self.hedger = None
+        self.latency = LatencyTracker()
+        self.metrics = Metrics()
+        self.show_metrics = False
+        self.stats_file = None
+        self.checkpoint = None
+        self.batch_size = 1
+        self.sweep = None
+        self.proxies = None
+        self.existence_only = False
+        self.scheduler = None
+        self.flights = SingleFlight()
+        self.session = build_session()
         self.logger = logger or setup_logging("SOCMED")
         self.start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        self.colors = {
-            'border': Fore.YELLOW,
-            'title': Fore.CYAN,
-            'text': Fore.WHITE,
-            'url': Fore.LIGHTBLUE_EX,
-            'found': Fore.GREEN,
-            'not_found': Fore.RED,
-            'stats_key': Fore.LIGHTWHITE_EX,
-            'stats_value': Fore.LIGHTGREEN_EX,
-            'error': Fore.LIGHTRED_EX
-        }
-
-    def _print_result_box(self, platform, found, url, stats=None):
-        platform_name = platform.upper()
-        status_icon = f"{Fore.GREEN}✓" if found else f"{Fore.RED}✗"
-        status_text = f"{status_icon} {Fore.RESET}{platform_name}"
-        
-        # Format URL for display
-        display_url = url.replace("tiktok.com@", "tiktok.com/@") if "tiktok.com@" in url else url
-        
-        # Header with timestamp and status
-        header = f"{Fore.LIGHTBLACK_EX}{self.start_time} {status_text}"
-        
-        # Username line
-        username_line = f"{Fore.CYAN}@{self.input}"
-        
-        # URL line
-        url_line = f"{Fore.LIGHTBLUE_EX}{display_url}"
-        
-        # Box drawing
-        print(f"{Fore.LIGHTBLACK_EX}┌{'─' * 72}┐")
-        print(f"{Fore.LIGHTBLACK_EX}│ {header:<86}{Fore.LIGHTBLACK_EX}│")
-        print(f"{Fore.LIGHTBLACK_EX}├{'─' * 72}┤")
-        print(f"{Fore.LIGHTBLACK_EX}│ {username_line:<76}{Fore.LIGHTBLACK_EX}│")
-        print(f"{Fore.LIGHTBLACK_EX}│ {url_line:<76}{Fore.LIGHTBLACK_EX}│")
-        
-        # Stats section if available
-        if found and stats:
-            print(f"{Fore.LIGHTBLACK_EX}├{'─' * 72}┤")
-            
-            max_key_length = max(len(str(key)) for key in stats.keys())
-            
-            for key, value in stats.items():
-                key_part = f"{Fore.LIGHTWHITE_EX}{key}:"
-                value_part = f"{Fore.LIGHTGREEN_EX}{value}"
-                stat_line = f"  {key_part:<{max_key_length + 2}}{value_part}"
-                print(f"{Fore.LIGHTBLACK_EX}│ {stat_line:<81}{Fore.LIGHTBLACK_EX}│")
-        
-        print(f"{Fore.LIGHTBLACK_EX}└{'─' * 72}┘{Style.RESET_ALL}")
-        print(".++" + "═" * 80 + "++.")
+        self.renderer = Renderer(start_time=self.start_time)
+        self.lock = threading.Lock()
 
     def _save_result(self, data):
         if self.output:
-            with open(self.output, 'a', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-                f.write("\n")
-
-# =============================================================== [INSTAGRAM] =============================================================== #
-
-    def instagram_checker(self):
-        if not self.input:
-            self.logger.error("No input specified")
-            return
-
-        try:
-            profile_url = f"https://www.instagram.com/{self.input}"
-            response = self.session.get(profile_url, headers=instagram_headers)
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            og_desc = soup.find("meta", {"property": "og:description"})
-
-            if og_desc:
-                og_content = og_desc.get("content", "").strip()
-
-                # Check if it matches this profile
-                if f"@{self.input}" in og_content or f"&#064;{self.input}" in og_content:
-                    import re
-                    match = re.search(r"([\d,\.]+)\s+Followers,\s+([\d,\.]+)\s+Following,\s+([\d,\.]+)\s+Posts", og_content)
-                    if match:
-                        followers, following, posts = match.groups()
-                    else:
-                        followers = following = posts = "0"
-
-                    stats = {
-                        "Followers": followers,
-                        "Following": following,
-                        "Posts": posts
-                    }
-
-                    data = {
-                        "platform": "instagram",
-                        "username": self.input,
-                        "found": True,
-                        "url": profile_url,
-                        "stats": stats
-                    }
-                    self._print_result_box("instagram", True, profile_url, stats)
-                    self._save_result(data)
-                    return  # Done, early return
-
-            # fallback to old title-based check
-            title_start = response.text.find('<title>')
-            title_end = response.text.find('</title>')
-
-            if title_start == -1 or title_end == -1:
-                data = {
-                    "platform": "instagram",
-                    "username": self.input,
-                    "found": False,
-                    "url": profile_url
-                }
-                self._print_result_box("instagram", False, profile_url)
-            else:
-                title = response.text[title_start + 7:title_end].strip()
-                if (f"@{self.input})" in title or f"&#064;{self.input})" in title) and "Instagram photos and videos" in title:
-                    data = {
-                        "platform": "instagram",
-                        "username": self.input,
-                        "found": True,
-                        "url": profile_url
-                    }
-                    self._print_result_box("instagram", True, profile_url)
-                else:
-                    data = {
-                        "platform": "instagram",
-                        "username": self.input,
-                        "found": False,
-                        "url": profile_url
-                    }
-                    self._print_result_box("instagram", False, profile_url)
-
-            self._save_result(data)
-
-        except Exception as e:
-            self.logger.error(f"Error checking Instagram: {str(e)}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check Instagram account: @{self.input}")
-
-# =============================================================== [FACEBOOK] =============================================================== #
+            self.output.write(data)
 
-    def facebook_checker(self):
-        if not self.input:
-            self.logger.error("No input specified")
+    def close(self):
+        self.renderer.close()
+        # The checkpoint flushes the output before itself, so it closes first
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+        if self.output:
+            self.output.close()
+        if self.stats_file:
+            self.metrics.write_json(self.stats_file)
+        if self.cache is not None:
+            self.cache.close()
+
+    def run_checkers(self):
+        """Check self.input on every selected platform using a pool sized by self.threads"""
+        elapsed = self.run_bulk([self.input], summary=False)
+        if self.renderer.silent:
+            return elapsed
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Checked {len(self.platforms)} platforms for @{self.input} "
+              f"in {elapsed:.2f}s using {self.threads} threads")
+        self._print_transfer_stats()
+        self._print_connection_stats(self._connection_stats())
+        self._print_metrics()
+        return elapsed
+
+    def run_bulk(self, usernames, summary=True):
+        """Stream usernames through every selected platform on one shared worker pool.
+
+        At most threads * 4 (username, platform) tasks are queued at once, so
+        memory stays flat however long the username iterable is.
+        """
+        max_pending = self.threads * 4
+        pending = {}
+        counted = [0]
+        started = time.perf_counter()
+        if self.hedge:
+            # Primary and hedge requests run here while the worker waits on them
+            self.hedger = ThreadPoolExecutor(max_workers=self.threads * 2)
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            for name, target, deadline in self._scheduled(usernames, counted):
+                if len(pending) >= max_pending:
+                    self._drain(pending, FIRST_COMPLETED)
+                check = self.check_batch if isinstance(target, list) else self.check
+                pending[executor.submit(check, name, target, deadline)] = (name, target)
+            self._drain(pending, ALL_COMPLETED)
+        count = counted[0]
+
+        if self.hedger:
+            self.hedger.shutdown(wait=False)
+            self.hedger = None
+
+        elapsed = time.perf_counter() - started
+        self.renderer.drain()
+        if summary:
+            self._print_summary(count, elapsed, f"{self.threads} threads", self._connection_stats())
+        return elapsed
+
+    def _tasks(self, usernames, counted):
+        """Yield (platform name, username or list of usernames, deadline) for every check to run.
+
+        Platforms with a batch endpoint collect usernames until batch_size
+        of them are waiting and get one task for the lot; the others get a
+        task per username, as does a lone username left over at the end, so
+        it goes through the platform's own profile lookup. counted[0] tracks
+        how many usernames were read.
+        """
+        batches = {}
+        for username in usernames:
+            counted[0] += 1
+            deadline = self._deadline_for()
+            todo = self._unfinished(username)
+            self.renderer.expect(len(todo))
+            for platform in todo:
+                size = min(self.batch_size, platform.batch.size) if platform.batch else 1
+                if size <= 1:
+                    yield platform.name, username, deadline
+                    continue
+                # A batch keeps the deadline of its first username
+                first_deadline, batch = batches.setdefault(platform.name, (deadline, []))
+                batch.append(username)
+                if len(batch) >= size:
+                    del batches[platform.name]
+                    yield platform.name, batch, first_deadline
+        for name, (deadline, batch) in batches.items():
+            yield name, unbatched(batch), deadline
+
+    def _scheduled(self, usernames, counted):
+        """The checks from _tasks, reordered by the scheduler when one is set"""
+        tasks = self._tasks(usernames, counted)
+        if self.scheduler is None:
+            return tasks
+        return self.scheduler.order(tasks, self._report_skipped, self._deadline_for)
+
+    def _unfinished(self, username):
+        """Selected platforms still to check for username.
+
+        A variant sweep drops platforms that cannot have the username or
+        already had an equivalent one queued; a resumed checkpoint drops
+        those already settled.
+        """
+        platforms = self.platforms
+        if self.sweep is not None:
+            platforms = self.sweep.platforms(username, platforms)
+        if self.checkpoint is None:
+            return platforms
+        return [platform for platform in platforms if not self.checkpoint.done(platform.name, username)]
+
+    def _print_summary(self, count, elapsed, workers, connections=None):
+        if self.renderer.silent:
             return
-
-        try:
-            response = self.session.get(
-                f"https://www.facebook.com/{self.input}", 
-                headers=facebook_headers,
-                allow_redirects=False
-            )
-            
-            if response.status_code == 200 and "userVanity" in response.text:
-                name_match = re.search(r'"name":"([^"]+)"', response.text)
-                profile_name = name_match.group(1) if name_match else "Unknown"
-                
-                data = {
-                    "platform": "facebook",
-                    "username": self.input,
-                    "found": True,
-                    "url": f"https://www.facebook.com/{self.input}",
-                    "stats": {
-                        "name": profile_name,
-                        "vanity": "Available"
-                    }
-                }
-                self._print_result_box("facebook", True, data['url'], {
-                    "Profile Name": profile_name,
-                    "Vanity URL": "✔️ Available"
-                })
-                
-            elif response.status_code == 200 and "content=\"profile\"" in response.text:
-                data = {
-                    "platform": "facebook",
-                    "username": self.input,
-                    "found": True,
-                    "url": f"https://www.facebook.com/{self.input}"
-                }
-                self._print_result_box("facebook", True, data['url'])
-                
-            else:
-                data = {
-                    "platform": "facebook",
-                    "username": self.input,
-                    "found": False,
-                    "url": f"https://www.facebook.com/{self.input}"
-                }
-                self._print_result_box("facebook", False, data['url'])
-
-            self._save_result(data)
-
-        except Exception as e:
-            self.logger.error(f"Error checking Facebook: {str(e)}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check Facebook account: {self.input}")
-
-# =============================================================== [TIKTOK] =============================================================== #
-
-    def tiktok_checker(self):
-        if not self.input:
-            self.logger.error("No input specified")
+        rate = count / elapsed if elapsed else 0.0
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Checked {count} usernames in {elapsed:.2f}s "
+              f"({rate:.2f} usernames/s) using {workers}")
+        self._print_transfer_stats()
+        if connections:
+            self._print_connection_stats(connections)
+        self._print_metrics()
+
+    def _print_transfer_stats(self):
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Downloaded {self.bytes_read / 1024 / 1024:.2f} MB "
+              f"({self.cut_short} responses stopped early)")
+        if self.checkpoint is not None and self.checkpoint.skipped:
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Resumed: skipped {self.checkpoint.skipped} checks "
+                  f"already finished in {self.checkpoint.path}")
+        if self.sweep is not None:
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Variants: {self.sweep.pruned} checks pruned as invalid, "
+                  f"{self.sweep.duplicates} duplicates skipped")
+        if self.cache is not None:
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        coalesced = self.metrics.total('coalesced')
+        if coalesced:
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Coalesced: {coalesced} duplicate lookups shared "
+                  f"an in-flight request")
+        throttled = self.metrics.total('throttled')
+        if throttled:
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Throttled: {throttled} responses backed off")
+        if self.proxies is not None:
+            self._print_proxy_stats()
+        hedged = self.metrics.total('hedged')
+        if hedged:
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Hedged: {hedged} slow requests duplicated, "
+                  f"{self.metrics.total('hedge_wins')} answered first")
+        if self.existence_only:
+            self._print_probe_stats()
+        if self.scheduler is not None and self.scheduler.skipped:
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Stopped early: {self.scheduler.skipped} checks skipped "
+                  f"for usernames found on {self.scheduler.stop_after} platforms")
+
+    def _print_probe_stats(self):
+        for platform, entry in self.metrics.to_dict().items():
+            counters, probe = entry["counters"], entry["phases"].get('probe')
+            if not counters['probes']:
+                continue
+            latency = f", {probe['sum'] / probe['count'] * 1000:.1f} ms avg" if probe and probe['count'] else ""
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Probes {platform}: {counters['probes']} sent, "
+                  f"{counters['probe_hits']} settled without the page, {counters['probes'] - counters['probe_hits']} "
+                  f"fell back to it, {counters['probe_bytes'] / 1024:.1f} KB read{latency}")
+
+    def _connection_stats(self):
+        return self.proxies.connection_stats() if self.proxies is not None else connection_stats(self.session)
+
+    def _print_proxy_stats(self):
+        for row in self.proxies.summary():
+            latency = f"{row['avg_ms']:.0f} ms avg" if row['avg_ms'] is not None else "no answers"
+            ok = row['ok'] / row['requests'] * 100 if row['requests'] else 0.0
+            print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Proxy {row['proxy']}: {row['requests']} requests, "
+                  f"{ok:.1f}% ok, {latency}, {row['blocked']} blocked, {row['timeout']} timeouts, "
+                  f"{row['error']} errors, quarantined {row['quarantines']}x")
+
+    def _print_connection_stats(self, connections):
+        new = sum(entry["new"] for entry in connections.values())
+        reused = sum(entry["reused"] for entry in connections.values())
+        total = new + reused
+        reuse = reused / total * 100 if total else 0.0
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Connections: {new} new, {reused} reused ({reuse:.1f}% reuse)")
+        for host, entry in sorted(connections.items()):
+            self.logger.info(f"{host}: {entry['new']} new, {entry['reused']} reused")
+
+    def _print_metrics(self):
+        """Per-platform outcome counts and median phase times, when --metrics is set"""
+        if not self.show_metrics:
             return
-
-        try:
-            response = self.session.get(f"https://www.tiktok.com/@{self.input}", headers=tiktok_headers)
-            pattern = r'"shareMeta":\s*\{\s*"title":\s*"([^"]+)",\s*"desc":\s*"([^"]+)"\s*\}'
-            match = re.search(pattern, response.text)
-
-            if match:
-                desc = match.group(2)
-                
-                username_match = re.search(r'@([^\s]+)', desc)
-                followers_match = re.search(r'([\d.]+[kKmM]?)\sFollowers', desc)
-                following_match = re.search(r'([\d.]+[kKmM]?)\sFollowing', desc)
-                likes_match = re.search(r'([\d.]+[kKmM]?)\sLikes', desc)
-
-                stats = {
-                    "Username": username_match.group(0) if username_match else "@UNKNOWN",
-                    "Followers": followers_match.group(1) if followers_match else "0",
-                    "Following": following_match.group(1) if following_match else "0",
-                    "Likes": likes_match.group(1) if likes_match else "0"
-                }
-                
-                data = {
-                    "platform": "tiktok",
-                    "username": self.input,
-                    "found": True,
-                    "url": f"https://www.tiktok.com/@{self.input}",
-                    "stats": stats
-                }
-                
-                self._print_result_box("tiktok", True, data['url'], stats)
-            else:
-                data = {
-                    "platform": "tiktok",
-                    "username": self.input,
-                    "found": False,
-                    "url": f"https://www.tiktok.com/@{self.input}"
-                }
-                self._print_result_box("tiktok", False, data['url'])
-
-            self._save_result(data)
-
-        except Exception as e:
-            self.logger.error(f"Error checking TikTok: {str(e)}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check TikTok account: @{self.input}")
-
-# =============================================================== [TWITTER/X] =============================================================== #
-
-    def x_checker(self):
-        if not self.input:
+        columns = ('connect', 'first_byte', 'body', 'parse', 'write')
+        print(f"{Fore.YELLOW}[OS1NT] - {Fore.GREEN}Per-platform metrics (phase times are p50/p95 in ms)")
+        print(f"{Fore.LIGHTWHITE_EX}{'PLATFORM':<10}{'REQ':>6}{'FOUND':>7}{'MISS':>6}{'FAIL':>6}{'MB':>8}"
+              + ''.join(f"{column.upper().replace('_', ' '):>16}" for column in columns))
+        for platform, entry in self.metrics.to_dict().items():
+            counters, phases = entry["counters"], entry["phases"]
+            failed = counters['error'] + counters['blocked'] + counters['timeout']
+            cells = []
+            for column in columns:
+                phase = phases.get(column)
+                cells.append(f"{phase['p50'] * 1000:.1f}/{phase['p95'] * 1000:.1f}" if phase else "-")
+            print(f"{Fore.CYAN}{platform:<10}{Fore.WHITE}{counters['requests']:>6}{counters['found']:>7}"
+                  f"{counters['not_found']:>6}{failed:>6}{counters['bytes'] / 1024 / 1024:>8.2f}"
+                  + ''.join(f"{cell:>16}" for cell in cells))
+
+    def _drain(self, pending, return_when):
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            name, username = pending.pop(future)
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"{name} failed for @{username}: {str(e)}")
+
+# =============================================================== [CHECKS] =============================================================== #
+
+    def _deadline_for(self):
+        """Monotonic deadline for a username starting now, or None without --deadline"""
+        return time.monotonic() + self.deadline if self.deadline else None
+
+    def check(self, name, username=None, deadline=None):
+        """Fetch and parse one platform for one username, then print and save the result"""
+        username = username or self.input
+        if not username:
             self.logger.error("No input specified")
             return
 
         try:
-            params = {
-                'variables': '{"screen_name":"hwnzri"}',
-                'features': '{"responsive_web_grok_bio_auto_translation_is_enabled":false,"hidden_profile_subscriptions_enabled":true,"payments_enabled":false,"profile_label_improvements_pcf_label_in_post_enabled":true,"rweb_tipjar_consumption_enabled":true,"verified_phone_label_enabled":false,"subscriptions_verification_info_is_identity_verified_enabled":true,"subscriptions_verification_info_verified_since_enabled":true,"highlights_tweets_tab_ui_enabled":true,"responsive_web_twitter_article_notes_tab_enabled":true,"subscriptions_feature_can_gift_premium":true,"creator_subscriptions_tweet_preview_api_enabled":true,"responsive_web_graphql_skip_user_profile_image_extensions_enabled":false,"responsive_web_graphql_timeline_navigation_enabled":true}',
-                'fieldToggles': '{"withAuxiliaryUserLabels":true}',
-            }
-            response = self.session.get('https://api.x.com/graphql/x3RLKWW1Tl7JgU7YtGxuzw/UserByScreenName',params=params,headers=x_headers)
-            if response.status_code == 200:
-                data = response.json()
-                username = data["data"]["user"]["result"]["core"]["screen_name"]
-                name = data["data"]["user"]["result"]["core"]["name"]
-                following = data["data"]["user"]["result"]["legacy"]["friends_count"]
-                follower = data["data"]["user"]["result"]["legacy"]["followers_count"]
-                
-                stats = {
-                    "Username": username + " (" + name + ")",
-                    "Followers": follower,
-                    "Following": following,
-                }
-
-                data = {
-                    "platform": "X",
-                    "username": self.input,
-                    "found": True,
-                    "url": f"https://x.com/{self.input}",
-                    "stats": stats
-                }
-                self._print_result_box("X", True, data['url'], stats)
-            else:
-                data = {
-                    "platform": "X",
-                    "username": self.input,
-                    "found": False,
-                    "url": f"https://x.com/{self.input}"
-                }
-                self._print_result_box("X", False, data['url'])
-            self._save_result(data)
-
+            cached = self._from_cache(name, username)
+            if cached:
+                return cached
+
+            if self.existence_only and PLATFORMS[name].probe:
+                status, _ = self._shared_fetch(name, username, deadline, probe=True)
+                settled = self._settle_probe(name, username, status)
+                if settled:
+                    return settled
+
+            status, body = self._shared_fetch(name, username, deadline)
+            return self._report(name, username, status, body.text)
+
+        except Blocked as e:
+            self._report_failure(name, username, "blocked", e)
+        except Timeout as e:
+            self._report_failure(name, username, "timeout", e)
         except Exception as e:
-            self.logger.error(f"Error checking X: {str(e)}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check X account: @{self.input}")
-            
-# =============================================================== [TELEGRAM] =============================================================== #
+            self._report_error(name, username, e)
 
-    def telegram_checker(self):
-        if not self.input:
-            self.logger.error("No input specified")
+    def check_batch(self, name, usernames, deadline=None):
+        """Look up several usernames with one request to the platform's batch endpoint"""
+        usernames = self._uncached(name, usernames)
+        if not usernames:
             return
-
         try:
-            response = self.session.get(f'https://telegram.me/{self.input}', headers=telegram_headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            og_title_tag = soup.find('meta', {'property': 'og:title'})
-            og_description_tag = soup.find('meta', {'property': 'og:description'})
-            twitter_image_tag = soup.find('meta', {'property': 'twitter:image'})
-
-            og_title = og_title_tag['content'] if og_title_tag and 'content' in og_title_tag.attrs else None
-            og_description = og_description_tag['content'] if og_description_tag and 'content' in og_description_tag.attrs else None
-            twitter_image = twitter_image_tag['content'] if twitter_image_tag and 'content' in twitter_image_tag.attrs else None
-
-            if og_title and og_description and twitter_image:
-                stats = {
-                    "Name": og_title,
-                    "Desc": og_description,
-                    "Image": twitter_image
-                }
-                data = {
-                    "platform": "Telegram",
-                    "username": self.input,
-                    "found": True,
-                    "url": f"https://t.me/{self.input}",
-                    "stats": stats
-                }
-                self._print_result_box("Telegram", True, data['url'], stats)
-            else:
-                data = {
-                    "platform": "Telegram",
-                    "username": self.input,
-                    "found": False,
-                    "url": f"https://t.me/{self.input}"
-                }
-                self._print_result_box("Telegram", False, data['url'])
-
-            self._save_result(data)
-
+            status, body = self._fetch(name, self._batch_request(name, usernames), deadline)
+            self._report_batch(name, usernames, status, body.text)
         except Exception as e:
-            self.logger.error(f"Error checking Telegram: {str(e)}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check Telegram account: @{self.input}")
-            
-# =============================================================== [LEMON8] =============================================================== #
-
-    def lemon8_checker(self):
-        if not self.input:
-            self.logger.error("No input specified")
-            return
-
+            self._fail_batch(name, usernames, e)
+
+    def _key(self, name, username):
+        """Platform-normalised username, so JohnDoe and johndoe share a fetch and a cache entry"""
+        return PLATFORMS[name].normalize(username) or username
+
+    def _distinct(self, name, usernames):
+        """First spelling of each normalised name in usernames, in order"""
+        first = {}
+        for username in usernames:
+            first.setdefault(self._key(name, username), username)
+        return list(first.values())
+
+    def _batch_request(self, name, usernames):
+        """Batch request asking for each normalised name once; the repeats count as coalesced"""
+        distinct = self._distinct(name, usernames)
+        if len(distinct) < len(usernames):
+            self.metrics.count(name, 'coalesced', len(usernames) - len(distinct))
+        return PLATFORMS[name].batch_request(distinct)
+
+    def _shared_fetch(self, name, username, deadline=None, probe=False):
+        """Fetch a profile, or probe it, joining any in-flight fetch of the same normalised name"""
+        platform = PLATFORMS[name]
+        request = platform.probe_request(username) if probe else platform.request(username)
+        (status, body), shared = self.flights.do(
+            (name, self._key(name, username), probe),
+            lambda: self._fetch(name, request, deadline)
+        )
+        if shared:
+            self.metrics.count(name, 'coalesced')
+        return status, body
+
+    def _fetch(self, name, request, deadline=None):
+        """Fetch a platform request, backing off and retrying while it is throttled"""
+        for attempt in range(self.limiter.retries + 1):
+            # Each attempt may leave through a different proxy, with its own limits
+            proxy = self.proxies.choose(name) if self.proxies is not None else None
+            limiter = proxy.limiter if proxy else self.limiter
+            self._sleep(limiter.reserve(name), deadline)
+            try:
+                status, body = self._get(name, request, deadline, proxy)
+            except Exception as e:
+                # Retry through the pool; the failed proxy now weighs less or is quarantined
+                if proxy is None or isinstance(e, Timeout) or attempt == self.limiter.retries:
+                    raise
+                continue
+            if status not in THROTTLE_STATUSES:
+                limiter.succeeded(name)
+                return status, body
+
+            limiter.throttled(name, body.headers)
+            self.metrics.count(name, 'throttled')
+            if attempt < self.limiter.retries:
+                self._sleep(self.limiter.backoff(attempt), deadline)
+
+        raise Blocked(f"HTTP {status} after {self.limiter.retries} retries")
+
+    def _sleep(self, delay, deadline):
+        """Sleep for a rate-limit or backoff delay, unless it would overrun the deadline"""
+        if delay > 0:
+            check_deadline(deadline, delay)
+            time.sleep(delay)
+
+    def _get(self, name, request, deadline, proxy=None):
+        """One GET, duplicated if it outlives the platform's p95 when hedging is on"""
+        delay = self.latency.p95(name) if self.hedger else None
+        if delay is None:
+            return self._timed_get(name, request, deadline, proxy)
+
+        primary = self.hedger.submit(self._timed_get, name, request, deadline, proxy)
+        done, _ = wait([primary], timeout=delay)
+        limiter = proxy.limiter if proxy else self.limiter
+        if done or not limiter.try_acquire(name):
+            return primary.result()
+
+        backup = self.hedger.submit(self._timed_get, name, request, deadline, proxy)
+        self.metrics.count(name, 'hedged')
+        first = next(as_completed([primary, backup]))
+        if first.exception() is not None:
+            first = backup if first is primary else primary
+        if first is backup:
+            self.metrics.count(name, 'hedge_wins')
+        return first.result()
+
+    def _timed_get(self, name, request, deadline, proxy=None):
+        started = time.monotonic()
+        timeout = self.timeouts.get(name, DEFAULT_TIMEOUT)
+        # Batch requests carry their own max_bytes (None) so a size cap never truncates them
+        max_bytes = request["max_bytes"] if "max_bytes" in request else self.max_bytes.get(name)
         try:
-            response = self.session.get(
-                f"https://www.lemon8-app.com/@{self.input}",
-                headers=lemon8_headers,
-                allow_redirects=False
-            )
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            profile_container = soup.find('div', class_='user-desc-main')
-
-            if response.status_code == 200 and profile_container:
-                display_name_tag = soup.find('h1', class_='user-desc-base-name')
-                display_name = display_name_tag.get_text(strip=True) if display_name_tag else "Unknown"
-
-                following = followers = likes_saves = "0"
-                stats_items = soup.find_all('a', class_='user-desc-main-info-item')
-
-                for item in stats_items:
-                    spans = item.find_all('span')
-                    if len(spans) >= 2:
-                        value = spans[0].get_text(strip=True)
-                        label = spans[1].get_text(strip=True).lower()
-
-                        if 'mengikuti' in label or 'following' in label:
-                            following = value
-                        elif 'pengikut' in label or 'followers' in label:
-                            followers = value
-                        elif 'suka dan simpanan' in label or 'likes and saves' in label:
-                            likes_saves = value
-
-                stats = {
-                    "Name": display_name,
-                    "Following": following,
-                    "Followers": followers,
-                    "Likes/Saves": likes_saves
-                }
-
-                data = {
-                    "platform": "lemon8",
-                    "username": self.input,
-                    "found": True,
-                    "url": f"https://www.lemon8-app.com/@{self.input}",
-                    "stats": stats
-                }
-
-                self._print_result_box("lemon8", True, data['url'], stats)
-            else:
-                data = {
-                    "platform": "lemon8",
-                    "username": self.input,
-                    "found": False,
-                    "url": f"https://www.lemon8-app.com/@{self.input}"
-                }
-                self._print_result_box("lemon8", False, data['url'])
-
-            self._save_result(data)
-
+            status, body = fetch(proxy.session if proxy else self.session, request, max_bytes, timeout, deadline)
         except Exception as e:
-            self.logger.error(f"Error checking Lemon8: {str(e)}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check Lemon8 account: @{self.input}")
-            
-            
-    def threads_checker(self):
-        if not self.input:
-            self.logger.error("No input specified")
-            return
-
-        url = f"https://www.threads.com/@{self.input}"
-        try:
-            resp = self.session.get(url, headers=threads_headers, allow_redirects=False)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, 'html.parser')
-
-            profile = soup.find('div', class_='user-desc-main')
-            if profile:
-                title_tag = profile.find('h1', class_='user-desc-base-name')
-                title     = title_tag.get_text(strip=True) if title_tag else self.input
-                followers = (
-                    profile.find('span', attrs={'title': re.compile(r'^\d')})
-                    .get('title', '0')
-                )
+            if proxy:
+                self.proxies.record(proxy, name, 'timeout' if isinstance(e, Timeout) else 'error')
+            raise
+        elapsed = time.monotonic() - started
+        self._record_fetch(name, body, request.get("probe", False))
+        throttled = status in THROTTLE_STATUSES
+        # Probes are far quicker than pages and would drag the hedging p95 down
+        if not throttled and not request.get("probe"):
+            self.latency.record(name, elapsed)
+        if proxy:
+            self.proxies.record(proxy, name, 'blocked' if throttled else 'ok', elapsed)
+        return status, body
+
+    def _record_fetch(self, name, body, probe=False):
+        """Add a fetched response to the transfer totals and the platform's metrics"""
+        with self.lock:
+            self.bytes_read += body.size
+            if not body.complete and not probe:
+                self.cut_short += 1
+        self.metrics.observe_fetch(name, body, probe)
+
+    def _from_cache(self, name, username):
+        """Print and save a cached result; returns its data, or None on a miss"""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(name, self._key(name, username))
+        if cached is None:
+            return None
+        data, stats = cached
+        if data["username"] != username:
+            # Cached under another spelling of the same name; the record keeps this one
+            data = dict(data, username=username, url=PLATFORMS[name].profile_url(username))
+        self.metrics.count(name, 'cache_hits')
+        self._emit(name, data, stats, username)
+        return data
+
+    def _uncached(self, name, usernames):
+        """Emit cached results and return the usernames that still need a lookup"""
+        return [username for username in usernames if not self._from_cache(name, username)]
+
+    def _report(self, name, username, status, text):
+        """Parse a fetched page, then print, save and cache the result"""
+        started = time.perf_counter()
+        data, stats = PLATFORMS[name].result(username, status, text)
+        self.metrics.observe(name, 'parse', time.perf_counter() - started)
+        return self._settle(name, username, data, stats)
+
+    def _report_batch(self, name, usernames, status, text):
+        """Parse a batch response and report every username in it, repeats and other spellings included"""
+        started = time.perf_counter()
+        distinct = self._distinct(name, usernames)
+        results = PLATFORMS[name].batch_results(distinct, status, text)
+        self.metrics.observe(name, 'parse', time.perf_counter() - started)
+        verdicts = {self._key(name, username): results[username] for username in distinct}
+        for username in usernames:
+            data, stats = verdicts[self._key(name, username)]
+            if data["username"] != username:
+                data = dict(data, username=username, url=PLATFORMS[name].profile_url(username))
+            self._settle(name, username, data, stats)
+
+    def _settle_probe(self, name, username, status):
+        """Report a probe's verdict; returns its data, or None when the full page is needed"""
+        found = PLATFORMS[name].probe.verdict(status)
+        if found is None:
+            return None
+        self.metrics.count(name, 'probe_hits')
+        data, stats = PLATFORMS[name].verdict(username, found, None)
+        if found:
+            # Not cached: a later run without --existence-only wants the stats
+            self._emit(name, data, stats, username)
+            return data
+        return self._settle(name, username, data, stats)
+
+    def _settle(self, name, username, data, stats):
+        if self.cache is not None:
+            self.cache.put(name, self._key(name, username), data, stats)
+        self._emit(name, data, stats, username)
+        return data
+
+    def _fail_batch(self, name, usernames, error):
+        """Report a failed batch lookup against each of its usernames"""
+        for username in usernames:
+            if isinstance(error, Blocked):
+                self._report_failure(name, username, "blocked", error)
+            elif isinstance(error, Timeout):
+                self._report_failure(name, username, "timeout", error)
             else:
-                # twitter:description meta fallback
-                meta = soup.find('meta', attrs={'name': 'twitter:description'})
-                if meta and meta.has_attr('content'):
-                    desc = meta['content']
-                    m = re.search(r'(?P<followers>\d+)\s+Followers', desc, re.IGNORECASE)
-                    followers = m.group('followers') if m else "0"
-                else:
-                    span = soup.find('span', title=re.compile(r'^\d+'))
-                    sib  = span.find_next_sibling(string=re.compile(r'followers?', re.IGNORECASE)) if span else None
-                    if span and sib:
-                        followers = span['title']
-                    else:
-                        raise ValueError("Could not find followers count")
-
-                # page-title fallback
-                page_title = soup.find('title').get_text(strip=True)
-                title = re.split(r'\s*\(@', page_title, 1)[0]
-
-            # **STRIP ANY “ • …” SUFFIX FROM TITLE**
-            title = re.sub(r'\s*•.*$', '', title)
-
-            stats = {
-                "Name": title,
-                "Followers": followers,
-            }
-            data = {
-                "platform": "threads",
-                "username": self.input,
-                "found": True,
-                "url": url,
-                "stats": stats
-            }
-
-            self._print_result_box("threads", True, url, stats)
-            self._save_result(data)
-
-        except Exception as e:
-            self.logger.error(f"Error checking threads: {e}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check threads account: @{self.input}")
-            
-            
-    def snapchat_checker(self):
-        if not self.input:
-            self.logger.error("No input specified")
-            return
-
-        url = f"https://www.snapchat.com/@{self.input}"
-        try:
-            resp = self.session.get(url, headers=snapchat_headers, allow_redirects=False)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            el = soup.select_one('span.UserDetailsCard_title__K9Awz.UserDetailsCard_oneLineTruncation__z0qou')
-            title = el.get_text(strip=True) if el else None
-            stats = {
-                "Name": title,
-            }
-            data = {
-                "platform": "snapchat",
-                "username": self.input,
-                "found": True,
-                "url": url,
-                "stats": stats
-            }
-
-            self._print_result_box("snapchat", True, url, stats)
-            self._save_result(data)
-
-        except Exception as e:
-            self.logger.error(f"Error checking snapchat: {e}")
-            print(f"{Fore.RED}ERROR: {Fore.WHITE}Failed to check snapchat account: @{self.input}")  
\ No newline at end of file
+                self._report_error(name, username, error)
+
+    def _emit(self, name, data, stats, username):
+        if self.scheduler is not None:
+            self.scheduler.settled(username, data["found"])
+        self.metrics.count(name, data["status"])
+        self.renderer.result(data["platform"], data["found"], data["url"], stats, username, data["status"])
+        self._timed_save(name, data)
+        if self.checkpoint is not None:
+            self.checkpoint.mark(name, username, data["status"])
+
+    def _timed_save(self, name, data):
+        started = time.perf_counter()
+        self._save_result(data)
+        self.metrics.observe(name, 'write', time.perf_counter() - started)
+
+    def _report_failure(self, name, username, status, error):
+        """Report a lookup that ended without a verdict and record why"""
+        # Save before marking, as _emit does, so a marked check always has its record
+        self._timed_save(name, PLATFORMS[name].failure(username, status))
+        self._report_error(name, username, error, status)
+
+    def _report_skipped(self, name, username):
+        """Record a check the scheduler dropped because the username was already found enough"""
+        self._timed_save(name, PLATFORMS[name].failure(username, "skipped"))
+        self.metrics.count(name, "skipped")
+        if self.checkpoint is not None:
+            self.checkpoint.mark(name, username, "skipped")
+        self.renderer.skip()
+
+    def _report_error(self, name, username, error, status="error"):
+        if self.scheduler is not None:
+            self.scheduler.settled(username, False)
+        self.metrics.count(name, status)
+        if self.checkpoint is not None:
+            self.checkpoint.mark(name, username, status)
+        label = PLATFORMS[name].label
+        self.logger.error(f"Error checking {label}: {str(error)}")
+        self.renderer.error(label, username, status)
@@ -0,0 +1,72 @@
+import threading, time
+from collections import deque
+
+# (connect, read) seconds used for every platform unless overridden
+DEFAULT_TIMEOUT = (5.0, 10.0)
+
+class Timeout(Exception):
+    """Raised when a request times out or a lookup runs past its deadline"""
+
+def remaining(deadline):
+    """Seconds left before a monotonic deadline, or None when there is none"""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+def check_deadline(deadline, delay=0.0):
+    """Raise Timeout if the deadline has passed or would pass within delay seconds"""
+    left = remaining(deadline)
+    if left is not None and left <= delay:
+        raise Timeout("Deadline exceeded")
+
+def request_timeout(timeout, deadline):
+    """Clamp a (connect, read) timeout so neither outlasts the deadline"""
+    left = remaining(deadline)
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise Timeout("Deadline exceeded")
+    return tuple(min(value, left) for value in timeout)
+
+class LatencyTracker:
+    """Rolling window of recent response times per platform.
+
+    p95() returns None until min_samples responses have been seen, so
+    hedging only starts once there is a meaningful tail to aim for.
+    """
+
+    def __init__(self, window=256, min_samples=20):
+        self.window = window
+        self.min_samples = min_samples
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self.lock:
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(seconds)
+
+    def p95(self, name):
+        with self.lock:
+            samples = self.samples.get(name)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+def load_timeouts(config, names):
+    """Return {platform: (connect, read)} for names from [timeouts] in config.ini.
+
+    Recognised keys: connect, read, and per-platform <platform>_connect /
+    <platform>_read overrides.
+    """
+    section = config['timeouts'] if config.has_section('timeouts') else {}
+    default = (
+        float(section.get('connect', DEFAULT_TIMEOUT[0])),
+        float(section.get('read', DEFAULT_TIMEOUT[1]))
+    )
+    return {
+        name: (float(section.get(f"{name}_connect", default[0])), float(section.get(f"{name}_read", default[1])))
+        for name in names
+    }
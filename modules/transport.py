@@ -0,0 +1,300 @@
+import codecs, threading, time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ReadTimeoutError
+from modules.timeouts import Timeout, DEFAULT_TIMEOUT, check_deadline, request_timeout
+
+# Hosts the checkers talk to; each gets its own connection pool
+PLATFORM_HOSTS = [
+    "www.instagram.com",
+    "www.facebook.com",
+    "www.tiktok.com",
+    "api.x.com",
+    "telegram.me",
+    "www.lemon8-app.com",
+    "www.threads.com",
+    "www.snapchat.com",
+]
+
+# Seconds the current thread spent opening connections (DNS, TCP and TLS)
+# during its latest fetch; None when every request reused a connection
+_connect_time = threading.local()
+
+class _HandshakeCounter:
+    """Count and time requests sent on a freshly opened socket.
+
+    urllib3's num_connections only counts connection objects, which are
+    silently reconnected when the server drops them, so it undercounts
+    handshakes. A connection with no socket at send time always connects.
+    """
+    num_handshakes = 0
+
+    def _make_request(self, conn, *args, **kwargs):
+        if conn.is_closed:
+            self.num_handshakes += 1
+        return super()._make_request(conn, *args, **kwargs)
+
+    def _validate_conn(self, conn):
+        # Connect here rather than lazily inside the request so it can be timed
+        if conn.is_closed:
+            started = time.perf_counter()
+            conn.connect()
+            elapsed = time.perf_counter() - started
+            _connect_time.seconds = (getattr(_connect_time, 'seconds', None) or 0.0) + elapsed
+        super()._validate_conn(conn)
+
+class CountingHTTPConnectionPool(_HandshakeCounter, HTTPConnectionPool):
+    pass
+
+class CountingHTTPSConnectionPool(_HandshakeCounter, HTTPSConnectionPool):
+    pass
+
+COUNTING_POOLS = {
+    "http": CountingHTTPConnectionPool,
+    "https": CountingHTTPSConnectionPool,
+}
+
+class PooledAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = COUNTING_POOLS
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        # SOCKS managers bring their own pool classes
+        if not proxy.lower().startswith('socks'):
+            manager.pool_classes_by_scheme = COUNTING_POOLS
+        return manager
+
+def load_max_bytes(config):
+    """Read per-platform body size caps from the [max_bytes] section of config.ini"""
+    if not config.has_section('max_bytes'):
+        return {}
+    return {name: config.getint('max_bytes', name) for name in config.options('max_bytes')}
+
+def load_host_pools(config):
+    """Read per-host pool sizes from the [pools] section of config.ini"""
+    if not config.has_section('pools'):
+        return {}
+    return {host: config.getint('pools', host) for host in config.options('pools')}
+
+def build_session(pool_size=10, host_pools=None, keep_alive=True):
+    """Create a requests.Session with a dedicated keep-alive pool per platform host.
+
+    pool_size is the number of connections kept open per host; host_pools
+    overrides it for individual hosts. Requests never block waiting for a
+    pool slot, extra connections are opened and discarded instead.
+    """
+    host_pools = host_pools or {}
+    session = requests.Session()
+    session.mount("http://", PooledAdapter(pool_connections=len(PLATFORM_HOSTS), pool_maxsize=pool_size))
+    session.mount("https://", PooledAdapter(pool_connections=len(PLATFORM_HOSTS), pool_maxsize=pool_size))
+
+    for host in set(PLATFORM_HOSTS) | set(host_pools):
+        size = host_pools.get(host, pool_size)
+        session.mount(f"https://{host}", PooledAdapter(pool_connections=1, pool_maxsize=size))
+
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+def connection_stats(session):
+    """Return {host: {"new": n, "reused": n}} from the session's urllib3 pools"""
+    if isinstance(session, HTTP2Session):
+        return session.stats
+
+    stats = {}
+    for adapter in set(session.adapters.values()):
+        # Proxied requests use a separate manager, and pools, per proxy
+        for manager in (adapter.poolmanager, *adapter.proxy_manager.values()):
+            pools = manager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                entry = stats.setdefault(pool.host, {"new": 0, "reused": 0})
+                handshakes = getattr(pool, "num_handshakes", pool.num_connections)
+                entry["new"] += handshakes
+                entry["reused"] += max(pool.num_requests - handshakes, 0)
+    return stats
+
+CHUNK_SIZE = 16 * 1024
+
+def chunk_size(max_bytes):
+    """Read size for a body capped at max_bytes, so a small cap is not overshot by a whole chunk"""
+    return min(CHUNK_SIZE, max_bytes) if max_bytes else CHUNK_SIZE
+
+# Bodies with at most this much left after an early stop are drained so the
+# keep-alive connection can be reused; larger remainders close it instead.
+DRAIN_LIMIT = 64 * 1024
+
+class BodyReader:
+    """Decode a response body chunk by chunk until the verdict is known.
+
+    feed() returns True once the stop regex matches the text read so far or
+    max_bytes have been read. Matching only rescans a short overlap of
+    already-seen text, so each chunk costs O(chunk) whatever the body size.
+    """
+    OVERLAP = 4096
+
+    def __init__(self, stop=None, max_bytes=None, encoding='utf-8'):
+        self.stop = stop
+        self.max_bytes = max_bytes
+        self.encoding = encoding
+        self.decoder = None
+        self.parts = []
+        self.tail = ''
+        self.size = 0
+        self.complete = True
+        self.headers = {}
+        self.timings = {}
+
+    def feed(self, chunk):
+        if self.decoder is None:
+            self.decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        self.size += len(chunk)
+        text = self.decoder.decode(chunk)
+        self.parts.append(text)
+
+        window = self.tail + text
+        self.tail = window[-self.OVERLAP:]
+        if self.stop is not None and self.stop.search(window):
+            self.complete = False
+            return True
+        if self.max_bytes is not None and self.size >= self.max_bytes:
+            self.complete = False
+            return True
+        return False
+
+    @property
+    def text(self):
+        return ''.join(self.parts)
+
+def fetch(session, request, max_bytes=None, timeout=DEFAULT_TIMEOUT, deadline=None):
+    """Send a platform request, reading the body only until the verdict is known.
+
+    Returns (status_code, BodyReader). request is a checker request dict
+    with url, headers and optional method, params, allow_redirects and
+    stop regex.
+    timeout is (connect, read) seconds, clamped to the monotonic deadline,
+    which is also checked between chunks; either raises Timeout.
+    """
+    if isinstance(session, HTTP2Session):
+        return session.fetch(request, max_bytes, timeout, deadline)
+
+    _connect_time.seconds = None
+    started = time.perf_counter()
+    try:
+        response = session.request(
+            request.get("method", "GET"),
+            request["url"],
+            params=request.get("params"),
+            headers=request["headers"],
+            allow_redirects=request.get("allow_redirects", True),
+            timeout=request_timeout(timeout, deadline),
+            stream=True
+        )
+    except requests.exceptions.Timeout as e:
+        raise Timeout(f"Request timed out: {e}")
+
+    first_byte = time.perf_counter()
+    reader = BodyReader(request.get("stop"), max_bytes, response.encoding or 'utf-8')
+    reader.headers = response.headers
+    try:
+        for chunk in response.iter_content(chunk_size(max_bytes)):
+            if reader.feed(chunk):
+                break
+            check_deadline(deadline)
+    except requests.exceptions.ConnectionError as e:
+        # requests reports a read timeout mid-body as a ConnectionError
+        if e.args and isinstance(e.args[0], ReadTimeoutError):
+            raise Timeout(f"Read timed out: {e}")
+        raise
+    finally:
+        if not reader.complete:
+            # content-length counts wire bytes, which may be compressed
+            length = response.headers.get('content-length', '')
+            if length.isdigit() and int(length) - response.raw.tell() <= DRAIN_LIMIT:
+                for _ in response.iter_content(CHUNK_SIZE):
+                    pass
+        response.close()
+    reader.timings = phase_timings(started, first_byte, time.perf_counter(), _connect_time.seconds)
+    return response.status_code, reader
+
+def phase_timings(started, first_byte, finished, connect=None):
+    """Phase durations of one fetch; first_byte is when the response headers arrived"""
+    timings = {"first_byte": first_byte - started, "body": finished - first_byte, "fetch": finished - started}
+    if connect is not None:
+        timings["connect"] = connect
+    return timings
+
+class HTTP2Session:
+    """Minimal requests-style wrapper around httpx.Client with HTTP/2 enabled"""
+
+    def __init__(self, pool_size=10, keep_alive=True):
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=pool_size * len(PLATFORM_HOSTS),
+            max_keepalive_connections=pool_size * len(PLATFORM_HOSTS) if keep_alive else 0
+        )
+        self.client = httpx.Client(http2=True, limits=limits)
+        self.stats = {}
+
+    def fetch(self, request, max_bytes=None, timeout=DEFAULT_TIMEOUT, deadline=None):
+        import httpx
+
+        connect, read = request_timeout(timeout, deadline)
+        reader = BodyReader(request.get("stop"), max_bytes)
+        handshake = {}
+
+        def trace(event, info):
+            if event == "connection.connect_tcp.started":
+                handshake["started"] = time.perf_counter()
+            elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                handshake["seconds"] = time.perf_counter() - handshake["started"]
+
+        started = time.perf_counter()
+        try:
+            with self.client.stream(
+                request.get("method", "GET"),
+                request["url"],
+                params=request.get("params"),
+                headers=request["headers"],
+                follow_redirects=request.get("allow_redirects", True),
+                timeout=httpx.Timeout(read, connect=connect),
+                extensions={"trace": trace}
+            ) as response:
+                first_byte = time.perf_counter()
+                reader.encoding = response.encoding or 'utf-8'
+                reader.headers = response.headers
+                # Leaving the block early only resets this HTTP/2 stream, the
+                # connection stays open for the next request
+                for chunk in response.iter_bytes(chunk_size(max_bytes)):
+                    if reader.feed(chunk):
+                        break
+                    check_deadline(deadline)
+        except httpx.TimeoutException as e:
+            raise Timeout(f"Request timed out: {e}")
+        reader.timings = phase_timings(started, first_byte, time.perf_counter(), handshake.get("seconds"))
+
+        # httpx does not expose per-connection counters. HTTP/2 multiplexes
+        # every request to a host over one connection, so only the first
+        # HTTP/2 response per host is a handshake; HTTP/1.1 fallbacks are
+        # counted as new, which understates reuse rather than inflating it.
+        entry = self.stats.setdefault(response.url.host, {"new": 0, "reused": 0})
+        if response.http_version == "HTTP/2" and entry["new"]:
+            entry["reused"] += 1
+        else:
+            entry["new"] += 1
+        return response.status_code, reader
+
+def open_session(pool_size=10, host_pools=None, keep_alive=True, http2=False, logger=None):
+    """Build the shared session, using HTTP/2 when httpx[http2] is installed"""
+    if http2:
+        try:
+            import h2  # noqa: F401
+            return HTTP2Session(pool_size=pool_size, keep_alive=keep_alive)
+        except ImportError:
+            if logger:
+                logger.warning("HTTP/2 needs httpx[http2] installed, falling back to HTTP/1.1")
+    return build_session(pool_size=pool_size, host_pools=host_pools, keep_alive=keep_alive)
@@ -0,0 +1,101 @@
+import re
+
+# Expansion rules, applied in this order
+RULES = ('join', 'reverse', 'initials', 'suffix')
+
+# Characters placed between name parts; joining with nothing is always tried
+SEPARATORS = '._-'
+
+# Appended to every variant by the suffix rule
+SUFFIXES = ('1', '01', '123')
+
+# Characters that split a seed into parts
+SEED_SPLIT = re.compile(r'[\s._\-]+')
+
+def seed_parts(seed):
+    """Split a seed such as "John Doe" or "@john.doe" into its name parts"""
+    return [part for part in SEED_SPLIT.split(seed.strip().lstrip('@')) if part]
+
+def expand(seed, rules=RULES, separators=SEPARATORS, suffixes=SUFFIXES):
+    """Return the seed followed by its variants, without exact duplicates.
+
+        join      john.doe, john_doe, john-doe, johndoe
+        reverse   doe.john, doejohn, ...
+        initials  j.doe, jdoe, johnd, ...
+        suffix    every variant above with each suffix appended (johndoe1)
+    """
+    unknown = [rule for rule in rules if rule not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown variant rule(s): {', '.join(unknown)}")
+
+    parts = seed_parts(seed)
+    variants = [seed.strip().lstrip('@')]
+    joins = ('', *separators)
+    if len(parts) > 1:
+        if 'join' in rules:
+            variants += [sep.join(parts) for sep in joins]
+        if 'reverse' in rules:
+            variants += [sep.join(reversed(parts)) for sep in joins]
+        if 'initials' in rules:
+            first, last = parts[0], parts[-1]
+            variants += [sep.join((first[0], last)) for sep in joins]
+            variants += [sep.join((first, last[0])) for sep in joins]
+    if 'suffix' in rules:
+        variants += [variant + suffix for variant in variants for suffix in suffixes]
+    return list(dict.fromkeys(variant for variant in variants if variant))
+
+def expand_all(seeds, **settings):
+    """Yield the variants of every seed, lazily so long seed lists stream"""
+    for seed in seeds:
+        yield from expand(seed, **settings)
+
+class Sweep:
+    """Per-platform pruning and dedup for a stream of usernames.
+
+    A username is dropped for a platform when the platform cannot have it
+    (wrong characters or length) or when its normalised form was already
+    queued there, e.g. JohnDoe after johndoe on case-insensitive X. Only
+    the thread producing tasks calls platforms(), so no lock is needed.
+    """
+
+    def __init__(self):
+        self.seen = {}
+        self.pruned = 0
+        self.duplicates = 0
+
+    def platforms(self, username, platforms):
+        todo = []
+        for platform in platforms:
+            key = platform.normalize(username)
+            if key is None:
+                self.pruned += 1
+                continue
+            seen = self.seen.setdefault(platform.name, set())
+            if key in seen:
+                self.duplicates += 1
+                continue
+            seen.add(key)
+            todo.append(platform)
+        return todo
+
+def parse_rules(value):
+    return tuple(rule.strip() for rule in value.split(',') if rule.strip())
+
+def load_variant_settings(config):
+    """Read [variants] options from config.ini.
+
+    Recognised keys: rules (comma-separated, from RULES), separators (a
+    string of characters) and suffixes (comma-separated).
+    """
+    if not config.has_section('variants'):
+        return {}
+
+    section = config['variants']
+    settings = {}
+    if 'rules' in section:
+        settings['rules'] = parse_rules(section['rules'])
+    if 'separators' in section:
+        settings['separators'] = section['separators'].strip()
+    if 'suffixes' in section:
+        settings['suffixes'] = tuple(suffix.strip() for suffix in section['suffixes'].split(',') if suffix.strip())
+    return settings
@@ -0,0 +1,68 @@
+import os, sys, threading
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'bench'))
+
+from modules.platforms import PLATFORMS, use_base_url
+from modules.render import Renderer
+from modules.socmed import SOCMED
+
+@pytest.fixture
+def mock_platforms():
+    """bench/mock_server.py on a free port, with every platform pointed at it"""
+    import mock_server
+    saved = {name: (platform.request_url, platform.batch.url if platform.batch else None)
+             for name, platform in PLATFORMS.items()}
+    server = mock_server.serve(port=0, page_kb=1, slow_ms=0, retry_after=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    use_base_url(f"http://127.0.0.1:{server.server_address[1]}")
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        for name, (request_url, batch_url) in saved.items():
+            PLATFORMS[name].request_url = request_url
+            if batch_url:
+                PLATFORMS[name].batch.url = batch_url
+
+@pytest.fixture
+def socmed():
+    engine = SOCMED()
+    engine.renderer = Renderer('silent')
+    yield engine
+    engine.close()
+
+@pytest.fixture
+def fetched(socmed):
+    """URLs of every request socmed sends, in order"""
+    urls = []
+    fetch = socmed._fetch
+    def recorded(name, request, deadline=None):
+        urls.append(request["url"])
+        return fetch(name, request, deadline)
+    socmed._fetch = recorded
+    return urls
+
+class Records:
+    """Stands in for a result writer, keeping every record written"""
+
+    def __init__(self):
+        self.records = []
+
+    def write(self, data):
+        self.records.append(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def records(socmed):
+    """Records socmed writes, in order"""
+    socmed.output = Records()
+    return socmed.output.records
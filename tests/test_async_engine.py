@@ -0,0 +1,23 @@
+"""The async engine against bench/mock_server.py"""
+import threading
+from modules.async_engine import AsyncSOCMED
+from modules.platforms import select_platforms
+
+def test_cache_and_output_stay_off_the_event_loop(mock_platforms, socmed, records, tmp_path, monkeypatch):
+    from modules.cache import ResultCache
+    socmed.platforms = select_platforms(['instagram', 'threads', 'x'])
+    socmed.batch_size = 100
+    socmed.cache = ResultCache(str(tmp_path / 'cache.sqlite'))
+    loop_thread = threading.current_thread()
+    on_loop = []
+    for target, method in ((socmed.output, 'write'), (socmed.cache, 'get'), (socmed.cache, 'put')):
+        original = getattr(target, method)
+        def watched(*args, original=original, method=method):
+            if threading.current_thread() is loop_thread:
+                on_loop.append(method)
+            return original(*args)
+        monkeypatch.setattr(target, method, watched)
+
+    AsyncSOCMED(socmed).run_bulk(['alice', 'bob', 'missing_carol'], summary=False)
+    assert len(records) == 9
+    assert on_loop == []
@@ -0,0 +1,66 @@
+from modules.platforms import PLATFORMS, select_platforms
+
+def test_single_name_run_uses_graphql(mock_platforms, socmed, fetched):
+    socmed.platforms = select_platforms(['x'])
+    socmed.batch_size = 100
+    socmed.input = 'alice'
+    socmed.run_checkers()
+    assert len(fetched) == 1
+    assert fetched[0].endswith('/UserByScreenName')
+
+def test_several_names_share_one_batch(mock_platforms, socmed, fetched):
+    socmed.platforms = select_platforms(['x'])
+    socmed.batch_size = 100
+    socmed.run_bulk(['alice', 'bob', 'missing_carol'], summary=False)
+    assert len(fetched) == 1
+    assert fetched[0].endswith('/users/lookup.json')
+
+def test_leftover_name_uses_graphql(mock_platforms, socmed, fetched):
+    socmed.platforms = select_platforms(['x'])
+    socmed.batch_size = 2
+    socmed.run_bulk(['alice', 'bob', 'carol'], summary=False)
+    assert sorted(url.rsplit('/', 1)[1] for url in fetched) == ['UserByScreenName', 'lookup.json']
+
+def test_service_lookup_of_one_name_is_not_batched(socmed):
+    from modules.service import Service
+    socmed.batch_size = 100
+    tasks = Service(socmed, ('127.0.0.1', 0))._tasks(['alice'], [PLATFORMS['x']])
+    assert [(name, target) for name, target, _ in tasks] == [('x', 'alice')]
+
+# Exact repeats and a case variant of alice, which X treats as one name
+DUPLICATES = ['alice', 'Bob', 'missing_x', 'ALICE', 'alice']
+
+def x_records(records):
+    return [(record["username"], record["status"]) for record in records if record["platform"] == 'X']
+
+def test_batch_asks_once_per_name_and_records_every_occurrence(mock_platforms, socmed, records, monkeypatch):
+    socmed.platforms = select_platforms(['x'])
+    socmed.batch_size = 100
+    sent = []
+    fetch = socmed._fetch
+    monkeypatch.setattr(socmed, '_fetch', lambda name, request, deadline=None:
+                        sent.append(request["params"]) or fetch(name, request, deadline))
+    socmed.run_bulk(DUPLICATES, summary=False)
+    assert [params["screen_name"] for params in sent] == ['alice,Bob,missing_x']
+    assert sorted(x_records(records)) == sorted([
+        ('alice', 'found'), ('Bob', 'found'), ('missing_x', 'not_found'), ('ALICE', 'found'), ('alice', 'found')])
+    assert socmed.metrics.to_dict()['x']['counters']['coalesced'] == 2
+
+def test_async_batch_records_every_occurrence(mock_platforms, socmed, records):
+    from modules.async_engine import AsyncSOCMED
+    socmed.platforms = select_platforms(['x'])
+    socmed.batch_size = 100
+    AsyncSOCMED(socmed).run_bulk(DUPLICATES, summary=False)
+    assert sorted(x_records(records)) == sorted([
+        ('alice', 'found'), ('Bob', 'found'), ('missing_x', 'not_found'), ('ALICE', 'found'), ('alice', 'found')])
+
+def test_service_lookup_answers_every_occurrence(mock_platforms, socmed):
+    from modules.service import Service
+    socmed.batch_size = 100
+    service = Service(socmed, ('127.0.0.1', 0))
+    usernames, platforms = service._parse({"usernames": ['alice', 'alice', 'missing_x'], "platforms": ['x', 'instagram']})
+    answered = [record for task in service._tasks(usernames, platforms) for record in service._check(*task)]
+    assert sorted((record["platform"], record["username"], record["status"]) for record in answered) == [
+        ('X', 'alice', 'found'), ('X', 'alice', 'found'), ('X', 'missing_x', 'not_found'),
+        ('instagram', 'alice', 'found'), ('instagram', 'alice', 'found'), ('instagram', 'missing_x', 'not_found'),
+    ]
@@ -0,0 +1,63 @@
+"""Coordinator and worker over a local TCP connection"""
+import threading
+import pytest
+from modules.distributed import Coordinator, TaskQueue, Worker
+from modules.platforms import PLATFORMS
+from modules.socmed import SOCMED
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = TaskQueue(str(tmp_path / 'queue.sqlite'), lease_seconds=0.3)
+    yield queue
+    queue.close()
+
+def test_queue_keys_tasks_by_normalised_name(queue):
+    assert queue.add([('instagram', 'johndoe', 'JohnDoe'), ('instagram', 'johndoe', 'johndoe'),
+                      ('snapchat', 'JohnDoe', 'JohnDoe')]) == 2
+    assert sorted(queue.lease('w1', 10)) == [['instagram', 'JohnDoe'], ['snapchat', 'JohnDoe']]
+    assert queue.complete([('instagram', 'johndoe', 'found')]) == [('instagram', 'johndoe')]
+    assert queue.counts() == {'done': 1, 'leased': 1}
+
+def test_queue_in_the_old_layout_is_replaced(tmp_path):
+    import sqlite3
+    path = str(tmp_path / 'queue.sqlite')
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE tasks (platform TEXT, username TEXT, state TEXT, PRIMARY KEY (platform, username))")
+    db.commit()
+    db.close()
+    with pytest.raises(RuntimeError, match='older version'):
+        TaskQueue(path, resume=True)
+    queue = TaskQueue(path)
+    assert queue.add([('x', 'alice', 'alice')]) == 1
+    queue.close()
+
+def test_coordinator_gives_up_without_workers(socmed, queue, monkeypatch):
+    monkeypatch.setattr(Coordinator, 'IDLE_CHECK_EVERY', 0.05)
+    socmed.platforms = [PLATFORMS['x']]
+    with pytest.raises(RuntimeError, match='No worker connected'):
+        Coordinator(socmed, queue, ('127.0.0.1', 0)).run(['alice'])
+
+def test_coordinator_settles_a_worker_run(mock_platforms, socmed, records, queue, monkeypatch):
+    monkeypatch.setattr(Coordinator, 'IDLE_CHECK_EVERY', 0.05)
+    socmed.platforms = [PLATFORMS['instagram'], PLATFORMS['threads']]
+    worker = SOCMED()
+    worker.renderer = socmed.renderer
+    threads = []
+
+    def spawn(address):
+        thread = threading.Thread(target=Worker(worker, address, poll=0.05).run, daemon=True)
+        thread.start()
+        threads.append(thread)
+        return []
+
+    try:
+        Coordinator(socmed, queue, ('127.0.0.1', 0)).run(['alice', 'missing_bob', 'Alice'], spawn)
+        threads[0].join(5)
+    finally:
+        worker.close()
+    assert sorted((record["platform"], record["username"], record["status"]) for record in records) == [
+        ('instagram', 'alice', 'found'), ('instagram', 'missing_bob', 'not_found'),
+        ('threads', 'alice', 'found'), ('threads', 'missing_bob', 'not_found'),
+    ]
+    # Alice is alice on both platforms, so it was not checked again
+    assert queue.counts() == {'done': 4}
@@ -0,0 +1,166 @@
+"""Parity between the early-stop extractors and the BeautifulSoup parsers they replaced.
+
+Each bench fixture, and a few inline pages for the fallback layouts, is
+parsed by the platform's current parser and by a reference parser that
+keeps the old full-tree BeautifulSoup lookups. The resulting records must
+be equal.
+"""
+import os, re
+import pytest
+from bs4 import BeautifulSoup
+from modules.platforms import PLATFORMS, parse_facebook, parse_tiktok, parse_x
+from tests.conftest import ROOT
+
+FIXTURES = os.path.join(ROOT, 'bench', 'fixtures')
+
+PADDING = '<div class="pad"><span>lorem ipsum dolor sit amet</span></div>\n' * 64
+
+# =============================================================== [REFERENCE] =============================================================== #
+
+def soup_instagram(username, status, text):
+    soup = BeautifulSoup(text, 'html.parser')
+    og_desc = soup.find("meta", {"property": "og:description"})
+    if og_desc:
+        og_content = og_desc.get("content", "").strip()
+        handle, lowered = username.lower(), og_content.lower()
+        if f"@{handle}" in lowered or f"&#064;{handle}" in lowered:
+            match = re.search(r"([\d,\.]+)\s+Followers,\s+([\d,\.]+)\s+Following,\s+([\d,\.]+)\s+Posts", og_content)
+            followers, following, posts = match.groups() if match else ("0", "0", "0")
+            return True, {"Followers": followers, "Following": following, "Posts": posts}
+
+    title_start, title_end = text.find('<title>'), text.find('</title>')
+    if title_start == -1 or title_end == -1:
+        return False, None
+    title = text[title_start + 7:title_end].strip()
+    handle, lowered = username.lower(), title.lower()
+    return (f"@{handle})" in lowered or f"&#064;{handle})" in lowered) and "Instagram photos and videos" in title, None
+
+def soup_telegram(username, status, text):
+    soup = BeautifulSoup(text, 'html.parser')
+    values = []
+    for prop in ('og:title', 'og:description', 'twitter:image'):
+        tag = soup.find('meta', {'property': prop})
+        values.append(tag['content'] if tag and 'content' in tag.attrs else None)
+    og_title, og_description, twitter_image = values
+    if og_title and og_description and twitter_image:
+        return True, {"Name": og_title, "Desc": og_description, "Image": twitter_image}
+    return False, None
+
+def soup_lemon8(username, status, text):
+    soup = BeautifulSoup(text, 'html.parser')
+    if status != 200 or not soup.find('div', class_='user-desc-main'):
+        return False, None
+    name_tag = soup.find('h1', class_='user-desc-base-name')
+    display_name = name_tag.get_text(strip=True) if name_tag else "Unknown"
+    following = followers = likes_saves = "0"
+    for item in soup.find_all('a', class_='user-desc-main-info-item'):
+        spans = item.find_all('span')
+        if len(spans) >= 2:
+            value, label = spans[0].get_text(strip=True), spans[1].get_text(strip=True).lower()
+            if 'mengikuti' in label or 'following' in label:
+                following = value
+            elif 'pengikut' in label or 'followers' in label:
+                followers = value
+            elif 'suka dan simpanan' in label or 'likes and saves' in label:
+                likes_saves = value
+    return True, {"Name": display_name, "Following": following, "Followers": followers, "Likes/Saves": likes_saves}
+
+def soup_threads(username, status, text):
+    if status == 404:
+        return False, None
+    if status >= 400:
+        raise ValueError(f"Unexpected HTTP {status}")
+    soup = BeautifulSoup(text, 'html.parser')
+    profile = soup.find('div', class_='user-desc-main')
+    if profile:
+        title_tag = profile.find('h1', class_='user-desc-base-name')
+        title = title_tag.get_text(strip=True) if title_tag else username
+        followers = profile.find('span', attrs={'title': re.compile(r'^\d')}).get('title', '0')
+    else:
+        meta = soup.find('meta', attrs={'name': 'twitter:description'})
+        if meta and meta.has_attr('content'):
+            m = re.search(r'(?P<followers>\d+)\s+Followers', meta['content'], re.IGNORECASE)
+            followers = m.group('followers') if m else "0"
+        else:
+            span = soup.find('span', title=re.compile(r'^\d+'))
+            sib = span.find_next_sibling(string=re.compile(r'followers?', re.IGNORECASE)) if span else None
+            if not (span and sib):
+                raise ValueError("Could not find followers count")
+            followers = span['title']
+        title = re.split(r'\s*\(@', soup.find('title').get_text(strip=True), 1)[0]
+    title = re.sub(r'\s*•.*$', '', title)
+    return True, {"Name": title, "Followers": followers}
+
+def soup_snapchat(username, status, text):
+    if status == 404:
+        return False, None
+    if status >= 400:
+        raise ValueError(f"Unexpected HTTP {status}")
+    soup = BeautifulSoup(text, 'html.parser')
+    el = soup.select_one('span.UserDetailsCard_title__K9Awz.UserDetailsCard_oneLineTruncation__z0qou')
+    return True, {"Name": el.get_text(strip=True) if el else None}
+
+REFERENCE = {
+    'instagram': soup_instagram,
+    'telegram': soup_telegram,
+    'lemon8': soup_lemon8,
+    'threads': soup_threads,
+    'snapchat': soup_snapchat,
+    # These parsers never built a BeautifulSoup tree, so they are their own reference
+    'facebook': parse_facebook,
+    'tiktok': parse_tiktok,
+    'x': parse_x,
+}
+
+# =============================================================== [PAGES] =============================================================== #
+
+def fixture_pages():
+    for filename in sorted(os.listdir(FIXTURES)):
+        name, _ = os.path.splitext(filename)
+        with open(os.path.join(FIXTURES, filename), encoding='utf-8') as handle:
+            template = handle.read()
+        for username, padding in (('mockuser', ''), ('Mock_User', PADDING)):
+            text = template.replace('{{username}}', username).replace('{{padding}}', padding)
+            yield pytest.param(name.split('_', 1)[0], username, 200, text, id=f"{name}-{username}")
+
+# Layouts the fixtures do not cover
+INLINE = [
+    ('threads-profile-div', 'threads', 'mockuser', 200,
+     '<html><head><title>x</title></head><body><div class="user-desc-main">'
+     '<h1 class="user-desc-base-name">Mock User • Threads</h1><span title="1,234">1.2K</span></div></body></html>'),
+    ('threads-sibling-text', 'threads', 'mockuser', 200,
+     '<html><head><title>Mock User (@mockuser) • Threads</title></head>'
+     '<body><p><span title="42">42</span> followers</p></body></html>'),
+    ('lemon8-redirect', 'lemon8', 'mockuser', 302, ''),
+    ('lemon8-no-profile', 'lemon8', 'mockuser', 200, '<html><body><div class="home"></div></body></html>'),
+    ('lemon8-localised', 'lemon8', 'mockuser', 200,
+     '<div class="user-desc-main"><a class="user-desc-main-info-item"><span>3,4 rb</span><span>Pengikut</span></a>'
+     '<a class="user-desc-main-info-item"><span> 7 </span><span>Mengikuti</span></a></div>'),
+    ('instagram-other-handle', 'instagram', 'mockuser', 200,
+     '<meta property="og:description" content="1 Followers, 2 Following, 3 Posts - from Someone (@other)">'),
+    ('telegram-partial-meta', 'telegram', 'mockuser', 200,
+     '<meta property="og:title" content="Telegram"><meta property="og:description" content="">'),
+    ('snapchat-no-card', 'snapchat', 'mockuser', 200, '<html><body><main></main></body></html>'),
+    ('threads-missing', 'threads', 'mockuser', 404, ''),
+    ('snapchat-missing', 'snapchat', 'mockuser', 404, ''),
+    ('snapchat-server-error', 'snapchat', 'mockuser', 500, ''),
+]
+
+def outcome(parse, username, status, text):
+    try:
+        return parse(username, status, text)
+    except Exception as e:
+        return type(e).__name__
+
+@pytest.mark.parametrize('platform, username, status, text',
+                         [*fixture_pages(), *(pytest.param(*case[1:], id=case[0]) for case in INLINE)])
+def test_extractor_matches_beautifulsoup(platform, username, status, text):
+    current = outcome(PLATFORMS[platform].parse, username, status, text)
+    reference = outcome(REFERENCE[platform], username, status, text)
+    if isinstance(current, tuple) and isinstance(reference, tuple):
+        current = PLATFORMS[platform].verdict(username, *current)[0]
+        reference = PLATFORMS[platform].verdict(username, *reference)[0]
+    assert current == reference
+
+def test_every_platform_has_a_reference():
+    assert set(REFERENCE) == set(PLATFORMS)
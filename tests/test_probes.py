@@ -0,0 +1,35 @@
+"""Existence-only probes against bench/mock_server.py"""
+import mock_server
+import pytest
+from modules.platforms import PLATFORMS
+
+def test_ranged_probe_reads_no_more_than_its_range(mock_platforms, socmed, monkeypatch):
+    # The mock ignores Range, so only the reader keeps the probe to its cap
+    monkeypatch.setattr(mock_server.MockHandler, 'padding', mock_server.make_padding(64))
+    socmed.existence_only = True
+    socmed.check('snapchat', 'mockuser')
+    counters = socmed.metrics.to_dict()['snapchat']['counters']
+    assert counters['probes'] == 1
+    assert counters['probe_bytes'] <= PLATFORMS['snapchat'].probe.range_bytes
+
+def test_probe_settles_a_missing_profile(mock_platforms, socmed, fetched):
+    socmed.existence_only = True
+    for name in ('threads', 'snapchat'):
+        assert socmed.check(name, 'missing_user')["status"] == "not_found"
+    # Each probe's 404 was the answer, with no full fetch after it
+    assert len(fetched) == 2
+    counters = socmed.metrics.to_dict()
+    assert counters['threads']['counters']['probe_hits'] == counters['snapchat']['counters']['probe_hits'] == 1
+
+@pytest.mark.parametrize('name', ['threads', 'snapchat'])
+def test_missing_profile_agrees_with_and_without_probes(mock_platforms, socmed, tmp_path, name):
+    from modules.cache import ResultCache
+    full = socmed.check(name, 'missing_user')
+    socmed.existence_only = True
+    socmed.cache = ResultCache(str(tmp_path / 'cache.sqlite'))
+    probed = socmed.check(name, 'missing_user')
+    assert full == probed and probed["status"] == "not_found"
+    # What the probe cached is what a normal run would have found
+    socmed.existence_only = False
+    assert socmed.check(name, 'missing_user') == full
+    assert socmed.metrics.to_dict()[name]['counters']['cache_hits'] == 1
@@ -0,0 +1,23 @@
+"""Proxy list loading"""
+import sys
+import pytest
+from modules.proxies import load_proxies
+
+def write_list(tmp_path, *urls):
+    path = tmp_path / 'proxies.txt'
+    path.write_text('# pool\n' + '\n'.join(urls) + '\n', encoding='utf-8')
+    return str(path)
+
+def test_socks_proxy_without_pysocks_is_refused(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'socks', None)
+    with pytest.raises(RuntimeError, match='PySocks'):
+        load_proxies(write_list(tmp_path, 'http://10.0.0.1:3128', 'socks5h://user:pw@10.0.0.2:1080'))
+
+def test_http_proxies_do_not_need_pysocks(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'socks', None)
+    urls = ['http://10.0.0.1:3128', 'https://10.0.0.2:3128']
+    assert load_proxies(write_list(tmp_path, *urls)) == urls
+
+def test_malformed_proxy_is_refused(tmp_path):
+    with pytest.raises(ValueError, match='Not a proxy URL'):
+        load_proxies(write_list(tmp_path, 'ftp://10.0.0.1:21'))
@@ -0,0 +1,41 @@
+"""Typed records read back from output"""
+import pytest
+from modules.records import PlatformId, Result, Status, parse_count
+
+@pytest.mark.parametrize('value, expected', [
+    ('987', 987),
+    ('12,345', 12345),
+    ('1.234.567', 1234567),
+    ('1.2M', 1200000),
+    ('3,4 rb', 3400),
+    ('1,2 jt', 1200000),
+    ('10K+', 10000),
+    (42, 42),
+    ('1.5', None),
+    ('1,23', None),
+    ('12,34,567', None),
+    ('1,234.5', None),
+    ('', None),
+    (None, None),
+    (True, None),
+])
+def test_parse_count(value, expected):
+    assert parse_count(value) == expected
+
+def test_from_dict_reads_a_full_record():
+    result = Result.from_dict({"platform": "instagram", "username": "alice", "found": True, "status": "found",
+                               "stats": {"Followers": "1,234", "Following": "56", "Posts": "7"}})
+    assert (result.platform, result.status, result.followers, result.following, result.posts) == \
+        (PlatformId.instagram, Status.FOUND, 1234, 56, 7)
+
+@pytest.mark.parametrize('data, status', [
+    ({"platform": "X", "username": "alice", "found": True}, Status.FOUND),
+    ({"platform": "X", "username": "alice", "found": False}, Status.NOT_FOUND),
+    ({"platform": "X", "username": "alice"}, Status.ERROR),
+])
+def test_from_dict_defaults_a_missing_status(data, status):
+    assert Result.from_dict(data).status is status
+
+def test_from_dict_defaults_a_missing_username():
+    result = Result.from_dict({"platform": "X", "status": "error"})
+    assert result.username == '' and result.row()[1] == ''
@@ -0,0 +1,58 @@
+"""Validation of --serve lookup requests"""
+import pytest
+from modules.platforms import PLATFORMS
+from modules.service import Service, ServiceError
+
+@pytest.fixture
+def service(socmed):
+    return Service(socmed, ('127.0.0.1', 0))
+
+@pytest.mark.parametrize('usernames', [[123], [None], [['alice']], [{'name': 'alice'}], ['alice', True]])
+def test_non_string_usernames_are_refused(service, usernames):
+    with pytest.raises(ServiceError) as error:
+        service._parse({"usernames": usernames})
+    assert error.value.status == 400
+
+@pytest.mark.parametrize('platforms', [[1], ['x', None], {'x': True}, 7])
+def test_non_string_platforms_are_refused(service, platforms):
+    with pytest.raises(ServiceError) as error:
+        service._parse({"usernames": ['alice'], "platforms": platforms})
+    assert error.value.status == 400
+
+def test_platforms_as_list_or_comma_string(service):
+    expected = (['alice'], [PLATFORMS['x'], PLATFORMS['threads']])
+    assert service._parse({"usernames": [' @alice '], "platforms": ['X', 'threads']}) == expected
+    assert service._parse({"usernames": ['alice'], "platforms": 'x, threads,'}) == expected
+
+@pytest.fixture
+def server(service):
+    import threading
+    server = service.serve()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_oversized_body_closes_the_connection(server):
+    import http.client
+    from modules.service import MAX_BODY
+    connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+    connection.putrequest('POST', '/lookup')
+    connection.putheader('Content-Length', str(MAX_BODY + 1))
+    connection.endheaders()
+    response = connection.getresponse()
+    assert response.status == 413 and response.getheader('Connection') == 'close'
+    connection.close()
+
+def test_lookup_over_capacity_keeps_the_connection(service, server):
+    import http.client, json
+    service.capacity = 1
+    connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+    connection.request('POST', '/lookup', json.dumps({"usernames": ['alice', 'bob'], "platforms": ['instagram']}))
+    response = connection.getresponse()
+    response.read()
+    assert response.status == 413 and response.getheader('Connection') != 'close'
+    # The same connection still answers
+    connection.request('GET', '/health')
+    assert connection.getresponse().status == 200
+    connection.close()